@@ -1,30 +1,110 @@
-"""Marketplace adapters for ring search automation."""
-
-from src.adapters.base import MarketplaceAdapter
-from src.adapters.craigslist import CraigslistAdapter
-from src.adapters.ebay import EbayAdapter
-from src.adapters.etsy import EtsyAdapter
-from src.adapters.mercari import MercariAdapter
-from src.adapters.pinkbike import PinkbikeAdapter
-from src.adapters.poshmark import PoshmarkAdapter
-from src.adapters.rubylane import RubyLaneAdapter
-from src.adapters.shopgoodwill import ShopGoodwillAdapter
-from src.adapters.trek_redbarn import TrekRedBarnAdapter
+"""Marketplace adapters for ring search automation.
 
-# Map adapter names to classes (used by LegacyAdapterBridge)
-ADAPTER_MAP: dict[str, type[MarketplaceAdapter]] = {
-    "shopgoodwill": ShopGoodwillAdapter,
-    "ebay": EbayAdapter,
-    "etsy": EtsyAdapter,
-    "craigslist": CraigslistAdapter,
-    "rubylane": RubyLaneAdapter,
-    "mercari": MercariAdapter,
-    "poshmark": PoshmarkAdapter,
-    "pinkbike": PinkbikeAdapter,
-    "trek_redbarn": TrekRedBarnAdapter,
+Adapter modules are imported on first use: ``ADAPTER_MAP["ebay"]`` or
+``from src.adapters import EbayAdapter`` loads only the eBay module. Each
+adapter class registers itself under its ``NAME`` when its module loads.
+Importing this package does not import Playwright.
+"""
+
+import importlib
+from typing import Any, Iterable, Iterator, Mapping
+
+from src.adapters.base import ADAPTER_REGISTRY, AdapterLimits, MarketplaceAdapter
+
+# Marketplace name -> "module:ClassName" (single source of truth for adapters)
+_REGISTRY: dict[str, str] = {
+    "shopgoodwill": "src.adapters.shopgoodwill:ShopGoodwillAdapter",
+    "ebay": "src.adapters.ebay:EbayAdapter",
+    "etsy": "src.adapters.etsy:EtsyAdapter",
+    "craigslist": "src.adapters.craigslist:CraigslistAdapter",
+    "rubylane": "src.adapters.rubylane:RubyLaneAdapter",
+    "mercari": "src.adapters.mercari:MercariAdapter",
+    "poshmark": "src.adapters.poshmark:PoshmarkAdapter",
+    "pinkbike": "src.adapters.pinkbike:PinkbikeAdapter",
+    "trek_redbarn": "src.adapters.trek_redbarn:TrekRedBarnAdapter",
 }
 
+# Class name -> marketplace name, for lazy attribute access
+_CLASS_NAMES: dict[str, str] = {path.partition(":")[2]: name for name, path in _REGISTRY.items()}
+
+
+def load_adapter(name: str) -> type[MarketplaceAdapter]:
+    """Import an adapter's module and return its class.
+
+    Args:
+        name: Marketplace name, e.g. "ebay".
+
+    Returns:
+        The registered adapter class.
+
+    Raises:
+        KeyError: If no adapter exists for the name.
+    """
+    if name not in ADAPTER_REGISTRY:
+        module_path = _REGISTRY[name].partition(":")[0]
+        importlib.import_module(module_path)
+    return ADAPTER_REGISTRY[name]
+
+
+class AdapterMap(Mapping[str, type[MarketplaceAdapter]]):
+    """Read-only name -> adapter class mapping that imports adapters on lookup."""
+
+    def __init__(self, names: Iterable[str] | None = None):
+        """Initialize with the marketplace names to expose.
+
+        Args:
+            names: Marketplace names to include. Defaults to all adapters.
+        """
+        self._names = tuple(names) if names is not None else tuple(_REGISTRY)
+        unknown = [name for name in self._names if name not in _REGISTRY]
+        if unknown:
+            raise ValueError(f"Unknown adapters: {', '.join(unknown)}")
+
+    def __getitem__(self, name: str) -> type[MarketplaceAdapter]:
+        if name not in self._names:
+            raise KeyError(name)
+        return load_adapter(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"AdapterMap({list(self._names)!r})"
+
+
+def select_adapters(*names: str) -> AdapterMap:
+    """Build a lazy adapter mapping restricted to the given marketplaces.
+
+    Args:
+        *names: Marketplace names to include.
+
+    Returns:
+        AdapterMap over the named adapters.
+    """
+    return AdapterMap(names)
+
+
+# Map adapter names to classes (used by LegacyAdapterBridge)
+ADAPTER_MAP = AdapterMap()
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve adapter class attributes (PEP 562)."""
+    if name in _CLASS_NAMES:
+        return load_adapter(_CLASS_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including adapter classes not yet imported."""
+    return sorted(set(globals()) | set(_CLASS_NAMES))
+
+
 __all__ = [
+    "AdapterLimits",
     "MarketplaceAdapter",
     "ShopGoodwillAdapter",
     "EbayAdapter",
@@ -36,4 +116,7 @@ __all__ = [
     "PinkbikeAdapter",
     "TrekRedBarnAdapter",
     "ADAPTER_MAP",
+    "AdapterMap",
+    "load_adapter",
+    "select_adapters",
 ]
@@ -1,13 +1,252 @@
 """Base marketplace adapter interface."""
 
+from __future__ import annotations
+
 import asyncio
+import json
+import logging
 import random
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Literal, Sequence
+from urllib.parse import quote_plus, urlsplit
+
+from src.merge import merge_jobs
+from src.models import Listing, ScoredListing
+from src.ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+    # Playwright is only needed once an adapter actually drives a page
+    from playwright.async_api import APIResponse, BrowserContext, ElementHandle, Page, Response, Route
+
+logger = logging.getLogger(__name__)
+
+# Navigation milestones page.goto can wait for
+WaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
+
+# A unit of search work: given a page of its own, yields listings.
+SearchJob = Callable[["Page"], AsyncIterator[Listing]]
+
+# Adapter classes by NAME, filled in as adapter modules are imported
+ADAPTER_REGISTRY: dict[str, type[MarketplaceAdapter]] = {}
+
+# Statuses meaning "slow down": back off the host's request rate
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Resource types search pages never need: only DOM text and src attributes are read
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+# Analytics and ad hosts whose scripts never affect listing markup (subdomains included)
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "scorecardresearch.com",
+    "criteo.com",
+)
+
+# Cap on pages the adapters of a run hold open at once (each costs tens of MB)
+MAX_OPEN_PAGES = 8
+
+# Attempts per search job, and the wait before the first retry (doubles each time)
+SEARCH_RETRIES = 3
+SEARCH_RETRY_DELAY = 0.5
+
+# Cap on memoized listing detail pages per adapter instance, and the default time one stays fresh (seconds)
+DETAIL_CACHE_SIZE = 256
+DETAIL_CACHE_TTL = 3600.0
+
+# Reads the common fields of every listing card in one call. Links come back
+# absolute with the query string and fragment (tracking params) dropped; image
+# URLs come back absolute.
+CARDS_SCRIPT = """
+(selectors) => Array.from(document.querySelectorAll(selectors.listing), card => {
+    const text = (selector) => {
+        const el = card.querySelector(selector);
+        return el ? (el.textContent || '').trim() : null;
+    };
+    const cleanUrl = (href) => {
+        try {
+            const url = new URL(href, location.href);
+            return url.origin + url.pathname;
+        } catch (e) {
+            return null;
+        }
+    };
+    const link = card.querySelector(selectors.link);
+    const image = card.querySelector(selectors.image);
+
+    return {
+        url: link && link.getAttribute('href') ? cleanUrl(link.href) : null,
+        title: text(selectors.title),
+        linkText: link ? (link.textContent || '').trim() : null,
+        price: text(selectors.price),
+        imageUrl: image && image.getAttribute('src') ? image.src : null,
+        imageAlt: image ? (image.getAttribute('alt') || '').trim() : null
+    };
+})
+"""
+
+# Reads a listing detail page in one call from the adapter's detail_* selectors
+DETAILS_SCRIPT = """
+(selectors) => {
+    const text = (selector) => {
+        const el = selector ? document.querySelector(selector) : null;
+        return el ? (el.textContent || '').trim() : null;
+    };
+    const image = document.querySelector(selectors.detail_image);
+
+    return {
+        title: text(selectors.detail_title),
+        price: text(selectors.detail_price),
+        description: text(selectors.detail_description),
+        specs: text(selectors.detail_specs),
+        imageUrl: image ? image.getAttribute('src') : null
+    };
+}
+"""
 
-from playwright.async_api import Page
+# Finds the next-page control in one call. Returns null when it is missing or
+# disabled, its URL when it is a real link, or true when it must be clicked.
+# Run bound to the adapter's selectors, so no selector is sent per call.
+NEXT_PAGE_SCRIPT = """
+(selectors) => {
+    const next = document.querySelector(selectors.next_page);
+    if (!next || next.hasAttribute('disabled') || next.getAttribute('aria-disabled') === 'true') return null;
+    if ((next.getAttribute('class') || '').toLowerCase().includes('disabled')) return null;
+    const href = next.getAttribute('href');
+    if (href && !href.startsWith('#') && !href.startsWith('javascript:')) return next.href;
+    return true;
+}
+"""
 
-from src.models import Listing
+# First dollar amount in a block of text, e.g. "$1,250" or "$ 45.00"
+PRICE_PATTERN = re.compile(r"\$\s?\d[\d,]*(?:\.\d{2})?")
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def quote_query(query: str) -> str:
+    """URL-encode a search query for a query string.
+
+    Memoized, since the same configured queries are encoded on every run.
+
+    Args:
+        query: Search query text.
+
+    Returns:
+        The query encoded with quote_plus.
+    """
+    return quote_plus(query)
+
+
+def normalize_price(text: str | None) -> str | None:
+    """Clean up scraped price text.
+
+    Collapses runs of whitespace (price elements often wrap currency and
+    amount across lines) and maps empty text to None.
+
+    Args:
+        text: Raw price text, or None.
+
+    Returns:
+        Single-spaced price text, or None if there was none.
+    """
+    if not text:
+        return None
+    return _WHITESPACE_PATTERN.sub(" ", text).strip() or None
+
+
+def _is_blocked_host(url: str) -> bool:
+    """Check whether a URL belongs to one of BLOCKED_HOSTS or its subdomains."""
+    host = urlsplit(url).hostname or ""
+    return any(host == blocked or host.endswith(f".{blocked}") for blocked in BLOCKED_HOSTS)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(retry_at.tzinfo)).total_seconds())
+
+
+def normalize_selector(selector: str) -> str:
+    """Normalize a comma-separated CSS selector list.
+
+    Splits on top-level commas (ignoring commas inside brackets, parentheses
+    or quotes), strips whitespace and drops duplicate alternatives.
+
+    Args:
+        selector: CSS selector list string.
+
+    Returns:
+        Normalized selector list joined with ", ".
+    """
+    parts: list[str] = []
+    current: list[str] = []
+    depth = 0
+    quote = ""
+    for char in selector:
+        if quote:
+            if char == quote:
+                quote = ""
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return ", ".join(dict.fromkeys(part for part in parts if part))
+
+
+class AdapterLimits:
+    """Open-page slots and per-host request budgets shared by the adapters of a run.
+
+    The orchestrator hands one to every adapter it builds, so a run stays
+    under MAX_OPEN_PAGES and each host gets one request budget however many
+    adapter instances reach it. The asyncio primitives are only created
+    again by ``reset()``, which is called for each new event loop.
+    """
+
+    def __init__(self, max_open_pages: int = MAX_OPEN_PAGES):
+        """Initialize with fresh slots and budgets.
+
+        Args:
+            max_open_pages: Pages the adapters may hold open at once.
+        """
+        self.max_open_pages = max_open_pages
+        self.reset()
+
+    def reset(self) -> None:
+        """Replace the page slots and drop every request budget."""
+        self.page_slots = asyncio.BoundedSemaphore(self.max_open_pages)
+        # Request budgets by (adapter NAME, host key)
+        self.limiters: dict[tuple[str, str], TokenBucket] = {}
 
 
 class MarketplaceAdapter(ABC):
@@ -18,29 +257,723 @@ class MarketplaceAdapter(ABC):
     NAME: str = ""
     SELECTORS: dict[str, str] = {}
 
+    # Path every listing URL contains (e.g. "/itm/"); other card links are ads
+    LISTING_PATH: str = ""
+
+    # How long fetched listing details stay fresh (seconds); shorter for fast-changing pages
+    DETAIL_CACHE_TTL: float = DETAIL_CACHE_TTL
+
+    # Requests a host bucket lets through back to back after an idle spell; the
+    # average rate stays one request per min_delay
+    RATE_LIMIT_BURST: int = 1
+
+    # Marketplace config keys passed through to __init__ as keyword arguments
+    CONFIG_OPTIONS: tuple[str, ...] = ()
+
+    # Normalized copy of SELECTORS, built once per subclass
+    _COMPILED_SELECTORS: dict[str, str] = {}
+
+    # SELECTORS as a JSON object literal, and scripts with it embedded (per subclass)
+    _SELECTORS_JSON: str = "{}"
+    _BOUND_SCRIPTS: dict[tuple[str, bool], str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register the subclass and normalize its selector lists once."""
+        super().__init_subclass__(**kwargs)
+        compiled = {key: normalize_selector(value) for key, value in cls.SELECTORS.items()}
+        cls.SELECTORS = cls._COMPILED_SELECTORS = compiled
+        cls._SELECTORS_JSON = json.dumps(compiled)
+        cls._BOUND_SCRIPTS = {}
+        if cls.NAME:
+            ADAPTER_REGISTRY[cls.NAME] = cls
+
     def __init__(
         self,
         min_delay: float = 2.0,
         max_delay: float = 5.0,
+        max_concurrency: int = 4,
+        limits: AdapterLimits | None = None,
     ):
         """Initialize adapter with rate limiting settings.
 
         Args:
             min_delay: Minimum delay between requests in seconds.
             max_delay: Maximum delay between requests in seconds.
+            max_concurrency: Maximum number of search jobs run in parallel tabs.
+            limits: Page slots and request budgets shared with the run's other
+                adapters. Defaults to a set of this adapter's own.
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
+        self.max_concurrency = max_concurrency
+        self.limits = limits or AdapterLimits()
+        # URL -> (monotonic time fetched, listing)
+        self._detail_cache: OrderedDict[str, tuple[float, Listing]] = OrderedDict()
+        # URL -> lock serializing its fetches, and how many calls hold or await it
+        self._detail_locks: dict[str, asyncio.Lock] = {}
+        self._detail_users: dict[str, int] = {}
+        self._block_types = set(BLOCKED_RESOURCE_TYPES)
+
+    @classmethod
+    def _bind_selectors(cls, script: str, takes_elements: bool = False) -> str:
+        """Embed the adapter's selectors in a script that takes them as an argument.
+
+        The selectors are then part of the script source instead of being
+        serialized again as an argument on every evaluate call.
+
+        Args:
+            script: JavaScript function taking ``(selectors)``, or
+                ``(elements, selectors)`` if ``takes_elements`` is set.
+            takes_elements: Whether the script maps the elements passed by
+                eval_on_selector_all() or evaluate_all().
+
+        Returns:
+            JavaScript function taking no arguments, or only the elements.
+        """
+        key = (script, takes_elements)
+        bound = cls._BOUND_SCRIPTS.get(key)
+        if bound is None:
+            params = "elements" if takes_elements else ""
+            args = f"elements, {cls._SELECTORS_JSON}" if takes_elements else cls._SELECTORS_JSON
+            bound = cls._BOUND_SCRIPTS[key] = f"({params}) => ({script.strip()})({args})"
+        return bound
+
+    @asynccontextmanager
+    async def open_page(self, context: BrowserContext) -> AsyncIterator[Page]:
+        """Open a page in a context, waiting while too many pages are open.
+
+        The page is closed on exit.
+
+        Args:
+            context: Browser context to open the page in.
+
+        Yields:
+            A new page from the context.
+        """
+        async with self.limits.page_slots, self._open_tab(context) as page:
+            yield page
+
+    @staticmethod
+    @asynccontextmanager
+    async def _open_tab(context: BrowserContext) -> AsyncIterator[Page]:
+        """Open a page in a context without taking an open-page slot.
+
+        For a tab that belongs to a job already holding a slot, such as the
+        single next-page prefetch tab of a paginating job. Waiting for a
+        second slot there can deadlock once every slot is held by a job.
+
+        Args:
+            context: Browser context to open the page in.
+
+        Yields:
+            A new page from the context.
+        """
+        page = await context.new_page()
+        try:
+            yield page
+        finally:
+            await page.close()
+
+    def _warmup_urls(self) -> list[str]:
+        """Get the origins a search will connect to first.
+
+        Returns:
+            URLs to request during warmup.
+        """
+        return [self.BASE_URL] if self.BASE_URL else []
+
+    async def warmup(self, context: BrowserContext) -> None:
+        """Prime DNS and connections to the marketplace before searching.
+
+        Sends a HEAD request to each origin through the context's request
+        API. Failures are ignored; the search reports real problems.
+
+        Args:
+            context: Browser context the search will run in.
+        """
+
+        async def head(url: str) -> None:
+            try:
+                await context.request.head(url, timeout=5000)
+            except Exception as e:
+                logger.debug("Warmup of %s failed: %s", url, e)
+
+        await asyncio.gather(*(head(url) for url in self._warmup_urls()))
+
+    @staticmethod
+    async def _first_text(parent: Page | ElementHandle, selector: str, limit: int | None = None) -> str | None:
+        """Get the stripped text of the first element matching a selector.
+
+        Args:
+            parent: Page or element to search within.
+            selector: CSS selector.
+            limit: Maximum length of the returned text.
+
+        Returns:
+            Stripped text content, or None if no element matches.
+        """
+        element = await parent.query_selector(selector)
+        if not element:
+            return None
+        text = (await element.text_content() or "").strip()
+        return text[:limit] if limit is not None else text
+
+    async def attach(self, page: Page) -> None:
+        """Block heavy resources on a page the adapter uses only for searching.
+
+        Images, fonts, stylesheets and media are aborted, as is anything from
+        a known analytics or ad host. Extraction reads image ``src``
+        attributes, not the image bytes, so detail pages can be attached too;
+        don't attach to pages used for screenshots, where images matter.
+
+        Args:
+            page: Playwright page owned by this adapter.
+        """
+
+        async def handle(route: Route) -> None:
+            request = route.request
+            if request.resource_type in self._block_types or _is_blocked_host(request.url):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await page.route("**/*", handle)
+
+    def _get_limiter(self, key: str = "") -> TokenBucket:
+        """Get the token bucket for a host key, creating it on first use.
+
+        Buckets live in the shared ``limits``, so separate instances of an
+        adapter (e.g. the orchestrator's and the extractor bridge's) share one
+        budget per host instead of each sending at the full rate. The bucket
+        starts at the creating instance's ``min_delay``, so instances sharing
+        ``limits`` should be built with the same rate settings.
+
+        Args:
+            key: Bucket key; adapters that span several hosts pass one per host.
+
+        Returns:
+            Token bucket shared by all tasks and adapter instances using this key.
+        """
+        limiter = self.limits.limiters.get((self.NAME, key))
+        if limiter is None:
+            # One request per min_delay while healthy, shared across concurrent tabs
+            limiter = TokenBucket(max_rate=1, time_period=self.min_delay, burst=self.RATE_LIMIT_BURST)
+            self.limits.limiters[(self.NAME, key)] = limiter
+        return limiter
+
+    async def _rate_limit(self, key: str = "") -> None:
+        """Wait for this adapter's request budget.
+
+        Args:
+            key: Bucket key; adapters that span several hosts pass one per host.
+        """
+        async with self._get_limiter(key):
+            pass
+
+    def _record_response(self, response: Response | APIResponse | None, key: str = "") -> None:
+        """Adapt the request rate for a host to its latest response.
+
+        Successful responses reset the delay to ``min_delay``. 429 and 503
+        responses double it (up to twice ``max_delay``) with jitter and honor
+        any Retry-After header.
+
+        Args:
+            response: Response from a navigation or HTTP fetch, if any.
+            key: Bucket key the request was made under.
+        """
+        if response is None:
+            return
+
+        limiter = self._get_limiter(key)
+        if response.status < 400:
+            limiter.set_period(self.min_delay)
+        elif response.status in THROTTLE_STATUSES:
+            delay = min(self.max_delay * 2, max(limiter.time_period, self.min_delay) * 2)
+            limiter.set_period(delay + random.uniform(0, delay * 0.1))
+            retry_after = _parse_retry_after(response.headers.get("retry-after"))
+            if retry_after:
+                limiter.pause(retry_after)
+            logger.warning(f"{self.NAME} throttled ({response.status}); delay now {limiter.time_period:.1f}s")
+
+    async def _navigate(
+        self, page: Page, url: str, key: str = "", wait_until: WaitUntil = "domcontentloaded"
+    ) -> Response | None:
+        """Wait for the host's request budget, navigate, then adapt the rate to the response.
+
+        Args:
+            page: Playwright page instance.
+            url: URL to open.
+            key: Rate limit bucket key.
+            wait_until: Navigation milestone to wait for. With "commit", follow
+                up with a selector wait for the content actually needed.
+
+        Returns:
+            The main resource response, if any.
+        """
+        await self._rate_limit(key)
+        response = await page.goto(url, wait_until=wait_until)
+        self._record_response(response, key)
+        return response
+
+    @staticmethod
+    async def _wait_attached(page: Page, selector: str, timeout: float = 10000) -> None:
+        """Wait until an element matching a selector is in the DOM.
+
+        Waits for the element to be attached rather than visible, so it
+        returns as soon as the markup arrives instead of waiting on layout.
+
+        Args:
+            page: Playwright page instance.
+            selector: CSS selector.
+            timeout: Maximum wait in milliseconds.
+
+        Raises:
+            TimeoutError: If no matching element appears in time.
+        """
+        await page.wait_for_selector(selector, state="attached", timeout=timeout)
+
+    async def _wait_for_results(self, page: Page, timeout: float = 10000) -> None:
+        """Wait until listings or the no-results marker are in the DOM.
 
-    async def _rate_limit(self) -> None:
-        """Apply rate limiting delay between requests."""
-        delay = random.uniform(self.min_delay, self.max_delay)
-        await asyncio.sleep(delay)
+        Args:
+            page: Playwright page on a search results page.
+            timeout: Maximum wait in milliseconds.
+        """
+        await self._wait_attached(page, f"{self.SELECTORS['listing']}, {self.SELECTORS['no_results']}", timeout)
+
+    async def _wait_for_details(self, page: Page, timeout: float = 10000) -> None:
+        """Wait until a listing page's title is in the DOM, or for the DOM itself.
+
+        A page whose title selector never matches still carries the price,
+        description and image DETAILS_SCRIPT reads, so a timeout falls back
+        to the loaded DOM rather than discarding them.
+
+        Args:
+            page: Playwright page on a listing page.
+            timeout: Maximum wait for the title in milliseconds.
+        """
+        # Deferred so importing the adapter registry does not load Playwright
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+        try:
+            await self._wait_attached(page, self.SELECTORS["detail_title"], timeout)
+        except PlaywrightTimeout:
+            logger.debug("No title on %s; reading the details present", page.url)
+            await page.wait_for_load_state("domcontentloaded")
+
+    async def fetch_listing_details(self, page: Page, url: str) -> Listing | None:
+        """Get listing details, reusing earlier results for the same URL.
+
+        Successful results are kept in a bounded LRU cache for
+        the adapter's ``DETAIL_CACHE_TTL`` seconds so duplicate URLs are not
+        scraped twice.
+        Concurrent calls for the same URL wait for a single fetch.
+
+        Args:
+            page: Playwright page instance.
+            url: URL of the listing to fetch.
+
+        Returns:
+            Listing with full details, or None if fetch failed.
+        """
+        cached = self._cached_details(url)
+        if cached is not None:
+            return cached
+
+        lock = self._detail_locks.setdefault(url, asyncio.Lock())
+        self._detail_users[url] = self._detail_users.get(url, 0) + 1
+        try:
+            async with lock:
+                # Another task may have fetched it while this one waited
+                cached = self._cached_details(url)
+                if cached is not None:
+                    return cached
+
+                listing = await self.get_listing_details(page, url)
+                if listing is not None:
+                    self._detail_cache[url] = (time.monotonic(), listing)
+                    if len(self._detail_cache) > DETAIL_CACHE_SIZE:
+                        self._detail_cache.popitem(last=False)
+                return listing
+        finally:
+            # Drop the lock only once no call holds or awaits it, so a later
+            # caller cannot start a second fetch beside a waiter that woke up
+            self._detail_users[url] -= 1
+            if not self._detail_users[url]:
+                del self._detail_users[url]
+                del self._detail_locks[url]
+
+    def _cached_details(self, url: str) -> Listing | None:
+        """Return fresh cached details for a URL, dropping an expired entry.
+
+        Args:
+            url: Listing URL.
+
+        Returns:
+            The cached Listing, or None if absent or older than DETAIL_CACHE_TTL.
+        """
+        entry = self._detail_cache.get(url)
+        if entry is None:
+            return None
+        fetched_at, listing = entry
+        if time.monotonic() - fetched_at > self.DETAIL_CACHE_TTL:
+            del self._detail_cache[url]
+            return None
+        self._detail_cache.move_to_end(url)
+        return listing
+
+    async def _fetch_html(self, page: Page, url: str, key: str = "") -> str | None:
+        """Fetch a page's raw HTML without rendering it.
+
+        Uses the browser context's HTTP client, which keeps connections alive
+        and shares cookies with the context's pages. The request waits for the
+        host's budget like a navigation does.
+
+        Args:
+            page: Playwright page whose context performs the request.
+            url: URL to fetch.
+            key: Rate limit bucket key.
+
+        Returns:
+            Response body, or None if the request failed.
+        """
+        await self._rate_limit(key)
+        try:
+            response = await page.context.request.get(url, timeout=30000)
+            self._record_response(response, key)
+            if not response.ok:
+                logger.debug("HTTP %s fetching %s", response.status, url)
+                return None
+            return await response.text()
+        except Exception as e:
+            logger.debug("HTTP fetch failed for %s: %s", url, e)
+            return None
+
+    async def _parse_html(self, page: Page, html: str, script: str, arg: Any) -> Any:
+        """Run an extraction script against fetched HTML without navigating.
+
+        The HTML is parsed with DOMParser inside the page, so no page scripts
+        run and no subresources load. The script is called as
+        ``script(arg, document)`` with the parsed document.
+
+        Args:
+            page: Playwright page used as the JS runtime.
+            html: HTML source to parse.
+            script: JavaScript function taking ``(arg, root)``.
+            arg: Serializable argument passed to the script.
+
+        Returns:
+            The script's return value.
+        """
+        return await page.evaluate(
+            f"([html, arg]) => ({script})(arg, new DOMParser().parseFromString(html, 'text/html'))",
+            [html, arg],
+        )
+
+    async def get_listing_details_batch(
+        self, context: BrowserContext, urls: list[str], concurrency: int = 10
+    ) -> list[Listing | None]:
+        """Get details for many listings concurrently.
+
+        Each distinct URL is fetched once, on its own page from ``context``,
+        with at most ``concurrency`` fetches in flight. These pages are only
+        read, never captured, so heavy resources are blocked on them as on
+        search pages. Results are memoized per URL as in fetch_listing_details().
+
+        Args:
+            context: Browser context to open detail pages in.
+            urls: Listing URLs to fetch.
+            concurrency: Maximum number of detail pages fetched at once.
+
+        Returns:
+            Listings in the same order as ``urls``; None where a fetch failed.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(url: str) -> Listing | None:
+            try:
+                async with semaphore, self.open_page(context) as page:
+                    await self.attach(page)
+                    return await self.fetch_listing_details(page, url)
+            except Exception as e:
+                logger.error(f"Error fetching {self.NAME} listing details for {url}: {e}")
+                return None
+
+        # Repeated URLs would otherwise race past the cache and load twice
+        unique = list(dict.fromkeys(urls))
+        fetched = dict(zip(unique, await asyncio.gather(*(fetch_one(url) for url in unique))))
+        return [fetched[url] for url in urls]
+
+    async def _evaluate_listings(self, page: Page, script: str) -> list[dict[str, Any]]:
+        """Run a listing extraction script with the adapter's selectors bound.
+
+        Args:
+            page: Playwright page instance.
+            script: JavaScript function taking the selectors dict.
+
+        Returns:
+            List of raw listing dicts returned by the script.
+        """
+        results: list[dict[str, Any]] = await page.evaluate(self._bind_selectors(script))
+        return results
+
+    def _card_listing(self, card: dict[str, Any]) -> Listing | None:
+        """Build a listing from one card read by CARDS_SCRIPT.
+
+        Override to filter or patch cards for a marketplace.
+
+        Args:
+            card: Raw card dict with url, title, linkText, price, imageUrl and imageAlt.
+
+        Returns:
+            Listing, or None to skip the card.
+        """
+        url = card.get("url")
+        if not url or self.LISTING_PATH not in url:
+            return None
+
+        return Listing(
+            url=url,
+            source=self.NAME,
+            title=card.get("title") or "",
+            price=normalize_price(card.get("price")),
+            description=None,
+            image_url=card.get("imageUrl"),
+        )
+
+    async def _extract_cards(self, page: Page) -> list[Listing]:
+        """Extract listings from the current results page with CARDS_SCRIPT.
+
+        Shared by adapters whose cards expose the common listing, link, title,
+        price and image selectors.
+
+        Args:
+            page: Playwright page on a search results page.
+
+        Returns:
+            Listing objects for each card kept by ``_card_listing``.
+        """
+        # Deferred so importing the adapter registry does not load Playwright
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+        try:
+            await self._wait_attached(page, self.SELECTORS["listing"])
+        except PlaywrightTimeout:
+            logger.warning("No listings found on page")
+            return []
+
+        cards = await self._evaluate_listings(page, CARDS_SCRIPT)
+        return [listing for listing in map(self._card_listing, cards) if listing is not None]
+
+    async def _next_page(self, page: Page, key: str = "") -> bool:
+        """Advance to the next page of results if there is one.
+
+        Locates the next-page control and checks whether it is disabled in a
+        single evaluate call, then follows its link or clicks it. The request
+        budget is spent here, so callers need no separate rate limit.
+
+        Args:
+            page: Playwright page instance on a results page.
+            key: Rate limit bucket key.
+
+        Returns:
+            True if the page moved to the next results page.
+        """
+        target = await page.evaluate(self._bind_selectors(NEXT_PAGE_SCRIPT))
+        if not target:
+            return False
+
+        if isinstance(target, str):
+            await self._navigate(page, target, key)
+        else:
+            await self._rate_limit(key)
+            await self._click_next(page)
+        return True
+
+    async def _click_next(self, page: Page) -> None:
+        """Click the next-page control and wait for the new page to load."""
+        await page.click(self.SELECTORS["next_page"])
+        await page.wait_for_load_state("domcontentloaded")
+
+    async def _paginate(
+        self,
+        page: Page,
+        read: Callable[[Page], Awaitable[list[Listing]]],
+        max_pages: int,
+        key: str = "",
+    ) -> AsyncIterator[Listing]:
+        """Yield listings across result pages, loading each next page early.
+
+        When the next-page control is a link, the next page loads and is read
+        in a second tab while the current page's listings are being consumed.
+        A control that can only be clicked is followed after consumption.
+
+        Args:
+            page: Playwright page already on the first results page.
+            read: Reads all listings from a loaded results page.
+            max_pages: Maximum number of result pages to read.
+            key: Rate limit bucket key.
+
+        Yields:
+            Listing objects from each page in order.
+        """
+        next_page_script = self._bind_selectors(NEXT_PAGE_SCRIPT)
+        current = page
+        current_tab: AsyncExitStack | None = None
+        prefetch: asyncio.Task[tuple[list[Listing], Page, AsyncExitStack]] | None = None
+
+        try:
+            listings = await read(page)
+            for _ in range(max_pages - 1):
+                target = await current.evaluate(next_page_script)
+                if not target:
+                    break
+
+                if isinstance(target, str):
+                    prefetch = asyncio.create_task(self._read_in_tab(page.context, target, read, key))
+                    for listing in listings:
+                        yield listing
+                    listings, next_page, next_tab = await prefetch
+                    prefetch = None
+                    if current_tab is not None:
+                        await current_tab.aclose()
+                    current, current_tab = next_page, next_tab
+                else:
+                    for listing in listings:
+                        yield listing
+                    await self._rate_limit(key)
+                    await self._click_next(current)
+                    listings = await read(current)
+
+            for listing in listings:
+                yield listing
+
+        finally:
+            if prefetch is not None:
+                prefetch.cancel()
+                try:
+                    _, _, tab = await prefetch
+                    await tab.aclose()
+                except (asyncio.CancelledError, Exception):
+                    pass
+            if current_tab is not None:
+                await current_tab.aclose()
+
+    async def _read_in_tab(
+        self,
+        context: BrowserContext,
+        url: str,
+        read: Callable[[Page], Awaitable[list[Listing]]],
+        key: str,
+    ) -> tuple[list[Listing], Page, AsyncExitStack]:
+        """Load a results page in a new tab and read its listings.
+
+        Args:
+            context: Browser context to open the tab in.
+            url: Results page URL.
+            read: Reads all listings from a loaded results page.
+            key: Rate limit bucket key.
+
+        Returns:
+            The listings, the tab, and the exit stack that closes the tab.
+        """
+        stack = AsyncExitStack()
+        try:
+            # The job already holds an open-page slot; its one prefetch tab rides on it
+            tab = await stack.enter_async_context(self._open_tab(context))
+            await self.attach(tab)
+            await self._navigate(tab, url, key)
+            return await read(tab), tab, stack
+        except BaseException:
+            await stack.aclose()
+            raise
+
+    async def _retry_search(
+        self,
+        page: Page,
+        job: SearchJob,
+        retry_on: type[Exception] | tuple[type[Exception], ...],
+    ) -> AsyncIterator[Listing]:
+        """Run a search job, restarting it after transient failures.
+
+        A job is only restarted while it has yielded nothing, so a failure
+        after partial results keeps them rather than scraping pages again.
+        Attempts are spaced by exponential backoff; the final failure is raised.
+
+        Args:
+            page: Playwright page to run the job on.
+            job: Search job to run.
+            retry_on: Exception types worth retrying, e.g. Playwright timeouts.
+
+        Yields:
+            Listing objects from the job.
+        """
+        for attempt in range(SEARCH_RETRIES):
+            yielded = False
+            try:
+                async for listing in job(page):
+                    yielded = True
+                    yield listing
+                return
+            except retry_on as e:
+                if yielded or attempt == SEARCH_RETRIES - 1:
+                    raise
+                delay = SEARCH_RETRY_DELAY * 2**attempt
+                logger.warning(
+                    "%s search failed (attempt %d/%d), retrying in %.1fs: %s",
+                    self.NAME,
+                    attempt + 1,
+                    SEARCH_RETRIES,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
+
+    def _merge_searches(self, page: Page, jobs: Sequence[SearchJob]) -> AsyncIterator[Listing]:
+        """Run search jobs concurrently and yield listings as they arrive.
+
+        Each job gets its own tab from the page's browser context, with heavy
+        resources blocked and at most ``max_concurrency`` jobs running at once.
+        A single job runs directly on ``page`` so no extra tab is opened.
+
+        Args:
+            page: Playwright page instance whose context hosts the job tabs.
+            jobs: Search jobs to run.
+
+        Returns:
+            Listings from all jobs, in completion order, each URL once.
+        """
+        if len(jobs) == 1:
+            job = jobs[0]
+            bound = [lambda: job(page)]
+        else:
+            bound = [partial(self._run_in_tab, page, job) for job in jobs]
+        # Queries and result pages overlap; yield each listing URL only once
+        return merge_jobs(bound, self.max_concurrency, key=attrgetter("url"), label=f"{self.NAME} search job")
+
+    async def _run_in_tab(self, page: Page, job: SearchJob) -> AsyncIterator[Listing]:
+        """Run a search job in a tab of its own.
+
+        Args:
+            page: Playwright page instance whose context hosts the tab.
+            job: Search job to run.
+
+        Yields:
+            Listings from the job.
+        """
+        async with self.open_page(page.context) as job_page:
+            await self.attach(job_page)
+            async for listing in job(job_page):
+                yield listing
 
     @abstractmethod
     def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
         """Search marketplace and yield listings.
 
+        Adapters that only fan queries out to jobs can return
+        ``self._merge_searches(page, jobs)`` directly rather than re-yielding
+        each listing through another async generator.
+
         Args:
             page: Playwright page instance.
             queries: List of search query strings.
@@ -63,6 +996,22 @@ class MarketplaceAdapter(ABC):
         """
         pass
 
+    @classmethod
+    def needs_detail(cls, scored: ScoredListing) -> bool:
+        """Decide whether a listing scored from search data needs a detail fetch.
+
+        Search cards and discovery snippets already carry the title, price
+        and often a description. When that alone scores high confidence,
+        a detail page adds nothing the result depends on.
+
+        Args:
+            scored: Listing scored from search-page data only.
+
+        Returns:
+            True if the detail page should be fetched before scoring again.
+        """
+        return scored.confidence != "high"
+
     def _extract_text(self, element: str | None, default: str = "") -> str:
         """Safely extract text from element.
 
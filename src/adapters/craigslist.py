@@ -1,17 +1,64 @@
 """Craigslist marketplace adapter with multi-region support."""
 
+import functools
+import html
 import logging
-from typing import AsyncIterator
-from urllib.parse import quote_plus
+from typing import Any, AsyncIterator, Iterator
+from urllib.parse import urljoin
+from xml.etree import ElementTree
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.base import MarketplaceAdapter
+from src.adapters.base import PRICE_PATTERN, AdapterLimits, MarketplaceAdapter, normalize_price, quote_query
 from src.models import Listing
 
 logger = logging.getLogger(__name__)
 
+# Craigslist feeds are RSS 1.0 (RDF); items carry their URL in rdf:about
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from an element or attribute name."""
+    return tag.rsplit("}", 1)[-1]
+
+
+# Extracts listing cards in one call. Takes the selectors dict and an optional
+# root document, so it runs on the live page or on fetched HTML.
+LISTINGS_SCRIPT = """
+(selectors, root = document) => {
+    const results = [];
+    const listings = root.querySelectorAll(selectors.listing);
+
+    listings.forEach(element => {
+        try {
+            const linkElement = element.querySelector(selectors.link);
+            if (!linkElement) return;
+
+            const href = linkElement.getAttribute('href');
+            if (!href) return;
+
+            const titleElement = element.querySelector(selectors.title);
+            const title = (titleElement && titleElement.textContent.trim()) || linkElement.textContent.trim();
+            const priceElement = element.querySelector(selectors.price);
+            const imageElement = element.querySelector(selectors.image);
+
+            results.push({
+                href: href,
+                title: title,
+                price: priceElement ? priceElement.textContent.trim() : null,
+                imageUrl: imageElement ? imageElement.getAttribute('src') : null
+            });
+        } catch (e) {
+            // Skip problematic elements
+        }
+    });
+
+    return results;
+}
+"""
+
 
 class CraigslistAdapter(MarketplaceAdapter):
     """Adapter for searching Craigslist with multi-region support."""
@@ -19,6 +66,12 @@ class CraigslistAdapter(MarketplaceAdapter):
     BASE_URL = "https://{region}.craigslist.org"
     NAME = "craigslist"
 
+    # Jewelry category search, appended to a region's base URL; format with the quoted query
+    SEARCH_PATH = "/search/jwa?query={query}"
+
+    # Marketplace config keys accepted by __init__
+    CONFIG_OPTIONS = ("regions", "use_http")
+
     # Region codes within approximately 300 miles of Indianapolis (some slightly beyond)
     DEFAULT_REGIONS = [
         # Indiana
@@ -53,10 +106,10 @@ class CraigslistAdapter(MarketplaceAdapter):
     ]
 
     SELECTORS = {
-        "listing": ".result-row, .cl-search-result, [data-pid]",
-        "title": ".result-title, .posting-title, a.cl-app-anchor",
-        "price": ".result-price, .priceinfo",
-        "link": "a.result-title, a.posting-title, a.cl-app-anchor",
+        "listing": ".result-row, .cl-search-result, .cl-static-search-result, [data-pid]",
+        "title": ".result-title, .posting-title, a.cl-app-anchor, .cl-static-search-result .title",
+        "price": ".result-price, .priceinfo, .cl-static-search-result .price",
+        "link": "a.result-title, a.posting-title, a.cl-app-anchor, .cl-static-search-result a",
         "image": ".result-image img, .swipe img",
         "next_page": ".next, [aria-label='next page']",
         "no_results": ".noresults, .no-results",
@@ -67,6 +120,9 @@ class CraigslistAdapter(MarketplaceAdapter):
         regions: list[str] | None = None,
         min_delay: float = 2.0,
         max_delay: float = 5.0,
+        max_concurrency: int = 4,
+        use_http: bool = True,
+        limits: AdapterLimits | None = None,
     ):
         """Initialize adapter with region configuration.
 
@@ -74,153 +130,238 @@ class CraigslistAdapter(MarketplaceAdapter):
             regions: List of Craigslist region codes to search.
             min_delay: Minimum delay between requests in seconds.
             max_delay: Maximum delay between requests in seconds.
+            max_concurrency: Maximum number of region searches run in parallel tabs.
+            use_http: Try plain HTTP fetches of search pages before rendering them.
+            limits: Page slots and request budgets shared with the run's other adapters.
         """
-        super().__init__(min_delay=min_delay, max_delay=max_delay)
+        super().__init__(min_delay=min_delay, max_delay=max_delay, max_concurrency=max_concurrency, limits=limits)
         self.regions = regions or self.DEFAULT_REGIONS
+        self._region_bases = {region: self.BASE_URL.format(region=region) for region in self.regions}
+        self.use_http = use_http
 
     def _get_region_url(self, region: str) -> str:
         """Get base URL for a specific region."""
-        return self.BASE_URL.format(region=region)
+        base = self._region_bases.get(region)
+        if base is None:
+            base = self._region_bases[region] = self.BASE_URL.format(region=region)
+        return base
+
+    def _warmup_urls(self) -> list[str]:
+        """Get the base URL of every configured region."""
+        return list(self._region_bases.values())
 
-    async def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
+    def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
         """Search Craigslist across configured regions.
 
+        Each region/query pair runs as its own job, up to ``max_concurrency``
+        at a time in separate tabs.
+
         Args:
             page: Playwright page instance.
             queries: List of search query strings.
 
-        Yields:
-            Listing objects for each result found.
+        Returns:
+            Async iterator of Listing objects for each result found.
         """
-        for region in self.regions:
-            base_url = self._get_region_url(region)
+        jobs = [
+            functools.partial(self._search_region, region=region, query=query)
+            for region in self.regions
+            for query in queries
+        ]
+        return self._merge_searches(page, jobs)
 
-            for query in queries:
-                logger.info(f"Searching Craigslist {region} for: {query}")
+    async def _search_region(self, page: Page, region: str, query: str) -> AsyncIterator[Listing]:
+        """Search a single Craigslist region for one query.
 
-                try:
-                    # Navigate to search results - jewelry category
-                    search_url = (
-                        f"{base_url}/search/jwa"  # Jewelry category
-                        f"?query={quote_plus(query)}"
-                    )
-                    await page.goto(search_url, wait_until="domcontentloaded")
-                    await self._rate_limit()
+        Args:
+            page: Playwright page instance dedicated to this job.
+            region: Craigslist region code.
+            query: Search query string.
 
-                    # Check for no results
-                    no_results = await page.query_selector(self.SELECTORS["no_results"])
-                    if no_results:
-                        logger.info(f"No results in {region} for: {query}")
-                        continue
+        Yields:
+            Listing objects for each result found.
+        """
+        base_url = self._get_region_url(region)
+        logger.info("Searching Craigslist %s for: %s", region, query)
 
-                    # Process current page
-                    async for listing in self._extract_listings(page, region):
+        try:
+            # Navigate to search results - jewelry category
+            search_url = base_url + self.SEARCH_PATH.format(query=quote_query(query))
+
+            # Fast paths: RSS feed, then static HTML, both without rendering
+            if self.use_http:
+                feed_listings = await self._extract_listings_rss(page, f"{search_url}&format=rss", region)
+                if feed_listings:
+                    for listing in feed_listings:
                         yield listing
+                    return
 
-                    # Handle pagination (up to 2 pages per region/query)
-                    for page_num in range(2, 3):
-                        if not await self._has_next_page(page):
-                            break
+                listings = await self._extract_listings_http(page, search_url, region)
+                if listings is not None:
+                    if not listings:
+                        logger.info("No results in %s for: %s", region, query)
+                    for listing in listings:
+                        yield listing
+                    return
 
-                        await self._go_to_next_page(page)
-                        await self._rate_limit()
+            await self._navigate(page, search_url, region)
 
-                        async for listing in self._extract_listings(page, region):
-                            yield listing
+            # Check for no results
+            no_results = await page.query_selector(self.SELECTORS["no_results"])
+            if no_results:
+                logger.info("No results in %s for: %s", region, query)
+                return
 
-                except PlaywrightTimeout:
-                    logger.warning(f"Timeout searching Craigslist {region} for: {query}")
-                except Exception as e:
-                    logger.error(f"Error searching Craigslist {region}: {e}")
+            # Up to 2 pages per region/query; page 2 loads while page 1 is consumed
+            read = functools.partial(self._extract_listings, region=region)
+            async for listing in self._paginate(page, read, max_pages=2, key=region):
+                yield listing
 
-    async def _extract_listings(self, page: Page, region: str) -> AsyncIterator[Listing]:
-        """Extract listings from current page.
+        except PlaywrightTimeout:
+            logger.warning("Timeout searching Craigslist %s for: %s", region, query)
+        except Exception as e:
+            logger.error("Error searching Craigslist %s: %s", region, e)
+
+    async def _extract_listings(self, page: Page, region: str) -> list[Listing]:
+        """Extract listings from the current results page.
+
+        Uses page.evaluate() to extract all listing data in a single JS call
+        instead of one round-trip per field per listing.
 
         Args:
             page: Playwright page instance.
             region: Current region being searched.
 
-        Yields:
+        Returns:
             Listing objects for each item on the page.
         """
         try:
-            await page.wait_for_selector(self.SELECTORS["listing"], timeout=10000)
+            await self._wait_attached(page, self.SELECTORS["listing"])
         except PlaywrightTimeout:
-            logger.warning(f"No listings found in {region}")
-            return
+            logger.warning("No listings found in %s", region)
+            return []
 
-        listing_elements = await page.query_selector_all(self.SELECTORS["listing"])
+        # Extract all listings in a single JavaScript call
+        listings_data = await self._evaluate_listings(page, LISTINGS_SCRIPT)
+        return list(self._build_listings(listings_data, region))
 
-        for element in listing_elements:
-            try:
-                # Extract link
-                link_element = await element.query_selector(self.SELECTORS["link"])
-                if not link_element:
-                    continue
-
-                href = await link_element.get_attribute("href")
-                if not href:
-                    continue
-
-                url = href
-                if not url.startswith("http"):
-                    url = f"{self._get_region_url(region)}{href}"
-
-                # Extract title
-                title = ""
-                if link_element:
-                    title = await link_element.text_content() or ""
-                    title = title.strip()
-
-                # Extract price
-                price_element = await element.query_selector(self.SELECTORS["price"])
-                price = None
-                if price_element:
-                    price = await price_element.text_content()
-                    if price:
-                        price = price.strip()
-
-                # Extract image URL
-                image_element = await element.query_selector(self.SELECTORS["image"])
-                image_url = None
-                if image_element:
-                    image_url = await image_element.get_attribute("src")
+    async def _extract_listings_rss(self, page: Page, url: str, region: str) -> list[Listing]:
+        """Extract listings from a search's RSS feed.
 
-                yield Listing(
-                    url=url,
+        Args:
+            page: Playwright page whose context performs the request.
+            url: Search results feed URL.
+            region: Current region being searched.
+
+        Returns:
+            Listings in the feed; empty if the feed is unavailable or empty.
+        """
+        xml_text = await self._fetch_html(page, url, region)
+        if not xml_text:
+            return []
+
+        try:
+            root = ElementTree.fromstring(xml_text)
+        except ElementTree.ParseError as e:
+            logger.debug("Unparseable Craigslist feed for %s: %s", region, e)
+            return []
+
+        listings = []
+        for item in root.iter():
+            if _local_name(item.tag) != "item":
+                continue
+
+            fields: dict[str, str] = {}
+            image_url = None
+            for child in item:
+                name = _local_name(child.tag)
+                if name == "enclosure":
+                    # RSS 2.0 uses url=, Craigslist's enc: namespace uses resource=
+                    image_url = image_url or next(
+                        (value for key, value in child.attrib.items() if _local_name(key) in ("url", "resource")),
+                        None,
+                    )
+                elif child.text:
+                    fields.setdefault(name, child.text.strip())
+
+            link = fields.get("link") or item.get(f"{{{RDF_NS}}}about")
+            if not link:
+                continue
+
+            title = html.unescape(fields.get("title", ""))
+            description = html.unescape(fields.get("description", "")) or None
+            price_match = PRICE_PATTERN.search(title) or PRICE_PATTERN.search(description or "")
+
+            listings.append(
+                Listing(
+                    url=link,
                     source=f"{self.NAME}_{region}",
                     title=title,
-                    price=price,
-                    description=None,
+                    price=price_match.group(0) if price_match else None,
+                    description=description[:500] if description else None,
                     image_url=image_url,
                 )
+            )
 
-            except Exception as e:
-                logger.warning(f"Error extracting listing: {e}")
+        return listings
+
+    async def _extract_listings_http(self, page: Page, url: str, region: str) -> list[Listing] | None:
+        """Extract listings from a search URL's static HTML.
+
+        Fetches the HTML over HTTP and parses it in-page without rendering.
+
+        Args:
+            page: Playwright page used for the request and as the JS runtime.
+            url: Search results URL.
+            region: Current region being searched.
+
+        Returns:
+            Listings found, an empty list if the page reports no results, or
+            None if the page needs full browser rendering.
+        """
+        source = await self._fetch_html(page, url, region)
+        if not source:
+            return None
 
-    async def _has_next_page(self, page: Page) -> bool:
-        """Check if there's a next page of results."""
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if not next_button:
-            return False
+        listings_data = await self._parse_html(page, source, LISTINGS_SCRIPT, self.SELECTORS)
+        if listings_data:
+            return list(self._build_listings(listings_data, region))
 
-        # Check if button has disabled class
-        class_attr = await next_button.get_attribute("class") or ""
-        return "disabled" not in class_attr.lower()
+        no_results = await self._parse_html(
+            page, source, "(selectors, root) => !!root.querySelector(selectors.no_results)", self.SELECTORS
+        )
+        return [] if no_results else None
 
-    async def _go_to_next_page(self, page: Page) -> None:
-        """Navigate to the next page of results."""
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if next_button:
-            await next_button.click()
-            await page.wait_for_load_state("domcontentloaded")
+    def _build_listings(self, listings_data: list[dict[str, Any]], region: str) -> Iterator[Listing]:
+        """Build Listing objects from raw extraction results.
+
+        Args:
+            listings_data: Dicts returned by LISTINGS_SCRIPT.
+            region: Current region being searched.
+
+        Yields:
+            Listing objects for each valid result.
+        """
+        for data in listings_data:
+            try:
+                href = data.get("href", "")
+                url = urljoin(self._get_region_url(region), href)
+
+                yield Listing(
+                    url=url,
+                    source=f"{self.NAME}_{region}",
+                    title=data.get("title", ""),
+                    price=normalize_price(data.get("price")),
+                    description=None,
+                    image_url=data.get("imageUrl"),
+                )
+
+            except Exception as e:
+                logger.warning("Error extracting listing: %s", e)
 
     async def get_listing_details(self, page: Page, url: str) -> Listing | None:
         """Get detailed information for a specific listing."""
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            await self._rate_limit()
-
             # Determine region from URL
             region = "unknown"
             for r in self.regions:
@@ -228,44 +369,36 @@ class CraigslistAdapter(MarketplaceAdapter):
                     region = r
                     break
 
-            # Extract title
-            title_element = await page.query_selector("#titletextonly, .postingtitletext")
-            title = ""
-            if title_element:
-                title = await title_element.text_content() or ""
-                title = title.strip()
-
-            # Extract price
-            price_element = await page.query_selector(".price, .postinginfo")
-            price = None
-            if price_element:
-                price = await price_element.text_content()
-                if price:
-                    price = price.strip()
-
-            # Extract description
-            desc_element = await page.query_selector("#postingbody")
-            description = None
-            if desc_element:
-                description = await desc_element.text_content()
-                if description:
-                    description = description.strip()[:500]
-
-            # Extract image
-            image_element = await page.query_selector(".gallery img, .swipe img")
-            image_url = None
-            if image_element:
-                image_url = await image_element.get_attribute("src")
+            await self._navigate(page, url, region)
+
+            # Extract all details in a single JavaScript call
+            details = await page.evaluate(
+                """
+                () => {
+                    const titleEl = document.querySelector('#titletextonly, .postingtitletext');
+                    const priceEl = document.querySelector('.price, .postinginfo');
+                    const descEl = document.querySelector('#postingbody');
+                    const imageEl = document.querySelector('.gallery img, .swipe img');
+
+                    return {
+                        title: titleEl ? titleEl.textContent.trim() : '',
+                        price: priceEl ? priceEl.textContent.trim() : null,
+                        description: descEl ? descEl.textContent.trim().substring(0, 500) : null,
+                        imageUrl: imageEl ? imageEl.getAttribute('src') : null
+                    };
+                }
+                """
+            )
 
             return Listing(
                 url=url,
                 source=f"{self.NAME}_{region}",
-                title=title,
-                price=price,
-                description=description,
-                image_url=image_url,
+                title=details.get("title", ""),
+                price=normalize_price(details.get("price")),
+                description=details.get("description") or None,
+                image_url=details.get("imageUrl"),
             )
 
         except Exception as e:
-            logger.error(f"Error fetching Craigslist listing details: {e}")
+            logger.error("Error fetching Craigslist listing details: %s", e)
             return None
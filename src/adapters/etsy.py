@@ -1,13 +1,13 @@
 """Etsy marketplace adapter."""
 
+import functools
 import logging
-from typing import AsyncIterator
-from urllib.parse import quote_plus, urljoin
+from typing import Any, AsyncIterator
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.base import MarketplaceAdapter
+from src.adapters.base import DETAILS_SCRIPT, MarketplaceAdapter, normalize_price, quote_query
 from src.models import Listing
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,10 @@ class EtsyAdapter(MarketplaceAdapter):
 
     BASE_URL = "https://www.etsy.com"
     NAME = "etsy"
+    LISTING_PATH = "/listing/"
+
+    # Search results page; format with the quoted query
+    SEARCH_URL = f"{BASE_URL}/search?q={{query}}"
 
     SELECTORS = {
         "listing": ".v2-listing-card, [data-listing-card]",
@@ -27,183 +31,108 @@ class EtsyAdapter(MarketplaceAdapter):
         "image": ".v2-listing-card__img img, [data-listing-card] img",
         "next_page": "[aria-label='Next page'], .pagination-link-next",
         "no_results": ".wt-alert, .no-results",
+        # Detail page selectors
+        "detail_title": "h1, [data-listing-title]",
+        "detail_price": ".wt-text-title-03, [data-buy-box-region] .currency-value",
+        "detail_description": "[data-product-details-description-text-content], .wt-content-toggle__body",
+        "detail_image": "[data-listing-page-image] img, .listing-page-image-container img",
     }
 
-    async def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
+    def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
         """Search Etsy and yield listings.
 
+        Each query runs as its own job, up to ``max_concurrency`` at a time in
+        separate tabs.
+
         Args:
             page: Playwright page instance.
             queries: List of search query strings.
 
+        Returns:
+            Async iterator of Listing objects for each result found.
+        """
+        jobs = [functools.partial(self._search_query, query=query) for query in queries]
+        return self._merge_searches(page, jobs)
+
+    async def _search_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Search Etsy for one query, retrying timeouts that occur before any results.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
         Yields:
             Listing objects for each result found.
         """
-        for query in queries:
-            logger.info(f"Searching Etsy for: {query}")
-
-            try:
-                # Navigate to search results
-                search_url = f"{self.BASE_URL}/search?q={quote_plus(query)}"
-                await page.goto(search_url, wait_until="domcontentloaded")
-                await self._rate_limit()
-
-                # Check for no results
-                no_results = await page.query_selector(self.SELECTORS["no_results"])
-                if no_results:
-                    no_results_text = await no_results.text_content() or ""
-                    if "no results" in no_results_text.lower():
-                        logger.info(f"No results for query: {query}")
-                        continue
-
-                # Process current page
-                async for listing in self._extract_listings(page):
-                    yield listing
-
-                # Handle pagination (up to 3 pages per query)
-                for page_num in range(2, 4):
-                    if not await self._has_next_page(page):
-                        break
-
-                    await self._go_to_next_page(page)
-                    await self._rate_limit()
-
-                    async for listing in self._extract_listings(page):
-                        yield listing
-
-            except PlaywrightTimeout:
-                logger.warning(f"Timeout searching Etsy for: {query}")
-            except Exception as e:
-                logger.error(f"Error searching Etsy: {e}")
-
-    async def _extract_listings(self, page: Page) -> AsyncIterator[Listing]:
-        """Extract listings from current page."""
+        logger.info("Searching Etsy for: %s", query)
+
         try:
-            await page.wait_for_selector(self.SELECTORS["listing"], timeout=10000)
+            job = functools.partial(self._run_query, query=query)
+            async for listing in self._retry_search(page, job, PlaywrightTimeout):
+                yield listing
+
         except PlaywrightTimeout:
-            logger.warning("No listings found on page")
-            return
-
-        listing_elements = await page.query_selector_all(self.SELECTORS["listing"])
-
-        for element in listing_elements:
-            try:
-                # Extract link
-                link_element = await element.query_selector(self.SELECTORS["link"])
-                if not link_element:
-                    continue
-
-                href = await link_element.get_attribute("href")
-                if not href or "/listing/" not in href:
-                    continue
-
-                # Clean URL - remove tracking params
-                url = href.split("?")[0]
-                if not url.startswith("http"):
-                    url = urljoin(self.BASE_URL, url)
-
-                # Extract title
-                title_element = await element.query_selector(self.SELECTORS["title"])
-                title = ""
-                if title_element:
-                    title = await title_element.text_content() or ""
-                    title = title.strip()
-
-                if not title:
-                    # Fallback: try alt text from image
-                    img_element = await element.query_selector(self.SELECTORS["image"])
-                    if img_element:
-                        title = await img_element.get_attribute("alt") or ""
-                        title = title.strip()
-
-                # Extract price
-                price_element = await element.query_selector(self.SELECTORS["price"])
-                price = None
-                if price_element:
-                    price = await price_element.text_content()
-                    if price:
-                        price = price.strip()
-
-                # Extract image URL
-                image_element = await element.query_selector(self.SELECTORS["image"])
-                image_url = None
-                if image_element:
-                    image_url = await image_element.get_attribute("src")
-
-                yield Listing(
-                    url=url,
-                    source=self.NAME,
-                    title=title,
-                    price=price,
-                    description=None,
-                    image_url=image_url,
-                )
-
-            except Exception as e:
-                logger.warning(f"Error extracting listing: {e}")
-
-    async def _has_next_page(self, page: Page) -> bool:
-        """Check if there's a next page of results."""
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if not next_button:
-            return False
-
-        is_disabled = await next_button.get_attribute("disabled")
-        return is_disabled is None
-
-    async def _go_to_next_page(self, page: Page) -> None:
-        """Navigate to the next page of results."""
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if next_button:
-            await next_button.click()
-            await page.wait_for_load_state("domcontentloaded")
+            logger.warning("Timeout searching Etsy for: %s", query)
+        except Exception as e:
+            logger.error(f"Error searching Etsy: {e}")
+
+    async def _run_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Load and read the results for one query, following pagination.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
+        Yields:
+            Listing objects for each result found.
+        """
+        # Navigate to search results
+        search_url = self.SEARCH_URL.format(query=quote_query(query))
+        await self._navigate(page, search_url, wait_until="commit")
+        await self._wait_for_results(page)
+
+        # Check for no results
+        no_results = await page.query_selector(self.SELECTORS["no_results"])
+        if no_results:
+            no_results_text = await no_results.text_content() or ""
+            if "no results" in no_results_text.lower():
+                logger.info("No results for query: %s", query)
+                return
+
+        # Process current page
+        for listing in await self._extract_cards(page):
+            yield listing
+
+        # Handle pagination (up to 3 pages per query)
+        for _ in range(2):
+            if not await self._next_page(page):
+                break
+
+            for listing in await self._extract_cards(page):
+                yield listing
+
+    def _card_listing(self, card: dict[str, Any]) -> Listing | None:
+        """Build a listing from a result card, titling it from the image alt text if needed."""
+        listing = super()._card_listing(card)
+        if listing is not None and not listing.title:
+            listing.title = card.get("imageAlt") or ""
+        return listing
 
     async def get_listing_details(self, page: Page, url: str) -> Listing | None:
         """Get detailed information for a specific listing."""
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            await self._rate_limit()
-
-            # Extract title
-            title_element = await page.query_selector("h1, [data-listing-title]")
-            title = ""
-            if title_element:
-                title = await title_element.text_content() or ""
-                title = title.strip()
-
-            # Extract price
-            price_element = await page.query_selector(".wt-text-title-03, [data-buy-box-region] .currency-value")
-            price = None
-            if price_element:
-                price = await price_element.text_content()
-                if price:
-                    price = price.strip()
-
-            # Extract description
-            desc_element = await page.query_selector(
-                "[data-product-details-description-text-content], .wt-content-toggle__body"
-            )
-            description = None
-            if desc_element:
-                description = await desc_element.text_content()
-                if description:
-                    description = description.strip()[:500]
-
-            # Extract image
-            image_element = await page.query_selector(
-                "[data-listing-page-image] img, .listing-page-image-container img"
-            )
-            image_url = None
-            if image_element:
-                image_url = await image_element.get_attribute("src")
+            await self._navigate(page, url, wait_until="commit")
+            await self._wait_for_details(page)
+
+            details = await page.evaluate(self._bind_selectors(DETAILS_SCRIPT))
 
             return Listing(
                 url=url,
                 source=self.NAME,
-                title=title,
-                price=price,
-                description=description,
-                image_url=image_url,
+                title=details.get("title") or "",
+                price=normalize_price(details.get("price")),
+                description=(details.get("description") or "")[:500] or None,
+                image_url=details.get("imageUrl"),
             )
 
         except Exception as e:
@@ -1,23 +1,33 @@
 """Mercari marketplace adapter."""
 
+import functools
 import logging
 from typing import AsyncIterator
-from urllib.parse import quote_plus
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.base import MarketplaceAdapter
+from src.adapters.base import DETAILS_SCRIPT, MarketplaceAdapter, normalize_price, quote_query
 from src.models import Listing
 
 logger = logging.getLogger(__name__)
 
+# True once the SPA has rendered an item link or the no-results marker
+HYDRATED_SCRIPT = """
+(selectors) => document.querySelector(selectors.no_results) !== null
+    || Array.from(document.querySelectorAll(selectors.listing)).some(card => card.querySelector(selectors.link))
+"""
+
 
 class MercariAdapter(MarketplaceAdapter):
     """Adapter for searching Mercari.com - popular resale marketplace."""
 
     BASE_URL = "https://www.mercari.com"
     NAME = "mercari"
+    LISTING_PATH = "/item/"
+
+    # Search results in the Jewelry category; format with the quoted query
+    SEARCH_URL = f"{BASE_URL}/search?keyword={{query}}&categoryIds=29"
 
     SELECTORS = {
         "listing": "[data-testid='ItemContainer'], .sc-bczRLJ",
@@ -26,144 +36,107 @@ class MercariAdapter(MarketplaceAdapter):
         "link": "a[href*='/item/']",
         "image": "img[src*='static.mercdn.net']",
         "no_results": "[data-testid='SearchNoResults'], .sc-no-results",
+        # Detail page selectors
+        "detail_title": "[data-testid='ItemName'], h1, .item-name",
+        "detail_price": "[data-testid='ItemPrice'], .item-price",
+        "detail_description": "[data-testid='ItemDescription'], .item-description",
+        "detail_image": "[data-testid='ItemImage'] img, .item-photo img",
     }
 
-    async def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
-        """Search Mercari and yield listings."""
-        for query in queries:
-            logger.info(f"Searching Mercari for: {query}")
-
-            try:
-                # Navigate to search results - filter to Jewelry category
-                search_url = (
-                    f"{self.BASE_URL}/search"
-                    f"?keyword={quote_plus(query)}"
-                    f"&categoryIds=29"  # Jewelry category
-                )
-                await page.goto(search_url, wait_until="domcontentloaded")
-                await self._rate_limit()
-
-                # Wait for dynamic content to load
-                await page.wait_for_timeout(2000)
-
-                # Check for no results
-                no_results = await page.query_selector(self.SELECTORS["no_results"])
-                if no_results:
-                    logger.info(f"No results for query: {query}")
-                    continue
-
-                # Process current page
-                async for listing in self._extract_listings(page):
-                    yield listing
-
-            except PlaywrightTimeout:
-                logger.warning(f"Timeout searching Mercari for: {query}")
-            except Exception as e:
-                logger.error(f"Error searching Mercari: {e}")
-
-    async def _extract_listings(self, page: Page) -> AsyncIterator[Listing]:
-        """Extract listings from current page."""
+    def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
+        """Search Mercari and yield listings.
+
+        Each query runs as its own job, up to ``max_concurrency`` at a time in
+        separate tabs.
+
+        Args:
+            page: Playwright page instance.
+            queries: List of search query strings.
+
+        Returns:
+            Async iterator of Listing objects for each result found.
+        """
+        jobs = [functools.partial(self._search_query, query=query) for query in queries]
+        return self._merge_searches(page, jobs)
+
+    async def _search_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Search Mercari for one query, retrying timeouts that occur before any results.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
+        Yields:
+            Listing objects for each result found.
+        """
+        logger.info("Searching Mercari for: %s", query)
+
         try:
-            await page.wait_for_selector(self.SELECTORS["listing"], timeout=10000)
+            job = functools.partial(self._run_query, query=query)
+            async for listing in self._retry_search(page, job, PlaywrightTimeout):
+                yield listing
+
+        except PlaywrightTimeout:
+            logger.warning("Timeout searching Mercari for: %s", query)
+        except Exception as e:
+            logger.error(f"Error searching Mercari: {e}")
+
+    async def _wait_for_results(self, page: Page, timeout: float = 5000) -> None:
+        """Wait until the search SPA has hydrated its results.
+
+        Item containers can render before their links, so this polls for a
+        card with an item link rather than for the container alone. A slow
+        page falls through to the usual no-results and listing checks.
+
+        Args:
+            page: Playwright page on a search results page.
+            timeout: Maximum wait in milliseconds.
+        """
+        try:
+            await page.wait_for_function(HYDRATED_SCRIPT, arg=self.SELECTORS, timeout=timeout)
         except PlaywrightTimeout:
-            logger.warning("No listings found on page")
+            logger.debug("Mercari results still hydrating after %sms", timeout)
+
+    async def _run_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Load and read the results for one query.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
+        Yields:
+            Listing objects for each result found.
+        """
+        # Navigate to search results - filter to Jewelry category
+        search_url = self.SEARCH_URL.format(query=quote_query(query))
+        await self._navigate(page, search_url, wait_until="commit")
+        await self._wait_for_results(page)
+
+        # Check for no results
+        no_results = await page.query_selector(self.SELECTORS["no_results"])
+        if no_results:
+            logger.info("No results for query: %s", query)
             return
 
-        listing_elements = await page.query_selector_all(self.SELECTORS["listing"])
-
-        for element in listing_elements:
-            try:
-                # Extract link
-                link_element = await element.query_selector(self.SELECTORS["link"])
-                if not link_element:
-                    link_element = await element.query_selector("a")
-                if not link_element:
-                    continue
-
-                href = await link_element.get_attribute("href")
-                if not href or "/item/" not in href:
-                    continue
-
-                url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-
-                # Extract title
-                title_element = await element.query_selector(self.SELECTORS["title"])
-                title = ""
-                if title_element:
-                    title = await title_element.text_content() or ""
-                    title = title.strip()
-
-                # Extract price
-                price_element = await element.query_selector(self.SELECTORS["price"])
-                price = None
-                if price_element:
-                    price = await price_element.text_content()
-                    if price:
-                        price = price.strip()
-
-                # Extract image URL
-                image_element = await element.query_selector(self.SELECTORS["image"])
-                image_url = None
-                if image_element:
-                    image_url = await image_element.get_attribute("src")
-
-                yield Listing(
-                    url=url,
-                    source=self.NAME,
-                    title=title,
-                    price=price,
-                    description=None,
-                    image_url=image_url,
-                )
-
-            except Exception as e:
-                logger.warning(f"Error extracting listing: {e}")
+        # Process current page
+        for listing in await self._extract_cards(page):
+            yield listing
 
     async def get_listing_details(self, page: Page, url: str) -> Listing | None:
         """Get detailed information for a specific listing."""
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            await self._rate_limit()
-
-            # Wait for dynamic content
-            await page.wait_for_timeout(2000)
-
-            # Extract title
-            title_element = await page.query_selector("[data-testid='ItemName'], h1, .item-name")
-            title = ""
-            if title_element:
-                title = await title_element.text_content() or ""
-                title = title.strip()
-
-            # Extract price
-            price_element = await page.query_selector("[data-testid='ItemPrice'], .item-price")
-            price = None
-            if price_element:
-                price = await price_element.text_content()
-                if price:
-                    price = price.strip()
-
-            # Extract description
-            desc_element = await page.query_selector("[data-testid='ItemDescription'], .item-description")
-            description = None
-            if desc_element:
-                description = await desc_element.text_content()
-                if description:
-                    description = description.strip()[:500]
-
-            # Extract image
-            image_element = await page.query_selector("[data-testid='ItemImage'] img, .item-photo img")
-            image_url = None
-            if image_element:
-                image_url = await image_element.get_attribute("src")
+            await self._navigate(page, url, wait_until="commit")
+            await self._wait_for_details(page)
+
+            details = await page.evaluate(self._bind_selectors(DETAILS_SCRIPT))
 
             return Listing(
                 url=url,
                 source=self.NAME,
-                title=title,
-                price=price,
-                description=description,
-                image_url=image_url,
+                title=details.get("title") or "",
+                price=normalize_price(details.get("price")),
+                description=(details.get("description") or "")[:500] or None,
+                image_url=details.get("imageUrl"),
             )
 
         except Exception as e:
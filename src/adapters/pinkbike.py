@@ -1,17 +1,48 @@
 """Pinkbike marketplace adapter for bike listings."""
 
+import functools
 import logging
-from typing import AsyncIterator
-from urllib.parse import quote_plus
+from typing import Any, AsyncIterator
+from urllib.parse import urljoin
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.base import MarketplaceAdapter
+from src.adapters.base import DETAILS_SCRIPT, AdapterLimits, MarketplaceAdapter, normalize_price, quote_query
 from src.models import Listing
 
 logger = logging.getLogger(__name__)
 
+# Maps each listing card, including its location, to a plain dict in one call
+# (run via locator.evaluate_all). Link and image URLs come back as written and are resolved
+# in Python, since a fetched document parsed in-page has no Pinkbike URL to resolve against.
+CARDS_SCRIPT = """
+(cards, selectors) => cards.map(card => {
+    const text = (selector) => {
+        const el = card.querySelector(selector);
+        return el ? (el.textContent || '').trim() : null;
+    };
+    const link = card.querySelector(selectors.link);
+    const image = card.querySelector(selectors.image);
+
+    return {
+        url: link ? link.getAttribute('href') : null,
+        title: text(selectors.title),
+        price: text(selectors.price),
+        imageUrl: image ? image.getAttribute('src') : null,
+        location: text(selectors.location)
+    };
+})
+"""
+
+# CARDS_SCRIPT over the cards of a fetched document, plus whether it links a next page, for _parse_html
+HTML_CARDS_SCRIPT = f"""
+(selectors, root) => ({{
+    cards: ({CARDS_SCRIPT.strip()})(Array.from(root.querySelectorAll(selectors.listing)), selectors),
+    hasNext: !!root.querySelector(selectors.next_page)
+}})
+"""
+
 
 class PinkbikeAdapter(MarketplaceAdapter):
     """Adapter for searching Pinkbike Buy/Sell marketplace."""
@@ -27,200 +58,218 @@ class PinkbikeAdapter(MarketplaceAdapter):
         "image": ".buysell-image img, .bsitem-image img, .thumb img",
         "location": ".buysell-location, .bsitem-location, .location",
         "no_results": ".no-results, .empty-state",
-        "next_page": ".pagination .next, a[rel='next']",
+        "next_page": ".pagination a.next, a[rel='next']",
+        # Detail page selectors
+        "detail_title": "h1.buysell-title, h1",
+        "detail_price": ".buysell-price, .price",
+        "detail_description": ".buysell-description, .description, .item-description",
+        "detail_specs": ".buysell-specs, .specs",
+        "detail_image": ".buysell-image img, .main-image img, .gallery img",
     }
 
+    # Marketplace config keys accepted by __init__
+    CONFIG_OPTIONS = ("use_http",)
+
     # E-bike category on Pinkbike
     CATEGORY_EBIKE = 75
 
-    async def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
+    # E-bike results in North America (region 3); format with the quoted query and page number
+    SEARCH_URL = f"{BASE_URL}/buysell/?q={{query}}&category={CATEGORY_EBIKE}&region=3&page={{page}}"
+
+    # Result pages read per query
+    MAX_PAGES = 3
+
+    def __init__(
+        self,
+        min_delay: float = 2.0,
+        max_delay: float = 5.0,
+        max_concurrency: int = 4,
+        use_http: bool = False,
+        limits: AdapterLimits | None = None,
+    ):
+        """Initialize adapter with rate limiting settings.
+
+        Args:
+            min_delay: Minimum delay between requests in seconds.
+            max_delay: Maximum delay between requests in seconds.
+            max_concurrency: Maximum number of search jobs run in parallel tabs.
+            use_http: Try plain HTTP fetches of search pages before rendering them.
+            limits: Page slots and request budgets shared with the run's other adapters.
+        """
+        super().__init__(min_delay=min_delay, max_delay=max_delay, max_concurrency=max_concurrency, limits=limits)
+        self.use_http = use_http
+
+    def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
         """Search Pinkbike Buy/Sell and yield listings.
 
+        Each query runs as its own job, up to ``max_concurrency`` at a time
+        in separate tabs.
+
         Args:
             page: Playwright page instance.
             queries: List of search query strings.
 
+        Returns:
+            Async iterator of Listing objects for each result found.
+        """
+        jobs = [functools.partial(self._search_query, query=query) for query in queries]
+        return self._merge_searches(page, jobs)
+
+    async def _search_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Search Pinkbike for one query, up to MAX_PAGES result pages.
+
+        A later page is only requested once the one before it links to it.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
         Yields:
             Listing objects for each result found.
         """
-        for query in queries:
-            logger.info(f"Searching Pinkbike for: {query}")
-
-            try:
-                # Navigate to buy/sell search - filter to e-bikes category
-                # Pinkbike URL format: /buysell/?q=query&category=75
-                search_url = (
-                    f"{self.BASE_URL}/buysell/"
-                    f"?q={quote_plus(query)}"
-                    f"&category={self.CATEGORY_EBIKE}"
-                    f"&region=3"  # North America region
-                )
-                await page.goto(search_url, wait_until="domcontentloaded")
-                await self._rate_limit()
-
-                # Check for no results
-                no_results = await page.query_selector(self.SELECTORS["no_results"])
-                if no_results:
-                    logger.info(f"No results for query: {query}")
-                    continue
-
-                # Process current page
-                async for listing in self._extract_listings(page):
-                    yield listing
-
-                # Handle pagination (up to 3 pages per query)
-                for page_num in range(2, 4):
-                    if not await self._has_next_page(page):
+        logger.info("Searching Pinkbike for: %s", query)
+        page_number = 1
+
+        try:
+            # Fast path: results are server-rendered, so static HTML usually has them
+            if self.use_http:
+                while True:
+                    result = await self._extract_listings_http(page, self._search_url(query, page_number))
+                    if result is None:
+                        # Needs rendering; carry on in the browser from this page
                         break
+                    listings, has_next = result
+                    if not listings and page_number == 1:
+                        logger.info("No results for query: %s", query)
+                    for listing in listings:
+                        yield listing
+                    if not has_next or page_number == self.MAX_PAGES:
+                        return
+                    page_number += 1
 
-                    await self._go_to_next_page(page)
-                    await self._rate_limit()
+            await self._navigate(page, self._search_url(query, page_number), wait_until="commit")
+            await self._wait_for_results(page)
 
-                    async for listing in self._extract_listings(page):
-                        yield listing
+            # Check for no results
+            no_results = await page.query_selector(self.SELECTORS["no_results"])
+            if no_results:
+                if page_number == 1:
+                    logger.info("No results for query: %s", query)
+                return
 
-            except PlaywrightTimeout:
-                logger.warning(f"Timeout searching Pinkbike for: {query}")
-            except Exception as e:
-                logger.error(f"Error searching Pinkbike: {e}")
+            # The next page loads while this one is consumed
+            max_pages = self.MAX_PAGES - page_number + 1
+            async for listing in self._paginate(page, self._extract_listings, max_pages=max_pages):
+                yield listing
+
+        except PlaywrightTimeout:
+            logger.warning("Timeout searching Pinkbike for: %s (page %d)", query, page_number)
+        except Exception as e:
+            logger.error("Error searching Pinkbike: %s", e)
+
+    def _search_url(self, query: str, page_number: int) -> str:
+        """Build the URL of one page of results for a query.
+
+        Args:
+            query: Search query string.
+            page_number: 1-based result page.
 
-    async def _extract_listings(self, page: Page) -> AsyncIterator[Listing]:
-        """Extract listings from current page."""
+        Returns:
+            Search results URL.
+        """
+        return self.SEARCH_URL.format(query=quote_query(query), page=page_number)
+
+    async def _extract_listings(self, page: Page) -> list[Listing]:
+        """Extract listings from current page.
+
+        Reads every card in one locator.evaluate_all() call instead of
+        several round-trips per card.
+        """
         try:
-            await page.wait_for_selector(self.SELECTORS["listing"], timeout=10000)
+            await self._wait_attached(page, self.SELECTORS["listing"])
         except PlaywrightTimeout:
             logger.warning("No listings found on page")
-            return
-
-        listing_elements = await page.query_selector_all(self.SELECTORS["listing"])
-
-        for element in listing_elements:
-            try:
-                # Extract link
-                link_element = await element.query_selector(self.SELECTORS["link"])
-                if not link_element:
-                    continue
-
-                href = await link_element.get_attribute("href")
-                if not href:
-                    continue
-
-                # Ensure full URL
-                url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-
-                # Extract title
-                title_element = await element.query_selector(self.SELECTORS["title"])
-                title = ""
-                if title_element:
-                    title = await title_element.text_content() or ""
-                    title = title.strip()
-
-                if not title:
-                    continue
-
-                # Extract price
-                price_element = await element.query_selector(self.SELECTORS["price"])
-                price = None
-                if price_element:
-                    price = await price_element.text_content()
-                    if price:
-                        price = price.strip()
-
-                # Extract image URL
-                image_element = await element.query_selector(self.SELECTORS["image"])
-                image_url = None
-                if image_element:
-                    image_url = await image_element.get_attribute("src")
-
-                # Extract location for filtering
-                location_element = await element.query_selector(self.SELECTORS["location"])
-                location = None
-                if location_element:
-                    location = await location_element.text_content()
-                    if location:
-                        location = location.strip()
-
-                # Include location in description if available
-                description = f"Location: {location}" if location else None
-
-                yield Listing(
-                    url=url,
-                    source=self.NAME,
-                    title=title,
-                    price=price,
-                    description=description,
-                    image_url=image_url,
-                )
-
-            except Exception as e:
-                logger.warning(f"Error extracting listing: {e}")
-
-    async def _has_next_page(self, page: Page) -> bool:
-        """Check if there's a next page of results."""
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        return next_button is not None
-
-    async def _go_to_next_page(self, page: Page) -> None:
-        """Navigate to the next page of results."""
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if next_button:
-            await next_button.click()
-            await page.wait_for_load_state("domcontentloaded")
+            return []
+
+        cards = await page.locator(self.SELECTORS["listing"]).evaluate_all(
+            self._bind_selectors(CARDS_SCRIPT, takes_elements=True)
+        )
+        return self._build_listings(cards)
+
+    async def _extract_listings_http(self, page: Page, url: str) -> tuple[list[Listing], bool] | None:
+        """Extract listings from a search URL's static HTML.
+
+        Fetches the HTML over HTTP and parses it in-page without rendering.
+
+        Args:
+            page: Playwright page used for the request and as the JS runtime.
+            url: Search results URL.
+
+        Returns:
+            Listings found (an empty list if the page reports no results) and
+            whether the page links a next page, or None if the page needs full
+            browser rendering.
+        """
+        source = await self._fetch_html(page, url)
+        if not source:
+            return None
+
+        parsed = await self._parse_html(page, source, HTML_CARDS_SCRIPT, self.SELECTORS)
+        if parsed["cards"]:
+            return self._build_listings(parsed["cards"]), parsed["hasNext"]
+
+        no_results = await self._parse_html(
+            page, source, "(selectors, root) => !!root.querySelector(selectors.no_results)", self.SELECTORS
+        )
+        return ([], False) if no_results else None
+
+    def _build_listings(self, cards: list[dict[str, Any]]) -> list[Listing]:
+        """Build Listing objects from raw card data.
+
+        Args:
+            cards: Dicts returned by CARDS_SCRIPT.
+
+        Returns:
+            Listing objects for each card with a link and title.
+        """
+        return [
+            Listing(
+                url=urljoin(self.BASE_URL, card["url"]),
+                source=self.NAME,
+                title=card["title"],
+                price=normalize_price(card.get("price")),
+                # Include location in description for filtering
+                description=f"Location: {card['location']}" if card.get("location") else None,
+                image_url=urljoin(self.BASE_URL, card["imageUrl"]) if card.get("imageUrl") else None,
+            )
+            for card in cards
+            if card.get("url") and card.get("title")
+        ]
 
     async def get_listing_details(self, page: Page, url: str) -> Listing | None:
         """Get detailed information for a specific listing."""
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            await self._rate_limit()
-
-            # Extract title
-            title_element = await page.query_selector("h1.buysell-title, h1")
-            title = ""
-            if title_element:
-                title = await title_element.text_content() or ""
-                title = title.strip()
-
-            # Extract price
-            price_element = await page.query_selector(".buysell-price, .price")
-            price = None
-            if price_element:
-                price = await price_element.text_content()
-                if price:
-                    price = price.strip()
-
-            # Extract description
-            desc_element = await page.query_selector(".buysell-description, .description, .item-description")
-            description = None
-            if desc_element:
-                description = await desc_element.text_content()
-                if description:
-                    description = description.strip()[:1000]  # Limit length
-
-            # Extract specs if available
-            specs_element = await page.query_selector(".buysell-specs, .specs")
-            if specs_element:
-                specs_text = await specs_element.text_content()
-                if specs_text:
-                    if description:
-                        description = f"{description}\n\nSpecs: {specs_text.strip()}"
-                    else:
-                        description = f"Specs: {specs_text.strip()}"
-
-            # Extract image
-            image_element = await page.query_selector(".buysell-image img, .main-image img, .gallery img")
-            image_url = None
-            if image_element:
-                image_url = await image_element.get_attribute("src")
+            await self._navigate(page, url, wait_until="commit")
+            await self._wait_for_details(page)
+
+            details = await page.evaluate(self._bind_selectors(DETAILS_SCRIPT))
+
+            # Append specs if available
+            description = (details.get("description") or "")[:1000]
+            specs_text = details.get("specs")
+            description = (
+                "\n\n".join(part for part in (description, specs_text and f"Specs: {specs_text}") if part) or None
+            )
 
             return Listing(
                 url=url,
                 source=self.NAME,
-                title=title,
-                price=price,
+                title=details.get("title") or "",
+                price=normalize_price(details.get("price")),
                 description=description,
-                image_url=image_url,
+                image_url=details.get("imageUrl"),
             )
 
         except Exception as e:
-            logger.error(f"Error fetching Pinkbike listing details: {e}")
+            logger.error("Error fetching Pinkbike listing details: %s", e)
             return None
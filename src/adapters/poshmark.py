@@ -1,14 +1,24 @@
 """Poshmark marketplace adapter."""
 
 import asyncio
+import functools
+import json
 import logging
-from typing import AsyncIterator
-from urllib.parse import quote_plus
+import random
+from typing import Any, AsyncIterator
+from urllib.parse import quote
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.base import MarketplaceAdapter
+from src.adapters.base import (
+    DETAILS_SCRIPT,
+    THROTTLE_STATUSES,
+    AdapterLimits,
+    MarketplaceAdapter,
+    normalize_price,
+    quote_query,
+)
 from src.models import Listing
 
 logger = logging.getLogger(__name__)
@@ -16,6 +26,67 @@ logger = logging.getLogger(__name__)
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+
+# Extracts listing tiles in one call. Non-listing links are dropped; listing and
+# image URLs come back absolute, resolved against the page URL.
+LISTINGS_SCRIPT = """
+(selectors) => {
+    const results = [];
+    const listings = document.querySelectorAll(selectors.listing);
+
+    listings.forEach(element => {
+        try {
+            // Extract link
+            let linkElement = element.querySelector(selectors.link);
+            if (!linkElement) {
+                linkElement = element.querySelector('a');
+            }
+            if (!linkElement) return;
+
+            const href = linkElement.getAttribute('href');
+            if (!href || !href.includes('/listing/')) return;
+
+            // Extract title
+            const titleElement = element.querySelector(selectors.title);
+            const title = titleElement ? titleElement.textContent.trim() : '';
+
+            // Extract price
+            const priceElement = element.querySelector(selectors.price);
+            const price = priceElement ? priceElement.textContent.trim() : null;
+
+            // Extract image URL
+            const imageElement = element.querySelector(selectors.image);
+            const imageUrl = imageElement && imageElement.getAttribute('src') ? imageElement.src : null;
+
+            results.push({
+                // Absolute URL, resolved against the page
+                url: linkElement.href,
+                title: title,
+                price: price,
+                imageUrl: imageUrl
+            });
+        } catch (e) {
+            // Skip problematic elements
+        }
+    });
+
+    return results;
+}
+"""
+
+
+def _retry_delay(previous: float) -> float:
+    """Pick the next retry delay with decorrelated jitter.
+
+    Args:
+        previous: The previous delay in seconds (RETRY_BASE_DELAY before the first retry).
+
+    Returns:
+        A random delay between RETRY_BASE_DELAY and three times ``previous``,
+        capped at RETRY_MAX_DELAY.
+    """
+    return random.uniform(RETRY_BASE_DELAY, min(RETRY_MAX_DELAY, previous * 3))
 
 
 class PoshmarkAdapter(MarketplaceAdapter):
@@ -24,6 +95,23 @@ class PoshmarkAdapter(MarketplaceAdapter):
     BASE_URL = "https://poshmark.com"
     NAME = "poshmark"
 
+    # Women's jewelry rings; format with the quoted query
+    SEARCH_URL = f"{BASE_URL}/search?query={{query}}&department=Women&category=Jewelry&subcategory=Rings"
+
+    # JSON search endpoint the search page itself loads; format with the quoted request object
+    API_URL = f"{BASE_URL}/vm-rest/posts?request={{request}}&summarize=true"
+
+    # Marketplace config keys accepted by __init__
+    CONFIG_OPTIONS = ("use_api",)
+
+    # Same filters as SEARCH_URL, in the API's request format
+    API_FILTERS = {
+        "department": "Women",
+        "category": "Jewelry",
+        "subcategory": "Rings",
+        "inventory_status": ["available"],
+    }
+
     SELECTORS = {
         "listing": ".card, .tile, [data-et-name='listing']",
         "title": ".tile__title, .card__title, [data-et-name='title']",
@@ -31,168 +119,205 @@ class PoshmarkAdapter(MarketplaceAdapter):
         "link": "a[href*='/listing/']",
         "image": ".tile__image img, .card__image img",
         "no_results": ".no-results, .empty-state",
+        # Detail page selectors
+        "detail_title": ".listing__title, h1[data-et-name='title']",
+        "detail_price": ".listing__price, [data-et-name='price']",
+        "detail_description": ".listing__description, [data-et-name='description']",
+        "detail_image": ".listing__image img, .carousel img",
     }
 
-    async def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
-        """Search Poshmark and yield listings."""
-        for query in queries:
-            logger.info(f"Searching Poshmark for: {query}")
+    def __init__(
+        self,
+        min_delay: float = 2.0,
+        max_delay: float = 5.0,
+        max_concurrency: int = 4,
+        use_api: bool = False,
+        limits: AdapterLimits | None = None,
+    ):
+        """Initialize adapter with rate limiting settings.
+
+        Args:
+            min_delay: Minimum delay between requests in seconds.
+            max_delay: Maximum delay between requests in seconds.
+            max_concurrency: Maximum number of search jobs run in parallel tabs.
+            use_api: Read results from Poshmark's JSON search endpoint before
+                rendering the search page.
+            limits: Page slots and request budgets shared with the run's other adapters.
+        """
+        super().__init__(min_delay=min_delay, max_delay=max_delay, max_concurrency=max_concurrency, limits=limits)
+        self.use_api = use_api
 
-            try:
-                # Navigate to search results - filter to Jewelry category
-                search_url = (
-                    f"{self.BASE_URL}/search"
-                    f"?query={quote_plus(query)}"
-                    f"&department=Women&category=Jewelry&subcategory=Rings"
-                )
-                await page.goto(search_url, wait_until="domcontentloaded")
-                await self._rate_limit()
+    def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
+        """Search Poshmark and yield listings.
 
-                # Wait for dynamic content to load
-                await page.wait_for_timeout(2000)
+        Each query runs as its own job, up to ``max_concurrency`` at a time in
+        separate tabs.
 
-                # Check for no results
-                no_results = await page.query_selector(self.SELECTORS["no_results"])
-                if no_results:
-                    logger.info(f"No results for query: {query}")
-                    continue
+        Args:
+            page: Playwright page instance.
+            queries: List of search query strings.
 
-                # Process current page
-                async for listing in self._extract_listings(page):
-                    yield listing
+        Returns:
+            Async iterator of Listing objects for each result found.
+        """
+        jobs = [functools.partial(self._search_query, query=query) for query in queries]
+        return self._merge_searches(page, jobs)
 
-            except PlaywrightTimeout:
-                logger.warning(f"Timeout searching Poshmark for: {query}")
-            except Exception as e:
-                logger.error(f"Error searching Poshmark: {e}")
+    async def _search_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Search Poshmark for one query.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
+        Yields:
+            Listing objects for each result found.
+        """
+        logger.info(f"Searching Poshmark for: {query}")
+
+        try:
+            # Fast path: the JSON the search page is built from, without rendering
+            if self.use_api:
+                api_listings = await self._search_api(page, query)
+                if api_listings is not None:
+                    for listing in api_listings:
+                        yield listing
+                    return
+
+            # Navigate to search results - filter to Jewelry category
+            search_url = self.SEARCH_URL.format(query=quote_query(query))
+            await self._navigate(page, search_url, wait_until="commit")
+            await self._wait_for_results(page)
+
+            # Check for no results
+            no_results = await page.query_selector(self.SELECTORS["no_results"])
+            if no_results:
+                logger.info(f"No results for query: {query}")
+                return
+
+            # Process current page
+            for listing in await self._extract_listings(page):
+                yield listing
+
+        except PlaywrightTimeout:
+            logger.warning(f"Timeout searching Poshmark for: {query}")
+        except Exception as e:
+            logger.error(f"Error searching Poshmark: {e}")
+
+    async def _search_api(self, page: Page, query: str) -> list[Listing] | None:
+        """Read search results from Poshmark's JSON search endpoint.
 
-    async def _extract_listings(self, page: Page) -> AsyncIterator[Listing]:
+        The request goes through the browser context, so it carries the
+        context's cookies and user agent.
+
+        Args:
+            page: Playwright page whose context performs the request.
+            query: Search query string.
+
+        Returns:
+            Listings found (possibly none), or None if the endpoint failed and
+            the search page must be rendered instead.
+        """
+        request = json.dumps({"filters": self.API_FILTERS, "query": query}, separators=(",", ":"))
+        url = self.API_URL.format(request=quote(request, safe=""))
+        await self._rate_limit()
+        try:
+            response = await page.context.request.get(url, timeout=30000)
+            self._record_response(response)
+            if not response.ok:
+                logger.debug(f"Poshmark API returned HTTP {response.status}")
+                return None
+            posts = (await response.json()).get("data")
+        except Exception as e:
+            logger.debug(f"Poshmark API request failed: {e}")
+            return None
+
+        if not isinstance(posts, list):
+            return None
+        return [listing for listing in map(self._api_listing, posts) if listing is not None]
+
+    def _api_listing(self, post: dict[str, Any]) -> Listing | None:
+        """Build a Listing from one post in the JSON search response.
+
+        Args:
+            post: Post object from the endpoint's ``data`` list.
+
+        Returns:
+            The Listing, or None if the post has no id.
+        """
+        post_id = post.get("id")
+        if not post_id:
+            return None
+
+        price = (post.get("price_amount") or {}).get("val")
+        image = (post.get("cover_shot") or {}).get("url") or post.get("picture_url")
+        return Listing(
+            url=f"{self.BASE_URL}/listing/{post_id}",
+            source=self.NAME,
+            title=post.get("title") or "",
+            price=normalize_price(f"${price}" if price else None),
+            description=None,
+            image_url=image,
+        )
+
+    async def _extract_listings(self, page: Page) -> list[Listing]:
         """Extract listings from current page using batch JavaScript extraction.
 
         Uses page.evaluate() to extract all listing data in a single JS call,
         avoiding stale element handle errors from DOM changes during iteration.
+        Non-listing links are dropped and URLs made absolute inside the script.
         """
         try:
-            await page.wait_for_selector(self.SELECTORS["listing"], timeout=10000)
+            await self._wait_attached(page, self.SELECTORS["listing"])
         except PlaywrightTimeout:
             logger.warning("No listings found on page")
-            return
+            return []
 
         # Extract all listings in a single JavaScript call to avoid stale handles
-        listings_data = await page.evaluate(
-            """
-            (selectors) => {
-                const results = [];
-                const listings = document.querySelectorAll(selectors.listing);
-
-                listings.forEach(element => {
-                    try {
-                        // Extract link
-                        let linkElement = element.querySelector(selectors.link);
-                        if (!linkElement) {
-                            linkElement = element.querySelector('a');
-                        }
-                        if (!linkElement) return;
-
-                        const href = linkElement.getAttribute('href');
-                        if (!href || !href.includes('/listing/')) return;
-
-                        // Extract title
-                        const titleElement = element.querySelector(selectors.title);
-                        const title = titleElement ? titleElement.textContent.trim() : '';
-
-                        // Extract price
-                        const priceElement = element.querySelector(selectors.price);
-                        const price = priceElement ? priceElement.textContent.trim() : null;
-
-                        // Extract image URL
-                        const imageElement = element.querySelector(selectors.image);
-                        const imageUrl = imageElement ? imageElement.getAttribute('src') : null;
-
-                        results.push({
-                            href: href,
-                            title: title,
-                            price: price,
-                            imageUrl: imageUrl
-                        });
-                    } catch (e) {
-                        // Skip problematic elements
-                    }
-                });
-
-                return results;
-            }
-            """,
-            self.SELECTORS,
-        )
-
-        for data in listings_data:
-            try:
-                href = data.get("href", "")
-                url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-
-                yield Listing(
-                    url=url,
-                    source=self.NAME,
-                    title=data.get("title", ""),
-                    price=data.get("price"),
-                    description=None,
-                    image_url=data.get("imageUrl"),
-                )
-            except Exception as e:
-                logger.warning(f"Error processing listing data: {e}")
+        listings_data = await self._evaluate_listings(page, LISTINGS_SCRIPT)
+
+        return [
+            Listing(
+                url=data["url"],
+                source=self.NAME,
+                title=data.get("title") or "",
+                price=normalize_price(data.get("price")),
+                description=None,
+                image_url=data.get("imageUrl"),
+            )
+            for data in listings_data
+            if data.get("url")
+        ]
 
     async def get_listing_details(self, page: Page, url: str) -> Listing | None:
         """Get detailed information for a specific listing with retry logic.
 
-        Uses page.evaluate() for batch extraction and exponential backoff
-        for transient failures.
+        Uses page.evaluate() for batch extraction and retries transient
+        failures, including 429/503 responses, after decorrelated-jitter
+        backoff so concurrent workers do not retry in lockstep. A Retry-After
+        header pauses the host's rate limit bucket before the next attempt.
         """
         last_error: Exception | None = None
+        delay = RETRY_BASE_DELAY
 
         for attempt in range(MAX_RETRIES):
             try:
-                await page.goto(url, wait_until="domcontentloaded")
-                await self._rate_limit()
+                response = await self._navigate(page, url, wait_until="commit")
+                if response is not None and response.status in THROTTLE_STATUSES:
+                    raise RuntimeError(f"throttled (HTTP {response.status})")
 
-                # Wait for dynamic content
-                await page.wait_for_timeout(2000)
+                # Wait for the title to render rather than a fixed delay
+                await self._wait_attached(page, self.SELECTORS["detail_title"])
 
                 # Extract all details in a single JavaScript call
-                details = await page.evaluate(
-                    """
-                    () => {
-                        const titleEl = document.querySelector(
-                            '.listing__title, h1[data-et-name="title"]'
-                        );
-                        const priceEl = document.querySelector(
-                            '.listing__price, [data-et-name="price"]'
-                        );
-                        const descEl = document.querySelector(
-                            '.listing__description, [data-et-name="description"]'
-                        );
-                        const imageEl = document.querySelector(
-                            '.listing__image img, .carousel img'
-                        );
-
-                        return {
-                            title: titleEl ? titleEl.textContent.trim() : '',
-                            price: priceEl ? priceEl.textContent.trim() : null,
-                            description: descEl
-                                ? descEl.textContent.trim().substring(0, 500)
-                                : null,
-                            imageUrl: imageEl ? imageEl.getAttribute('src') : null
-                        };
-                    }
-                    """
-                )
+                details = await page.evaluate(self._bind_selectors(DETAILS_SCRIPT))
 
                 return Listing(
                     url=url,
                     source=self.NAME,
-                    title=details.get("title", ""),
-                    price=details.get("price"),
-                    description=details.get("description"),
+                    title=details.get("title") or "",
+                    price=normalize_price(details.get("price")),
+                    description=(details.get("description") or "")[:500] or None,
                     image_url=details.get("imageUrl"),
                 )
 
@@ -200,7 +325,7 @@ class PoshmarkAdapter(MarketplaceAdapter):
                 last_error = e
                 # Only sleep and retry if not on the final attempt
                 if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_BASE_DELAY * (2**attempt)  # Exponential backoff: 1s, 2s, 4s
+                    delay = _retry_delay(delay)
                     logger.warning(
                         f"Timeout fetching Poshmark details (attempt {attempt + 1}/{MAX_RETRIES}), "
                         f"retrying in {delay:.1f}s: {url}"
@@ -209,7 +334,7 @@ class PoshmarkAdapter(MarketplaceAdapter):
             except Exception as e:
                 last_error = e
                 if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_BASE_DELAY * (2**attempt)
+                    delay = _retry_delay(delay)
                     logger.warning(
                         f"Error fetching Poshmark details (attempt {attempt + 1}/{MAX_RETRIES}), "
                         f"retrying in {delay:.1f}s: {e}"
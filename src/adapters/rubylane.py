@@ -1,17 +1,37 @@
 """Ruby Lane marketplace adapter."""
 
+import functools
 import logging
 from typing import AsyncIterator
-from urllib.parse import quote_plus
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.base import MarketplaceAdapter
+from src.adapters.base import DETAILS_SCRIPT, MarketplaceAdapter, normalize_price, quote_query
 from src.models import Listing
 
 logger = logging.getLogger(__name__)
 
+# Maps each result card to a plain dict in one call (run via locator.evaluate_all).
+# Links and image URLs come back absolute, resolved against the page URL.
+CARDS_SCRIPT = """
+(cards, selectors) => cards.map(card => {
+    const text = (selector) => {
+        const el = card.querySelector(selector);
+        return el ? (el.textContent || '').trim() : null;
+    };
+    const link = card.querySelector(selectors.link) || card.querySelector('a');
+    const image = card.querySelector(selectors.image);
+
+    return {
+        url: link && link.getAttribute('href') ? link.href : null,
+        title: text(selectors.title),
+        price: text(selectors.price),
+        imageUrl: image && image.getAttribute('src') ? image.src : null
+    };
+})
+"""
+
 
 class RubyLaneAdapter(MarketplaceAdapter):
     """Adapter for searching RubyLane.com - antiques and vintage marketplace."""
@@ -19,6 +39,9 @@ class RubyLaneAdapter(MarketplaceAdapter):
     BASE_URL = "https://www.rubylane.com"
     NAME = "rubylane"
 
+    # Search results in the jewelry category; format with the quoted query
+    SEARCH_URL = f"{BASE_URL}/search?q={{query}}&cat=jewelry"
+
     SELECTORS = {
         "listing": ".item-card, .search-result-item, [data-item-id]",
         "title": ".item-title, .item-card-title, h3 a",
@@ -26,134 +49,102 @@ class RubyLaneAdapter(MarketplaceAdapter):
         "link": "a[href*='/item/'], .item-card a",
         "image": ".item-image img, .item-card img",
         "no_results": ".no-results, .empty-results",
+        # Detail page selectors
+        "detail_title": "h1, .item-title",
+        "detail_price": ".item-price, .price",
+        "detail_description": ".item-description, .description",
+        "detail_image": ".item-image img, .main-image img",
     }
 
-    async def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
-        """Search Ruby Lane and yield listings."""
-        for query in queries:
-            logger.info(f"Searching Ruby Lane for: {query}")
-
-            try:
-                # Navigate to search results - filter to Jewelry category
-                search_url = f"{self.BASE_URL}/search?q={quote_plus(query)}&cat=jewelry"
-                await page.goto(search_url, wait_until="domcontentloaded")
-                await self._rate_limit()
-
-                # Check for no results
-                no_results = await page.query_selector(self.SELECTORS["no_results"])
-                if no_results:
-                    logger.info(f"No results for query: {query}")
-                    continue
-
-                # Process current page
-                async for listing in self._extract_listings(page):
-                    yield listing
-
-            except PlaywrightTimeout:
-                logger.warning(f"Timeout searching Ruby Lane for: {query}")
-            except Exception as e:
-                logger.error(f"Error searching Ruby Lane: {e}")
-
-    async def _extract_listings(self, page: Page) -> AsyncIterator[Listing]:
+    def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
+        """Search Ruby Lane and yield listings.
+
+        Each query runs as its own job, up to ``max_concurrency`` at a time in
+        separate tabs.
+
+        Args:
+            page: Playwright page instance.
+            queries: List of search query strings.
+
+        Returns:
+            Async iterator of Listing objects for each result found.
+        """
+        jobs = [functools.partial(self._search_query, query=query) for query in queries]
+        return self._merge_searches(page, jobs)
+
+    async def _search_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Search Ruby Lane for one query.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
+        Yields:
+            Listing objects for each result found.
+        """
+        logger.info(f"Searching Ruby Lane for: {query}")
+
+        try:
+            # Navigate to search results - filter to Jewelry category
+            search_url = self.SEARCH_URL.format(query=quote_query(query))
+            await self._navigate(page, search_url, wait_until="commit")
+            await self._wait_for_results(page)
+
+            # Check for no results
+            no_results = await page.query_selector(self.SELECTORS["no_results"])
+            if no_results:
+                logger.info(f"No results for query: {query}")
+                return
+
+            # Process current page
+            for listing in await self._extract_listings(page):
+                yield listing
+
+        except PlaywrightTimeout:
+            logger.warning(f"Timeout searching Ruby Lane for: {query}")
+        except Exception as e:
+            logger.error(f"Error searching Ruby Lane: {e}")
+
+    async def _extract_listings(self, page: Page) -> list[Listing]:
         """Extract listings from current page."""
         try:
-            await page.wait_for_selector(self.SELECTORS["listing"], timeout=10000)
+            await self._wait_attached(page, self.SELECTORS["listing"])
         except PlaywrightTimeout:
             logger.warning("No listings found on page")
-            return
-
-        listing_elements = await page.query_selector_all(self.SELECTORS["listing"])
-
-        for element in listing_elements:
-            try:
-                # Extract link
-                link_element = await element.query_selector(self.SELECTORS["link"])
-                if not link_element:
-                    link_element = await element.query_selector("a")
-                if not link_element:
-                    continue
-
-                href = await link_element.get_attribute("href")
-                if not href:
-                    continue
-
-                url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-
-                # Extract title
-                title_element = await element.query_selector(self.SELECTORS["title"])
-                title = ""
-                if title_element:
-                    title = await title_element.text_content() or ""
-                    title = title.strip()
-
-                # Extract price
-                price_element = await element.query_selector(self.SELECTORS["price"])
-                price = None
-                if price_element:
-                    price = await price_element.text_content()
-                    if price:
-                        price = price.strip()
-
-                # Extract image URL
-                image_element = await element.query_selector(self.SELECTORS["image"])
-                image_url = None
-                if image_element:
-                    image_url = await image_element.get_attribute("src")
-
-                yield Listing(
-                    url=url,
-                    source=self.NAME,
-                    title=title,
-                    price=price,
-                    description=None,
-                    image_url=image_url,
-                )
-
-            except Exception as e:
-                logger.warning(f"Error extracting listing: {e}")
+            return []
+
+        cards = await page.locator(self.SELECTORS["listing"]).evaluate_all(
+            self._bind_selectors(CARDS_SCRIPT, takes_elements=True)
+        )
+
+        return [
+            Listing(
+                url=card["url"],
+                source=self.NAME,
+                title=card.get("title") or "",
+                price=normalize_price(card.get("price")),
+                description=None,
+                image_url=card.get("imageUrl"),
+            )
+            for card in cards
+            if card.get("url")
+        ]
 
     async def get_listing_details(self, page: Page, url: str) -> Listing | None:
         """Get detailed information for a specific listing."""
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            await self._rate_limit()
-
-            # Extract title
-            title_element = await page.query_selector("h1, .item-title")
-            title = ""
-            if title_element:
-                title = await title_element.text_content() or ""
-                title = title.strip()
-
-            # Extract price
-            price_element = await page.query_selector(".item-price, .price")
-            price = None
-            if price_element:
-                price = await price_element.text_content()
-                if price:
-                    price = price.strip()
-
-            # Extract description
-            desc_element = await page.query_selector(".item-description, .description")
-            description = None
-            if desc_element:
-                description = await desc_element.text_content()
-                if description:
-                    description = description.strip()[:500]
-
-            # Extract image
-            image_element = await page.query_selector(".item-image img, .main-image img")
-            image_url = None
-            if image_element:
-                image_url = await image_element.get_attribute("src")
+            await self._navigate(page, url, wait_until="commit")
+            await self._wait_for_details(page)
+
+            details = await page.evaluate(self._bind_selectors(DETAILS_SCRIPT))
 
             return Listing(
                 url=url,
                 source=self.NAME,
-                title=title,
-                price=price,
-                description=description,
-                image_url=image_url,
+                title=details.get("title") or "",
+                price=normalize_price(details.get("price")),
+                description=(details.get("description") or "")[:500] or None,
+                image_url=details.get("imageUrl"),
             )
 
         except Exception as e:
@@ -1,13 +1,13 @@
 """ShopGoodwill marketplace adapter."""
 
+import functools
 import logging
-from typing import AsyncIterator
-from urllib.parse import quote_plus, urljoin
+from typing import Any, AsyncIterator
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.base import MarketplaceAdapter
+from src.adapters.base import DETAILS_SCRIPT, AdapterLimits, MarketplaceAdapter, normalize_price, quote_query
 from src.models import Listing
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,29 @@ class ShopGoodwillAdapter(MarketplaceAdapter):
     BASE_URL = "https://shopgoodwill.com"
     NAME = "shopgoodwill"
 
+    # Search results in the Jewelry category; format with the quoted query
+    SEARCH_URL = f"{BASE_URL}/search?q={{query}}&category=Jewelry"
+
+    # JSON search endpoint the search page is built from (POST, one results page per call)
+    API_URL = "https://buyerapi.shopgoodwill.com/api/Search/ItemListing"
+
+    # Marketplace config keys accepted by __init__
+    CONFIG_OPTIONS = ("use_api",)
+
+    # Search filters sent with every API call: the top-level Jewelry & Gemstones
+    # category, matching the rendered search's category=Jewelry
+    API_FILTERS = {"categoryLevelNo": "1", "categoryLevel": 1, "categoryId": 10, "catIds": "10"}
+
+    # Items requested per API call, and result pages read per query
+    API_PAGE_SIZE = 40
+    MAX_PAGES = 3
+
+    # Auction prices move as bids come in, so re-read item pages after 10 minutes
+    DETAIL_CACHE_TTL = 600.0
+
+    # Let two query tabs load their first pages together
+    RATE_LIMIT_BURST = 2
+
     # CSS selectors for ShopGoodwill's UI
     SELECTORS = {
         "listing": ".product-card, .item-card, [data-testid='product-card']",
@@ -30,161 +53,184 @@ class ShopGoodwillAdapter(MarketplaceAdapter):
         "search_button": "button[type='submit'], .search-button, [aria-label='Search']",
         "next_page": ".pagination .next, a[aria-label='Next'], .page-next",
         "no_results": ".no-results, .empty-results",
+        # Detail page selectors
+        "detail_title": "h1, .product-title, .item-title",
+        "detail_price": ".current-bid, .price, .product-price",
+        "detail_description": ".description, .product-description, .item-description",
+        "detail_image": ".product-image img, .main-image img, .gallery img",
     }
 
-    async def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
+    def __init__(
+        self,
+        min_delay: float = 2.0,
+        max_delay: float = 5.0,
+        max_concurrency: int = 4,
+        use_api: bool = False,
+        limits: AdapterLimits | None = None,
+    ):
+        """Initialize adapter with rate limiting settings.
+
+        Args:
+            min_delay: Minimum delay between requests in seconds.
+            max_delay: Maximum delay between requests in seconds.
+            max_concurrency: Maximum number of search jobs run in parallel tabs.
+            use_api: Read results from ShopGoodwill's JSON search API before
+                rendering the search page.
+            limits: Page slots and request budgets shared with the run's other adapters.
+        """
+        super().__init__(min_delay=min_delay, max_delay=max_delay, max_concurrency=max_concurrency, limits=limits)
+        self.use_api = use_api
+
+    def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
         """Search ShopGoodwill and yield listings.
 
+        Each query runs as its own job, up to ``max_concurrency`` at a time in
+        separate tabs.
+
         Args:
             page: Playwright page instance.
             queries: List of search query strings.
 
+        Returns:
+            Async iterator of Listing objects for each result found.
+        """
+        jobs = [functools.partial(self._search_query, query=query) for query in queries]
+        return self._merge_searches(page, jobs)
+
+    async def _search_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Search ShopGoodwill for one query.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
         Yields:
             Listing objects for each result found.
         """
-        for query in queries:
-            logger.info(f"Searching ShopGoodwill for: {query}")
-
-            try:
-                # Navigate to search results
-                search_url = f"{self.BASE_URL}/search?q={quote_plus(query)}&category=Jewelry"
-                await page.goto(search_url, wait_until="domcontentloaded")
-                await self._rate_limit()
-
-                # Check for no results
-                no_results = await page.query_selector(self.SELECTORS["no_results"])
-                if no_results:
-                    logger.info(f"No results for query: {query}")
-                    continue
-
-                # Process current page
-                async for listing in self._extract_listings(page):
-                    yield listing
+        logger.info("Searching ShopGoodwill for: %s", query)
 
-                # Handle pagination (up to 3 pages per query)
-                for page_num in range(2, 4):
-                    if not await self._has_next_page(page):
-                        break
+        try:
+            # Fast path: the JSON API behind the search page, without rendering
+            if self.use_api:
+                api_listings = await self._search_api(page, query)
+                if api_listings is not None:
+                    if not api_listings:
+                        logger.info("No results for query: %s", query)
+                    for listing in api_listings:
+                        yield listing
+                    return
 
-                    await self._go_to_next_page(page)
-                    await self._rate_limit()
+            # Navigate to search results
+            search_url = self.SEARCH_URL.format(query=quote_query(query))
+            await self._navigate(page, search_url, wait_until="commit")
+            await self._wait_for_results(page)
 
-                    async for listing in self._extract_listings(page):
-                        yield listing
+            # Check for no results
+            no_results = await page.query_selector(self.SELECTORS["no_results"])
+            if no_results:
+                logger.info("No results for query: %s", query)
+                return
 
-            except PlaywrightTimeout:
-                logger.warning(f"Timeout searching ShopGoodwill for: {query}")
-            except Exception as e:
-                logger.error(f"Error searching ShopGoodwill: {e}")
+            # Process current page
+            for listing in await self._extract_cards(page):
+                yield listing
 
-    async def _extract_listings(self, page: Page) -> AsyncIterator[Listing]:
-        """Extract listings from current page.
+            # Handle pagination (up to 3 pages per query)
+            for _ in range(2):
+                if not await self._next_page(page):
+                    break
 
-        Args:
-            page: Playwright page instance.
+                for listing in await self._extract_cards(page):
+                    yield listing
 
-        Yields:
-            Listing objects for each item on the page.
-        """
-        # Wait for listings to load
-        try:
-            await page.wait_for_selector(
-                self.SELECTORS["listing"],
-                timeout=10000,
-            )
         except PlaywrightTimeout:
-            logger.warning("No listings found on page")
-            return
-
-        # Get all listing elements
-        listing_elements = await page.query_selector_all(self.SELECTORS["listing"])
-
-        for element in listing_elements:
-            try:
-                # Extract link
-                link_element = await element.query_selector(self.SELECTORS["link"])
-                if not link_element:
-                    continue
-
-                href = await link_element.get_attribute("href")
-                if not href:
-                    continue
-
-                url = urljoin(self.BASE_URL, href)
-
-                # Extract title
-                title_element = await element.query_selector(self.SELECTORS["title"])
-                title = ""
-                if title_element:
-                    title = await title_element.text_content() or ""
-                    title = title.strip()
-
-                if not title:
-                    # Fallback: try to get title from link text
-                    title = await link_element.text_content() or ""
-                    title = title.strip()
-
-                # Extract price
-                price_element = await element.query_selector(self.SELECTORS["price"])
-                price = None
-                if price_element:
-                    price = await price_element.text_content()
-                    if price:
-                        price = price.strip()
-
-                # Extract image URL
-                image_element = await element.query_selector(self.SELECTORS["image"])
-                image_url = None
-                if image_element:
-                    image_url = await image_element.get_attribute("src")
-
-                yield Listing(
-                    url=url,
-                    source=self.NAME,
-                    title=title,
-                    price=price,
-                    description=None,  # Description requires visiting detail page
-                    image_url=image_url,
-                )
-
-            except Exception as e:
-                logger.warning(f"Error extracting listing: {e}")
-
-    async def _has_next_page(self, page: Page) -> bool:
-        """Check if there's a next page of results.
+            logger.warning("Timeout searching ShopGoodwill for: %s", query)
+        except Exception as e:
+            logger.error("Error searching ShopGoodwill: %s", e)
+
+    async def _search_api(self, page: Page, query: str) -> list[Listing] | None:
+        """Read up to MAX_PAGES of results for a query from the JSON search API.
 
         Args:
-            page: Playwright page instance.
+            page: Playwright page whose context performs the requests.
+            query: Search query string.
 
         Returns:
-            True if next page exists and is clickable.
+            Listings found (possibly none), or None if the first request failed
+            and the search page must be rendered instead.
         """
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if not next_button:
-            return False
+        listings: list[Listing] = []
+        for page_number in range(1, self.MAX_PAGES + 1):
+            items = await self._api_items(page, query, page_number)
+            if items is None:
+                # Keep earlier pages' results rather than scraping them again
+                return listings if page_number > 1 else None
 
-        # Check if button is disabled
-        is_disabled = await next_button.get_attribute("disabled")
-        if is_disabled:
-            return False
+            listings.extend(listing for listing in map(self._api_listing, items) if listing is not None)
+            if len(items) < self.API_PAGE_SIZE:
+                break
+        return listings
 
-        # Check for disabled class
-        class_attr = await next_button.get_attribute("class") or ""
-        if "disabled" in class_attr.lower():
-            return False
+    async def _api_items(self, page: Page, query: str, page_number: int) -> list[dict[str, Any]] | None:
+        """Request one page of search results from the JSON API.
 
-        return True
+        The request goes through the browser context, so it carries the
+        context's cookies and user agent.
 
-    async def _go_to_next_page(self, page: Page) -> None:
-        """Navigate to the next page of results.
+        Args:
+            page: Playwright page whose context performs the request.
+            query: Search query string.
+            page_number: 1-based results page.
+
+        Returns:
+            The page's item objects, or None if the request failed or the
+            response did not have the expected shape.
+        """
+        body = {"searchText": query, **self.API_FILTERS, "page": page_number, "pageSize": self.API_PAGE_SIZE}
+        await self._rate_limit()
+        try:
+            response = await page.context.request.post(self.API_URL, data=body, timeout=30000)
+            self._record_response(response)
+            if not response.ok:
+                logger.debug("ShopGoodwill API returned HTTP %d", response.status)
+                return None
+            items = ((await response.json()).get("searchResults") or {}).get("items")
+        except Exception as e:
+            logger.debug("ShopGoodwill API request failed: %s", e)
+            return None
+
+        return items if isinstance(items, list) else None
+
+    def _api_listing(self, item: dict[str, Any]) -> Listing | None:
+        """Build a Listing from one item in the JSON search response.
 
         Args:
-            page: Playwright page instance.
+            item: Item object from the response's ``searchResults.items`` list.
+
+        Returns:
+            The Listing, or None if the item has no id.
         """
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if next_button:
-            await next_button.click()
-            await page.wait_for_load_state("domcontentloaded")
+        item_id = item.get("itemId")
+        if not item_id:
+            return None
+
+        price = item.get("currentPrice")
+        image = item.get("imageURL")
+        return Listing(
+            url=f"{self.BASE_URL}/item/{item_id}",
+            source=self.NAME,
+            title=item.get("title") or "",
+            price=normalize_price(f"${price:,.2f}" if isinstance(price, (int, float)) else price),
+            description=None,
+            image_url=image if image and image.startswith("http") else None,
+        )
+
+    def _card_listing(self, card: dict[str, Any]) -> Listing | None:
+        """Build a listing from a result card, titling it from the link text if needed."""
+        listing = super()._card_listing(card)
+        if listing is not None and not listing.title:
+            listing.title = card.get("linkText") or ""
+        return listing
 
     async def get_listing_details(self, page: Page, url: str) -> Listing | None:
         """Get detailed information for a specific listing.
@@ -197,47 +243,20 @@ class ShopGoodwillAdapter(MarketplaceAdapter):
             Listing with full details, or None if fetch failed.
         """
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            await self._rate_limit()
-
-            # Extract title
-            title_element = await page.query_selector("h1, .product-title, .item-title")
-            title = ""
-            if title_element:
-                title = await title_element.text_content() or ""
-                title = title.strip()
-
-            # Extract price
-            price_element = await page.query_selector(".current-bid, .price, .product-price")
-            price = None
-            if price_element:
-                price = await price_element.text_content()
-                if price:
-                    price = price.strip()
-
-            # Extract description
-            desc_element = await page.query_selector(".description, .product-description, .item-description")
-            description = None
-            if desc_element:
-                description = await desc_element.text_content()
-                if description:
-                    description = description.strip()
-
-            # Extract image
-            image_element = await page.query_selector(".product-image img, .main-image img, .gallery img")
-            image_url = None
-            if image_element:
-                image_url = await image_element.get_attribute("src")
+            await self._navigate(page, url, wait_until="commit")
+            await self._wait_for_details(page)
+
+            details = await page.evaluate(self._bind_selectors(DETAILS_SCRIPT))
 
             return Listing(
                 url=url,
                 source=self.NAME,
-                title=title,
-                price=price,
-                description=description,
-                image_url=image_url,
+                title=details.get("title") or "",
+                price=normalize_price(details.get("price")),
+                description=details.get("description") or None,
+                image_url=details.get("imageUrl"),
             )
 
         except Exception as e:
-            logger.error(f"Error fetching listing details: {e}")
+            logger.error("Error fetching listing details: %s", e)
             return None
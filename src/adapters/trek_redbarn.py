@@ -1,17 +1,95 @@
 """Trek Red Barn Refresh (certified pre-owned) marketplace adapter."""
 
+import functools
 import logging
 from typing import AsyncIterator
-from urllib.parse import quote_plus
 
 from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.base import MarketplaceAdapter
+from src.adapters.base import MarketplaceAdapter, normalize_price, quote_query
 from src.models import Listing
 
 logger = logging.getLogger(__name__)
 
+# Spec rows worth keeping for bike matching
+KEY_SPECS = ("battery", "motor", "class", "frame", "size", "range")
+
+# Resolves an <img> to its absolute image URL. Lazy-loaded images keep the real
+# URL in data-src behind a placeholder src. Shared by the card and detail scripts.
+IMAGE_URL_JS = """
+    const imageUrlOf = (image) => {
+        if (!image) return null;
+        let imageUrl = image.getAttribute('src');
+        const lower = (imageUrl || '').toLowerCase();
+        const isPlaceholder = !imageUrl
+            || lower.includes('placeholder')
+            || lower.startsWith('data:')
+            || lower.includes('blank.gif')
+            || lower.includes('spacer')
+            || imageUrl.length < 10;
+        if (isPlaceholder) imageUrl = image.getAttribute('data-src');
+        try {
+            return imageUrl ? new URL(imageUrl, document.baseURI).href : null;
+        } catch (e) {
+            return null;
+        }
+    };
+"""
+
+# Maps each product tile to a plain dict in one call (run via locator.evaluate_all).
+# Links and image URLs come back absolute, resolved against the page URL.
+CARDS_SCRIPT = (
+    """
+(cards, selectors) => {
+"""
+    + IMAGE_URL_JS
+    + """
+    return cards.map(card => {
+        const text = (selector) => {
+            const el = card.querySelector(selector);
+            return el ? (el.textContent || '').trim() : null;
+        };
+        const link = card.querySelector(selectors.link);
+
+        return {
+            url: link && link.getAttribute('href') ? link.href : null,
+            title: text(selectors.title),
+            price: text(selectors.price),
+            imageUrl: imageUrlOf(card.querySelector(selectors.image)),
+            category: text(selectors.category)
+        };
+    });
+}
+"""
+)
+
+# Reads every detail-page field, including spec rows, in one call
+DETAILS_SCRIPT = (
+    """
+(selectors) => {
+"""
+    + IMAGE_URL_JS
+    + """
+    const text = (selector) => {
+        const el = document.querySelector(selector);
+        return el ? (el.textContent || '').trim() : null;
+    };
+    const specs = document.querySelector(selectors.specs);
+
+    return {
+        title: text(selectors.detail_title),
+        price: text(selectors.detail_price),
+        description: text(selectors.description),
+        specs: specs
+            ? Array.from(specs.querySelectorAll(selectors.spec_rows), row => (row.textContent || '').trim())
+            : [],
+        imageUrl: imageUrlOf(document.querySelector(selectors.detail_image))
+    };
+}
+"""
+)
+
 
 class TrekRedBarnAdapter(MarketplaceAdapter):
     """Adapter for searching Trek Red Barn Refresh certified pre-owned bikes."""
@@ -22,6 +100,16 @@ class TrekRedBarnAdapter(MarketplaceAdapter):
     # Red Barn Refresh / Certified Pre-Owned section
     CPO_PATH = "/us/en_US/certified-preowned"
 
+    # Tiles per result page, and result pages read per query
+    PAGE_SIZE = 24
+    MAX_PAGES = 3
+
+    # Site search limited to Certified Pre-Owned bikes; format with the quoted query
+    SEARCH_URL = f"{BASE_URL}/us/en_US/search/?q={{query}}&cgid=cpo-bikes&sz={PAGE_SIZE}"
+
+    # Fixed-price CPO pages rarely change; keep fetched details for 6 hours
+    DETAIL_CACHE_TTL = 6 * 3600.0
+
     SELECTORS = {
         "listing": ".product-tile, .product-card, [data-component='product-tile']",
         "title": ".product-tile__title, .product-name, h3 a",
@@ -30,161 +118,96 @@ class TrekRedBarnAdapter(MarketplaceAdapter):
         "image": ".product-tile__image img, .product-image img",
         "category": ".product-tile__category, .category-badge",
         "no_results": ".no-results, .empty-search",
-        "next_page": ".pagination .next, a[aria-label='Next page']",
+        "next_page": ".pagination__next, a[rel='next']",
         # Detail page selectors
         "specs": ".product-specs, .specifications, [data-component='specifications']",
         "description": ".product-description, .description",
+        "spec_rows": ".spec-row, tr, .specification-item",
+        "detail_title": "h1.product-name, h1",
+        "detail_price": ".product-price, .price, [data-component='price']",
+        "detail_image": ".product-image img, .gallery-image img, [data-component='gallery'] img",
     }
 
-    async def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
+    def search(self, page: Page, queries: list[str]) -> AsyncIterator[Listing]:
         """Search Trek Red Barn Refresh and yield listings.
 
+        Each query runs as its own job, up to ``max_concurrency`` at a time
+        in separate tabs.
+
         Args:
             page: Playwright page instance.
             queries: List of search query strings.
 
+        Returns:
+            Async iterator of Listing objects for each result found.
+        """
+        jobs = [functools.partial(self._search_query, query=query) for query in queries]
+        return self._merge_searches(page, jobs)
+
+    async def _search_query(self, page: Page, query: str) -> AsyncIterator[Listing]:
+        """Search Trek Red Barn for one query, up to MAX_PAGES result pages.
+
+        A later page is only requested once the one before it links to it.
+
+        Args:
+            page: Playwright page to search in.
+            query: Search query string.
+
         Yields:
             Listing objects for each result found.
         """
-        for query in queries:
-            logger.info(f"Searching Trek Red Barn for: {query}")
-
-            try:
-                # Navigate to certified pre-owned search
-                # Trek site search format: /us/en_US/search/?q=query&cgid=cpo-bikes
-                search_url = (
-                    f"{self.BASE_URL}/us/en_US/search/"
-                    f"?q={quote_plus(query)}"
-                    f"&cgid=cpo-bikes"  # Certified Pre-Owned category
-                )
-                await page.goto(search_url, wait_until="domcontentloaded")
-                await self._rate_limit()
-
-                # Check for no results
-                no_results = await page.query_selector(self.SELECTORS["no_results"])
-                if no_results:
-                    logger.info(f"No results for query: {query}")
-                    continue
-
-                # Process current page
-                async for listing in self._extract_listings(page):
-                    yield listing
-
-                # Handle pagination (up to 3 pages per query)
-                for page_num in range(2, 4):
-                    if not await self._has_next_page(page):
-                        break
-
-                    await self._go_to_next_page(page)
-                    await self._rate_limit()
-
-                    async for listing in self._extract_listings(page):
-                        yield listing
-
-            except PlaywrightTimeout:
-                logger.warning(f"Timeout searching Trek Red Barn for: {query}")
-            except Exception as e:
-                logger.error(f"Error searching Trek Red Barn: {e}")
-
-    async def _extract_listings(self, page: Page) -> AsyncIterator[Listing]:
-        """Extract listings from current page."""
+        logger.info("Searching Trek Red Barn for: %s", query)
+
         try:
-            await page.wait_for_selector(self.SELECTORS["listing"], timeout=10000)
+            # Navigate to certified pre-owned search
+            search_url = self.SEARCH_URL.format(query=quote_query(query))
+            await self._navigate(page, search_url, wait_until="commit")
+            await self._wait_for_results(page)
+
+            # Check for no results
+            no_results = await page.query_selector(self.SELECTORS["no_results"])
+            if no_results:
+                logger.info("No results for query: %s", query)
+                return
+
+            # The next page loads while this one is consumed
+            async for listing in self._paginate(page, self._extract_listings, max_pages=self.MAX_PAGES):
+                yield listing
+
+        except PlaywrightTimeout:
+            logger.warning("Timeout searching Trek Red Barn for: %s", query)
+        except Exception as e:
+            logger.error("Error searching Trek Red Barn: %s", e)
+
+    async def _extract_listings(self, page: Page) -> list[Listing]:
+        """Extract listings from current page.
+
+        Reads every product tile in one locator.evaluate_all() call. Each tile
+        maps to one result, so fields stay aligned per card.
+        """
+        try:
+            await self._wait_attached(page, self.SELECTORS["listing"])
         except PlaywrightTimeout:
             logger.warning("No listings found on page")
-            return
-
-        listing_elements = await page.query_selector_all(self.SELECTORS["listing"])
-
-        for element in listing_elements:
-            try:
-                # Extract link
-                link_element = await element.query_selector(self.SELECTORS["link"])
-                if not link_element:
-                    continue
-
-                href = await link_element.get_attribute("href")
-                if not href:
-                    continue
-
-                # Ensure full URL
-                url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-
-                # Extract title
-                title_element = await element.query_selector(self.SELECTORS["title"])
-                title = ""
-                if title_element:
-                    title = await title_element.text_content() or ""
-                    title = title.strip()
-
-                if not title:
-                    continue
-
-                # Extract price
-                price_element = await element.query_selector(self.SELECTORS["price"])
-                price = None
-                if price_element:
-                    price = await price_element.text_content()
-                    if price:
-                        price = price.strip()
-
-                # Extract image URL
-                image_element = await element.query_selector(self.SELECTORS["image"])
-                image_url = None
-                if image_element:
-                    image_url = await image_element.get_attribute("src")
-                    # Handle lazy loading - check for placeholder indicators
-                    # Common patterns: placeholder URLs, data URIs, or missing src
-                    if image_url:
-                        is_placeholder = (
-                            "placeholder" in image_url.lower()
-                            or "data:image" in image_url  # Base64 placeholder
-                            or "blank.gif" in image_url.lower()
-                            or "spacer" in image_url.lower()
-                            or image_url.startswith("data:")
-                            or len(image_url) < 10  # Too short to be real URL
-                        )
-                        if is_placeholder:
-                            image_url = await image_element.get_attribute("data-src")
-                    else:
-                        # No src attribute, try data-src for lazy loading
-                        image_url = await image_element.get_attribute("data-src")
-
-                # Extract category badge (e.g., "E-Bike")
-                category_element = await element.query_selector(self.SELECTORS["category"])
-                description = None
-                if category_element:
-                    category = await category_element.text_content()
-                    if category:
-                        description = f"Category: {category.strip()}"
-
-                yield Listing(
-                    url=url,
-                    source=self.NAME,
-                    title=title,
-                    price=price,
-                    description=description,
-                    image_url=image_url,
-                )
-
-            except Exception as e:
-                logger.warning(f"Error extracting listing: {e}")
-
-    async def _has_next_page(self, page: Page) -> bool:
-        """Check if there's a next page of results."""
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if not next_button:
-            return False
-
-        is_disabled = await next_button.get_attribute("disabled")
-        return is_disabled is None
-
-    async def _go_to_next_page(self, page: Page) -> None:
-        """Navigate to the next page of results."""
-        next_button = await page.query_selector(self.SELECTORS["next_page"])
-        if next_button:
-            await next_button.click()
-            await page.wait_for_load_state("domcontentloaded")
+            return []
+
+        cards = await page.locator(self.SELECTORS["listing"]).evaluate_all(
+            self._bind_selectors(CARDS_SCRIPT, takes_elements=True)
+        )
+
+        return [
+            Listing(
+                url=data["url"],
+                source=self.NAME,
+                title=data["title"],
+                price=normalize_price(data.get("price")),
+                # Category badge (e.g., "E-Bike")
+                description=f"Category: {data['category']}" if data.get("category") else None,
+                image_url=data.get("imageUrl"),
+            )
+            for data in cards
+            if data.get("url") and data.get("title")
+        ]
 
     async def get_listing_details(self, page: Page, url: str) -> Listing | None:
         """Get detailed information for a specific listing.
@@ -192,87 +215,41 @@ class TrekRedBarnAdapter(MarketplaceAdapter):
         Extracts bike specifications including battery, class, and frame size.
         """
         try:
-            await page.goto(url, wait_until="domcontentloaded")
-            await self._rate_limit()
-
-            # Extract title
-            title_element = await page.query_selector("h1.product-name, h1")
-            title = ""
-            if title_element:
-                title = await title_element.text_content() or ""
-                title = title.strip()
-
-            # Extract price
-            price_element = await page.query_selector(".product-price, .price, [data-component='price']")
-            price = None
-            if price_element:
-                price = await price_element.text_content()
-                if price:
-                    price = price.strip()
-
-            # Extract description
-            desc_element = await page.query_selector(self.SELECTORS["description"])
-            description = None
-            if desc_element:
-                description = await desc_element.text_content()
-                if description:
-                    description = description.strip()[:500]
-
-            # Extract specifications (critical for bike matching)
-            specs_text = await self._extract_specifications(page)
-            if specs_text:
-                if description:
-                    description = f"{description}\n\nSpecifications:\n{specs_text}"
-                else:
-                    description = f"Specifications:\n{specs_text}"
-
-            # Extract image
-            image_element = await page.query_selector(
-                ".product-image img, .gallery-image img, [data-component='gallery'] img"
+            await self._navigate(page, url, wait_until="commit")
+            await self._wait_for_details(page)
+
+            details = await page.evaluate(self._bind_selectors(DETAILS_SCRIPT))
+
+            # Specifications are critical for bike matching
+            description = (details.get("description") or "")[:500]
+            specs_text = self._filter_specifications(details.get("specs") or [])
+            description = (
+                "\n\n".join(part for part in (description, specs_text and f"Specifications:\n{specs_text}") if part)
+                or None
             )
-            image_url = None
-            if image_element:
-                image_url = await image_element.get_attribute("src")
 
             return Listing(
                 url=url,
                 source=self.NAME,
-                title=title,
-                price=price,
+                title=details.get("title") or "",
+                price=normalize_price(details.get("price")),
                 description=description,
-                image_url=image_url,
+                image_url=details.get("imageUrl"),
             )
 
         except Exception as e:
-            logger.error(f"Error fetching Trek Red Barn listing details: {e}")
+            logger.error("Error fetching Trek Red Barn listing details: %s", e)
             return None
 
-    async def _extract_specifications(self, page: Page) -> str | None:
-        """Extract bike specifications from product page.
-
-        Looks for key e-bike specs: battery, motor, class, frame size.
-        """
-        try:
-            specs_element = await page.query_selector(self.SELECTORS["specs"])
-            if not specs_element:
-                return None
-
-            # Get all spec rows
-            spec_rows = await specs_element.query_selector_all(".spec-row, tr, .specification-item")
-
-            specs = []
-            key_specs = ["battery", "motor", "class", "frame", "size", "range"]
-
-            for row in spec_rows:
-                text = await row.text_content()
-                if text:
-                    text = text.strip().lower()
-                    # Include if it contains key bike specs
-                    if any(key in text for key in key_specs):
-                        specs.append(text)
+    @staticmethod
+    def _filter_specifications(rows: list[str]) -> str | None:
+        """Keep the spec rows that mention key e-bike specs.
 
-            return "\n".join(specs) if specs else None
+        Args:
+            rows: Text of each specification row.
 
-        except Exception as e:
-            logger.warning(f"Error extracting specifications: {e}")
-            return None
+        Returns:
+            Matching rows lowercased and newline-joined, or None if none match.
+        """
+        texts = (row.strip().lower() for row in rows)
+        return "\n".join(text for text in texts if any(key in text for key in KEY_SPECS)) or None
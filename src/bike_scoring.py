@@ -1,16 +1,149 @@
 """Relevance scoring engine for Trek Allant+ 7S bike matching criteria."""
 
 import re
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Literal
 
 from src.models import BikeScoringWeights, Listing, ScoredListing
 
+Confidence = Literal["high", "medium", "low"]
+
+
+def _any_of(*patterns: str) -> re.Pattern[str]:
+    """Compile alternative patterns into one regex matching any of them.
+
+    Searching with the combined regex scans the text once rather than once
+    per pattern.
+
+    Args:
+        *patterns: Regex sources; each is wrapped in a non-capturing group.
+
+    Returns:
+        Compiled alternation of the patterns.
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+def _tagged_scan(starts: str, **categories: re.Pattern[str]) -> re.Pattern[str]:
+    """Compile category patterns into one regex that tags each match with its category.
+
+    Every alternative sits inside a lookahead, so ``finditer`` tries all
+    categories at each position in a single pass over the text and
+    ``match.lastgroup`` names the category found. Where several categories
+    match at the same position, the earliest one listed wins. Positions
+    whose character is not in ``starts`` are skipped by a single character
+    class test before any alternative is tried.
+
+    Args:
+        starts: Every character a category match can begin with.
+        **categories: Category name -> compiled pattern, in priority order.
+
+    Returns:
+        Compiled scan pattern with one named group per category.
+    """
+    alternatives = "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in categories.items())
+    return re.compile(f"(?=[{re.escape(starts)}])(?={alternatives})")
+
+
+def _confidence_table(thresholds: dict[str, int]) -> tuple[Confidence, ...]:
+    """Precompute the confidence level of every score from 0 to 100.
+
+    Args:
+        thresholds: Minimum scores for "high" and "medium" confidence.
+
+    Returns:
+        Tuple indexed by score.
+    """
+    return tuple(
+        "high" if score >= thresholds["high"] else "medium" if score >= thresholds["medium"] else "low"
+        for score in range(101)
+    )
+
 
 class BikeRelevanceScorer:
     """Scores listings based on match criteria for Trek Allant+ 7S."""
 
     THRESHOLDS = {"high": 70, "medium": 40}
 
+    # Confidence level for each (clamped) score, built from THRESHOLDS
+    CONFIDENCE_BY_SCORE = _confidence_table(THRESHOLDS)
+
+    # Patterns are matched against lowercased title + description text
+
+    # Exact Allant+ 7S match (various formats)
+    ALLANT_7S_PATTERN = _any_of(
+        r"allant\+?\s*7s",
+        r"allant\s+plus\s+7s",
+        r"allant\+\s*7\s*s",
+    )
+
+    # Allant+ 7 (wrong model - Class 1); (?!\s*s) excludes "7s" in lowercased text
+    ALLANT_7_PATTERN = _any_of(
+        r"allant\+?\s*7(?!\s*s)",  # Allant+ 7 but not 7S
+        r"allant\s+plus\s+7(?!\s*s)",
+    )
+
+    # Generic Allant+ mention (model unknown)
+    ALLANT_PLUS_PATTERN = _any_of(
+        r"allant\+",
+        r"allant plus",
+        r"allant \+",
+    )
+
+    CLASS_3_PATTERN = _any_of(
+        r"class\s*3",
+        r"28\s*mph",
+        r"28mph",
+        r"speed\s+pedelec",
+    )
+
+    CLASS_1_PATTERN = _any_of(
+        r"class\s*1",
+        r"20\s*mph",
+        r"20mph",
+    )
+
+    BATTERY_625_PATTERN = _any_of(r"625 ?wh")
+    BATTERY_500_PATTERN = _any_of(r"500 ?wh")
+
+    RANGE_EXTENDER_PATTERN = _any_of(
+        r"range\s*extender",
+        r"second\s*battery",
+        r"dual\s*battery",
+        r"2\s*batteries",
+        r"two\s*batteries",
+        r"extra\s*battery",
+        r"additional\s*battery",
+    )
+
+    # Large frame; patterns require explicit size/frame context to avoid false positives
+    LARGE_FRAME_PATTERN = _any_of(
+        r"\blarge\b",  # Word "large" with word boundaries
+        r"size[:\s]+l(?:\b|\s|$|,)",  # "size: L" or "size L" with proper termination
+        r"frame[:\s]+l(?:\b|\s|$|,)",  # "frame: L" or "frame L" with proper termination
+        r"size[:\s]+large",  # "size: large" or "size large"
+        r"\(l\)",  # "(L)" common in listings
+        r"5[5-8]\s*cm",  # 55-58cm = Large frame sizes
+    )
+
+    # Every category in one pass; specific models precede the generic Allant+
+    # mention, which can start at the same position. The scan relies on
+    # lookaheads (the wrapper, and the Allant+ 7 "not 7S" check), so it needs a
+    # backtracking engine: DFA matchers such as Hyperscan reject lookarounds.
+    CATEGORY_SCAN = _tagged_scan(
+        "a2c65sfrtdel(",
+        model_allant_7s=ALLANT_7S_PATTERN,
+        model_allant_7=ALLANT_7_PATTERN,
+        model_allant_plus=ALLANT_PLUS_PATTERN,
+        class_3=CLASS_3_PATTERN,
+        class_1=CLASS_1_PATTERN,
+        battery_625wh=BATTERY_625_PATTERN,
+        battery_500wh=BATTERY_500_PATTERN,
+        range_extender=RANGE_EXTENDER_PATTERN,
+        frame_large=LARGE_FRAME_PATTERN,
+    )
+
     def __init__(self, weights: BikeScoringWeights | None = None):
         """Initialize scorer with optional custom weights.
 
@@ -18,6 +151,8 @@ class BikeRelevanceScorer:
             weights: Custom scoring weights. Uses defaults if None.
         """
         self.weights = weights or BikeScoringWeights()
+        # Matched categories -> (score, confidence, factors); at most one entry per category combination
+        self._outcomes: dict[frozenset[str], tuple[int, Confidence, tuple[str, ...]]] = {}
 
     def score(self, listing: Listing) -> ScoredListing:
         """Score a listing based on Trek Allant+ 7S match criteria.
@@ -28,32 +163,53 @@ class BikeRelevanceScorer:
         Returns:
             ScoredListing with score, confidence level, and matched factors.
         """
-        score = 0
-        factors: list[str] = []
+        return self._score_matched(listing, self._match_categories(self._listing_text(listing)))
 
-        # Combine title and description for analysis
-        text = f"{listing.title} {listing.description or ''}".lower()
+    def score_many(self, listings: list[Listing]) -> list[ScoredListing]:
+        """Score a batch of listings with one scan over all their text.
 
-        # Model analysis (most important)
-        score, factors = self._score_model(text, score, factors)
+        The listings' texts are joined with NUL separators and each match is
+        attributed to its listing by offset. No scoring pattern can consume a
+        NUL, and the boundary checks treat one like the end of the text, so
+        every listing scores exactly as it would with score(), NULs in its own
+        text included.
 
-        # Class analysis (Class 3 vs Class 1)
-        score, factors = self._score_class(text, score, factors)
+        Args:
+            listings: The listings to score.
 
-        # Battery analysis
-        score, factors = self._score_battery(text, score, factors)
+        Returns:
+            ScoredListing for each listing, in the same order.
+        """
+        texts = [self._listing_text(listing) for listing in listings]
+        # Offset where each listing's text starts in the joined string
+        starts = list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
 
-        # Range extender analysis
-        score, factors = self._score_range_extender(text, score, factors)
+        matched: list[set[str]] = [set() for _ in listings]
+        for match in self.CATEGORY_SCAN.finditer("\0".join(texts)):
+            if match.lastgroup:
+                matched[bisect_right(starts, match.start()) - 1].add(match.lastgroup)
 
-        # Frame size analysis
-        score, factors = self._score_frame(text, score, factors)
+        return [self._score_matched(listing, frozenset(categories)) for listing, categories in zip(listings, matched)]
 
-        # Cap score at 100, floor at 0
-        score = max(0, min(score, 100))
+    @staticmethod
+    def _listing_text(listing: Listing) -> str:
+        """Combine title and description into the lowercased text that is scored."""
+        return f"{listing.title} {listing.description or ''}".lower()
 
-        # Classify confidence
-        confidence = self._classify_confidence(score)
+    def _score_matched(self, listing: Listing, matched: frozenset[str]) -> ScoredListing:
+        """Score a listing from the categories found in its text.
+
+        Args:
+            listing: The listing being scored.
+            matched: Names of the CATEGORY_SCAN groups found in its text.
+
+        Returns:
+            ScoredListing with score, confidence level, and matched factors.
+        """
+        outcome = self._outcomes.get(matched)
+        if outcome is None:
+            outcome = self._outcomes[matched] = self._score_categories(matched)
+        score, confidence, factors = outcome
 
         return ScoredListing(
             url=listing.url,
@@ -62,12 +218,59 @@ class BikeRelevanceScorer:
             price=listing.price,
             score=score,
             confidence=confidence,
-            matched_factors=factors,
+            matched_factors=list(factors),
             description=listing.description,
             image_url=listing.image_url,
         )
 
-    def _score_model(self, text: str, score: int, factors: list[str]) -> tuple[int, list[str]]:
+    def _score_categories(self, matched: frozenset[str]) -> tuple[int, Confidence, tuple[str, ...]]:
+        """Apply the weights to a set of matched categories.
+
+        The result depends only on the categories, so it is computed once per
+        combination and memoized by _score_matched().
+
+        Args:
+            matched: Names of the CATEGORY_SCAN groups found in a listing's text.
+
+        Returns:
+            Capped score, confidence level, and matched factors.
+        """
+        score = 0
+        factors: list[str] = []
+
+        # Model analysis (most important)
+        score, factors = self._score_model(matched, score, factors)
+
+        # Class analysis (Class 3 vs Class 1)
+        score, factors = self._score_class(matched, score, factors)
+
+        # Battery analysis
+        score, factors = self._score_battery(matched, score, factors)
+
+        # Range extender analysis
+        score, factors = self._score_range_extender(matched, score, factors)
+
+        # Frame size analysis
+        score, factors = self._score_frame(matched, score, factors)
+
+        # Cap score at 100, floor at 0
+        score = max(0, min(score, 100))
+
+        # Classify confidence
+        return score, self._classify_confidence(score), tuple(factors)
+
+    def _match_categories(self, text: str) -> frozenset[str]:
+        """Find which scoring categories occur in the text.
+
+        Args:
+            text: Lowercased listing title and description.
+
+        Returns:
+            Names of the CATEGORY_SCAN groups that matched.
+        """
+        return frozenset(match.lastgroup for match in self.CATEGORY_SCAN.finditer(text) if match.lastgroup)
+
+    def _score_model(self, matched: frozenset[str], score: int, factors: list[str]) -> tuple[int, list[str]]:
         """Score based on model identification.
 
         Priority:
@@ -76,113 +279,73 @@ class BikeRelevanceScorer:
         3. Generic Allant+ - partial points
         """
         # Check for exact Allant+ 7S match (various formats)
-        allant_7s_patterns = [
-            r"allant\+?\s*7s",
-            r"allant\s+plus\s+7s",
-            r"allant\+\s*7\s*s",
-        ]
-        if any(re.search(pattern, text) for pattern in allant_7s_patterns):
+        if "model_allant_7s" in matched:
             score += self.weights.model_allant_7s
             factors.append("model: Allant+ 7S")
             return score, factors
 
         # Check for Allant+ 7 (wrong model - Class 1)
-        # Note: text is already lowercased (line 35), so (?!\s*s) correctly excludes "7s"
-        allant_7_patterns = [
-            r"allant\+?\s*7(?!\s*s)",  # Allant+ 7 but not 7S
-            r"allant\s+plus\s+7(?!\s*s)",
-        ]
-        if any(re.search(pattern, text) for pattern in allant_7_patterns):
+        if "model_allant_7" in matched:
             # This is likely the Class 1 model - apply penalty
             score += self.weights.model_allant_7_penalty
             factors.append("model: Allant+ 7 (WRONG - Class 1)")
             return score, factors
 
         # Check for generic Allant+ mention
-        if "allant+" in text or "allant plus" in text or "allant +" in text:
+        if "model_allant_plus" in matched:
             score += self.weights.model_allant_plus
             factors.append("model: Allant+ (generic)")
 
         return score, factors
 
-    def _score_class(self, text: str, score: int, factors: list[str]) -> tuple[int, list[str]]:
+    def _score_class(self, matched: frozenset[str], score: int, factors: list[str]) -> tuple[int, list[str]]:
         """Score based on e-bike class (Class 3 = 28mph, Class 1 = 20mph)."""
         # Check for Class 3 indicators
-        class_3_patterns = [
-            r"class\s*3",
-            r"28\s*mph",
-            r"28mph",
-            r"speed\s+pedelec",
-        ]
-        if any(re.search(pattern, text) for pattern in class_3_patterns):
+        if "class_3" in matched:
             score += self.weights.class_3
             factors.append("class: 3 (28 mph)")
             return score, factors
 
         # Check for Class 1 indicators (penalty)
-        class_1_patterns = [
-            r"class\s*1",
-            r"20\s*mph",
-            r"20mph",
-        ]
-        if any(re.search(pattern, text) for pattern in class_1_patterns):
+        if "class_1" in matched:
             score += self.weights.class_1_penalty
             factors.append("class: 1 (20 mph) - REJECT")
 
         return score, factors
 
-    def _score_battery(self, text: str, score: int, factors: list[str]) -> tuple[int, list[str]]:
+    def _score_battery(self, matched: frozenset[str], score: int, factors: list[str]) -> tuple[int, list[str]]:
         """Score based on battery capacity (625Wh required, 500Wh insufficient)."""
         # Check for 625Wh battery
-        if "625wh" in text or "625 wh" in text:
+        if "battery_625wh" in matched:
             score += self.weights.battery_625wh
             factors.append("battery: 625Wh")
             return score, factors
 
         # Check for 500Wh battery (penalty - insufficient)
-        if "500wh" in text or "500 wh" in text:
+        if "battery_500wh" in matched:
             score += self.weights.battery_500wh_penalty
             factors.append("battery: 500Wh (insufficient)")
 
         return score, factors
 
-    def _score_range_extender(self, text: str, score: int, factors: list[str]) -> tuple[int, list[str]]:
+    def _score_range_extender(self, matched: frozenset[str], score: int, factors: list[str]) -> tuple[int, list[str]]:
         """Score based on range extender presence."""
-        range_extender_patterns = [
-            r"range\s*extender",
-            r"second\s*battery",
-            r"dual\s*battery",
-            r"2\s*batteries",
-            r"two\s*batteries",
-            r"extra\s*battery",
-            r"additional\s*battery",
-        ]
-        if any(re.search(pattern, text) for pattern in range_extender_patterns):
+        if "range_extender" in matched:
             score += self.weights.range_extender
             factors.append("range extender")
 
         return score, factors
 
-    def _score_frame(self, text: str, score: int, factors: list[str]) -> tuple[int, list[str]]:
+    def _score_frame(self, matched: frozenset[str], score: int, factors: list[str]) -> tuple[int, list[str]]:
         """Score based on frame size (Large/L preferred)."""
         # Check for Large frame
-        # Note: Patterns require explicit size/frame context to avoid false positives
-        # Text is already lowercased, so patterns only need lowercase
-        large_patterns = [
-            r"\blarge\b",  # Word "large" with word boundaries
-            r"size[:\s]+l(?:\b|\s|$|,)",  # "size: L" or "size L" with proper termination
-            r"frame[:\s]+l(?:\b|\s|$|,)",  # "frame: L" or "frame L" with proper termination
-            r"size[:\s]+large",  # "size: large" or "size large"
-            r"\(l\)",  # "(L)" common in listings
-            r"5[5-8]\s*cm",  # 55-58cm = Large frame sizes
-        ]
-        if any(re.search(pattern, text) for pattern in large_patterns):
+        if "frame_large" in matched:
             score += self.weights.frame_large
             factors.append("frame: Large")
 
         return score, factors
 
-    def _classify_confidence(self, score: int) -> Literal["high", "medium", "low"]:
+    def _classify_confidence(self, score: int) -> Confidence:
         """Classify confidence level based on score.
 
         Args:
@@ -191,9 +354,4 @@ class BikeRelevanceScorer:
         Returns:
             Confidence level: 'high', 'medium', or 'low'.
         """
-        if score >= self.THRESHOLDS["high"]:
-            return "high"
-        elif score >= self.THRESHOLDS["medium"]:
-            return "medium"
-        else:
-            return "low"
+        return self.CONFIDENCE_BY_SCORE[score]
@@ -4,10 +4,10 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from src.adapters import MarketplaceAdapter, PinkbikeAdapter, TrekRedBarnAdapter
+from src.adapters import AdapterMap, select_adapters
 from src.bike_scoring import BikeRelevanceScorer
 from src.models import BikeScoringWeights
-from src.ring_search import SearchOrchestrator
+from src.ring_search import SearchOrchestrator, load_config
 
 logger = logging.getLogger(__name__)
 
@@ -21,21 +21,18 @@ class BikeSearchOrchestrator(SearchOrchestrator):
     """
 
     # Extend adapter map with bike-specific marketplaces
-    ADAPTER_MAP: dict[str, type[MarketplaceAdapter]] = {
-        **SearchOrchestrator.ADAPTER_MAP,
-        "pinkbike": PinkbikeAdapter,
-        "trek_redbarn": TrekRedBarnAdapter,
-    }
+    ADAPTER_MAP: AdapterMap = select_adapters(*SearchOrchestrator.ADAPTER_MAP, "pinkbike", "trek_redbarn")
 
-    def __init__(self, config_path: Path, adaptive: bool = False):
+    def __init__(self, config_path: Path, adaptive: bool = False, config: dict[str, Any] | None = None):
         """Initialize bike search orchestrator.
 
         Args:
             config_path: Path to bike_config.yaml file.
             adaptive: Enable adaptive search discovery mode.
+            config: Configuration already parsed from ``config_path``, to skip reading it again.
         """
         # Call parent init (sets up dedup, logger, capture, etc.)
-        super().__init__(config_path, adaptive)
+        super().__init__(config_path, adaptive, config)
 
         # Override scorer with BikeRelevanceScorer
         self._init_bike_scorer()
@@ -65,40 +62,12 @@ class BikeSearchOrchestrator(SearchOrchestrator):
 
         self.scorer = BikeRelevanceScorer(weights=weights)  # type: ignore[assignment]
 
-    def _create_adapter(self, marketplace: dict[str, Any]) -> MarketplaceAdapter | None:
-        """Create adapter for a marketplace configuration.
-
-        Extended to handle bike-specific adapters.
-
-        Args:
-            marketplace: Marketplace configuration dictionary.
-
-        Returns:
-            Configured adapter instance, or None if unknown marketplace.
-        """
-        name = marketplace.get("name", "").lower()
-
-        # Use parent method for common adapters
-        if name in SearchOrchestrator.ADAPTER_MAP:
-            return super()._create_adapter(marketplace)
-
-        # Handle bike-specific adapters
-        if name not in self.ADAPTER_MAP:
-            logger.warning(f"Unknown marketplace: {name}")
-            return None
-
-        adapter_class = self.ADAPTER_MAP[name]
-
-        return adapter_class(
-            min_delay=self.min_delay,
-            max_delay=self.max_delay,
-        )
-
 
 def create_orchestrator(config_path: Path, adaptive: bool = False) -> SearchOrchestrator:
     """Factory function to create appropriate orchestrator based on config.
 
     Examines the config file to determine whether to use ring or bike search.
+    The file is parsed once and the result handed to the orchestrator.
 
     Args:
         config_path: Path to config file.
@@ -107,15 +76,12 @@ def create_orchestrator(config_path: Path, adaptive: bool = False) -> SearchOrch
     Returns:
         Appropriate orchestrator instance.
     """
-    import yaml
-
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    config = load_config(config_path)
 
     # Check if this is a bike config (has target_bike key)
     if "target_bike" in config:
         logger.info("Detected bike search configuration")
-        return BikeSearchOrchestrator(config_path, adaptive)
+        return BikeSearchOrchestrator(config_path, adaptive, config)
 
     # Default to ring search
-    return SearchOrchestrator(config_path, adaptive)
+    return SearchOrchestrator(config_path, adaptive, config)
@@ -1,15 +1,26 @@
 """Screenshot capture for promising listings."""
 
+import asyncio
 import logging
+import os
+import shutil
 from datetime import datetime
 from pathlib import Path
+from typing import Sequence
 
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Page, ViewportSize
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.models import ScoredListing
 
 logger = logging.getLogger(__name__)
 
+# Viewport for consistent captures; set once when the browser context is created
+VIEWPORT: ViewportSize = {"width": 1920, "height": 1080}
+
+# How long to let a listing settle after DOMContentLoaded before capturing (ms)
+SETTLE_TIMEOUT_MS = 5000
+
 
 class ScreenshotCapture:
     """Captures full-page screenshots of listings with organized output."""
@@ -21,30 +32,42 @@ class ScreenshotCapture:
             output_dir: Base directory for screenshot output.
         """
         self.output_dir = Path(output_dir)
+        # (date string, folder) of the last folder created, reused until the date rolls over
+        self._date_cache: tuple[str, Path] | None = None
 
-    def _get_date_folder(self) -> Path:
+    def _get_date_folder(self, now: datetime | None = None) -> Path:
         """Get or create today's screenshot folder.
 
+        The folder is created once per date and then reused.
+
+        Args:
+            now: Current time. Defaults to ``datetime.now()``.
+
         Returns:
             Path to today's date-based folder.
         """
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        date_str = (now or datetime.now()).strftime("%Y-%m-%d")
+        if self._date_cache is not None and self._date_cache[0] == date_str:
+            return self._date_cache[1]
         date_folder = self.output_dir / "screenshots" / date_str
         date_folder.mkdir(parents=True, exist_ok=True)
+        self._date_cache = (date_str, date_folder)
         return date_folder
 
-    def _generate_filename(self, listing: ScoredListing) -> str:
+    def _generate_filename(self, listing: ScoredListing, now: datetime | None = None) -> str:
         """Generate filename for screenshot.
 
         Format: {confidence}_{source}_{timestamp}.png
 
         Args:
             listing: The scored listing being captured.
+            now: Current time. Defaults to ``datetime.now()``.
 
         Returns:
             Filename string.
         """
-        timestamp = datetime.now().strftime("%H%M%S")
+        # Microseconds keep concurrent captures of one source from sharing a name
+        timestamp = (now or datetime.now()).strftime("%H%M%S_%f")
         # Clean source name (remove special chars)
         source = listing.source.replace("/", "_").replace(":", "")
         return f"{listing.confidence}_{source}_{timestamp}.png"
@@ -52,6 +75,8 @@ class ScreenshotCapture:
     async def capture(self, page: Page, listing: ScoredListing) -> Path | None:
         """Capture full-page screenshot of a listing.
 
+        The page should come from a context created with ``viewport=VIEWPORT``.
+
         Args:
             page: Playwright page instance.
             listing: The scored listing to capture.
@@ -63,15 +88,16 @@ class ScreenshotCapture:
             # Navigate to listing URL
             await page.goto(listing.url, wait_until="domcontentloaded")
 
-            # Wait for content to load
-            await page.wait_for_load_state("networkidle", timeout=15000)
-
-            # Set viewport for consistent captures
-            await page.set_viewport_size({"width": 1920, "height": 1080})
+            # Give late content a bounded chance to load; capture what is there after that
+            try:
+                await page.wait_for_load_state("networkidle", timeout=SETTLE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Listing still loading after {SETTLE_TIMEOUT_MS}ms: {listing.url}")
 
-            # Generate path
-            date_folder = self._get_date_folder()
-            filename = self._generate_filename(listing)
+            # Generate path from one clock reading
+            now = datetime.now()
+            date_folder = self._get_date_folder(now)
+            filename = self._generate_filename(listing, now)
             filepath = date_folder / filename
 
             # Capture full page screenshot
@@ -84,6 +110,47 @@ class ScreenshotCapture:
             logger.error(f"Error capturing screenshot for {listing.url}: {e}")
             return None
 
+    async def capture_batch(
+        self,
+        context: BrowserContext,
+        listings: Sequence[ScoredListing],
+        max_concurrency: int = 5,
+    ) -> list[Path | None]:
+        """Capture several listings concurrently over a small pool of tabs.
+
+        Up to ``max_concurrency`` tabs are opened in ``context`` once per
+        batch, and each keeps taking the next listing until none are left, so
+        tabs are reused rather than opened per listing. They share the
+        context's viewport, cookies and warm connections.
+
+        Args:
+            context: Browser context to open capture tabs in.
+            listings: Scored listings to capture.
+            max_concurrency: Maximum number of tabs capturing at once.
+
+        Returns:
+            Screenshot path or None for each listing, in input order.
+        """
+        paths: list[Path | None] = [None] * len(listings)
+        # Shared by all tabs; each index is taken by exactly one of them
+        pending = iter(range(len(listings)))
+
+        async def run_tab() -> None:
+            page = await context.new_page()
+            try:
+                for index in pending:
+                    paths[index] = await self.capture(page, listings[index])
+            finally:
+                await page.close()
+
+        tab_count = min(max_concurrency, len(listings))
+        results = await asyncio.gather(*(run_tab() for _ in range(tab_count)), return_exceptions=True)
+        for result in results:
+            # Listings a failed tab did not reach are taken by the other tabs
+            if isinstance(result, BaseException):
+                logger.error(f"Error in capture tab: {result}")
+        return paths
+
     async def capture_with_existing_page(self, page: Page, listing: ScoredListing) -> Path | None:
         """Capture screenshot from page already showing the listing.
 
@@ -100,9 +167,10 @@ class ScreenshotCapture:
             # Set viewport for consistent captures
             await page.set_viewport_size({"width": 1920, "height": 1080})
 
-            # Generate path
-            date_folder = self._get_date_folder()
-            filename = self._generate_filename(listing)
+            # Generate path from one clock reading
+            now = datetime.now()
+            date_folder = self._get_date_folder(now)
+            filename = self._generate_filename(listing, now)
             filepath = date_folder / filename
 
             # Capture full page screenshot
@@ -118,6 +186,9 @@ class ScreenshotCapture:
     def copy_to_high_confidence(self, screenshot_path: Path) -> Path | None:
         """Copy high-confidence screenshot to special folder.
 
+        The copy is a hard link to the original where the filesystem allows
+        it, so no image bytes are rewritten; otherwise the file is copied.
+
         Args:
             screenshot_path: Path to the original screenshot.
 
@@ -125,13 +196,15 @@ class ScreenshotCapture:
             Path to the copy in high_confidence folder, or None if failed.
         """
         try:
-            import shutil
-
             high_conf_dir = self.output_dir / "potential_matches" / "high_confidence"
             high_conf_dir.mkdir(parents=True, exist_ok=True)
 
             dest_path = high_conf_dir / screenshot_path.name
-            shutil.copy2(screenshot_path, dest_path)
+            try:
+                os.link(screenshot_path, dest_path)
+            except OSError:
+                # Different filesystem, no hard link support, or an existing copy to overwrite
+                shutil.copy2(screenshot_path, dest_path)
 
             logger.info(f"Copied to high confidence: {dest_path}")
             return dest_path
@@ -1,15 +1,21 @@
 """Base class for search discovery providers."""
 
-import asyncio
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Sequence
 from dataclasses import dataclass, field
+from operator import attrgetter
 
 from playwright.async_api import Page
 
+from src.merge import Job, merge_jobs
+from src.ratelimit import TokenBucket
+
 logger = logging.getLogger(__name__)
 
+# Discovery job: produces results using the tab it is given
+DiscoveryJob = Callable[[Page], AsyncIterator["DiscoveryResult"]]
+
 
 @dataclass
 class DiscoveryResult:
@@ -33,6 +39,37 @@ class DiscoveryConfig:
     site_filters: list[str] = field(default_factory=list)  # e.g., ["site:ebay.com"]
 
 
+def _bind_jobs(page: Page, jobs: Sequence[DiscoveryJob], *, new_tabs: bool) -> list[Job[DiscoveryResult]]:
+    """Bind discovery jobs to the tabs they run in.
+
+    Args:
+        page: Playwright page instance whose context hosts the job tabs.
+        jobs: Discovery jobs to run.
+        new_tabs: Whether each job gets a tab of its own; otherwise every job
+            is handed ``page`` and must not navigate it.
+
+    Returns:
+        Jobs ready for ``merge_jobs``.
+    """
+
+    def bind(job: DiscoveryJob) -> Job[DiscoveryResult]:
+        async def run() -> AsyncIterator[DiscoveryResult]:
+            if not new_tabs:
+                async for result in job(page):
+                    yield result
+                return
+            job_page = await page.context.new_page()
+            try:
+                async for result in job(job_page):
+                    yield result
+            finally:
+                await job_page.close()
+
+        return run
+
+    return [bind(job) for job in jobs]
+
+
 class SearchDiscovery(ABC):
     """Abstract base class for search engine discovery providers.
 
@@ -46,19 +83,24 @@ class SearchDiscovery(ABC):
         self,
         rate_limit_delay: float = 2.0,
         max_results: int = 20,
+        max_concurrency: int = 3,
     ):
         """Initialize discovery provider.
 
         Args:
             rate_limit_delay: Delay between requests in seconds.
             max_results: Maximum results to return per query.
+            max_concurrency: Maximum number of searches running at once.
         """
         self.rate_limit_delay = rate_limit_delay
         self.max_results = max_results
+        self.max_concurrency = max_concurrency
+        # Shared by concurrent searches, so the request rate does not grow with them
+        self._limiter = TokenBucket(max_rate=1, time_period=rate_limit_delay)
 
     async def _rate_limit(self) -> None:
-        """Apply rate limiting delay."""
-        await asyncio.sleep(self.rate_limit_delay)
+        """Wait for this provider's next request slot."""
+        await self._limiter.acquire()
 
     @abstractmethod
     def search(self, page: Page, query: str, site_filter: str | None = None) -> AsyncGenerator[DiscoveryResult, None]:
@@ -79,33 +121,47 @@ class SearchDiscovery(ABC):
         page: Page,
         queries: list[str],
         site_filters: list[str] | None = None,
+        *,
+        shared: bool = False,
     ) -> AsyncGenerator[DiscoveryResult, None]:
         """Discover marketplace listings across multiple queries.
 
+        Every (query, site filter) pair is searched concurrently in a tab of
+        its own, at most ``max_concurrency`` at once. A single search runs
+        directly on ``page`` so no extra tab is opened, unless the page is
+        shared.
+
         Args:
-            page: Playwright page instance.
+            page: Playwright page instance whose context hosts the search tabs.
             queries: List of search queries.
             site_filters: Optional list of site restrictions.
+            shared: Whether other searches use ``page`` at the same time, so
+                it must not be navigated.
 
         Yields:
             Deduplicated DiscoveryResult objects.
         """
-        seen_urls: set[str] = set()
         # List of site filter strings or [None] for no filter
         filter_list: list[str | None] = list(site_filters) if site_filters else [None]
 
-        for query in queries:
-            for site_filter in filter_list:
+        def job(query: str, site_filter: str | None) -> DiscoveryJob:
+            async def run(job_page: Page) -> AsyncIterator[DiscoveryResult]:
                 try:
-                    async for result in self.search(page, query, site_filter):
-                        # Deduplicate by URL
-                        if result.url not in seen_urls:
-                            seen_urls.add(result.url)
-                            result.source = self.NAME
-                            yield result
+                    async for result in self.search(job_page, query, site_filter):
+                        yield result
                 except Exception as e:
                     logger.error(f"Error in {self.NAME} discovery: {e}")
 
+            return run
+
+        jobs = [job(query, site_filter) for query in queries for site_filter in filter_list]
+        new_tabs = shared or len(jobs) > 1
+        bound = _bind_jobs(page, jobs, new_tabs=new_tabs)
+        # Deduplicate by URL
+        async for result in merge_jobs(bound, self.max_concurrency, key=attrgetter("url"), label="discovery tab"):
+            result.source = self.NAME
+            yield result
+
 
 class AggregatedDiscovery:
     """Aggregates results from multiple search discovery providers."""
@@ -124,23 +180,33 @@ class AggregatedDiscovery:
         queries: list[str],
         site_filters: list[str] | None = None,
     ) -> AsyncGenerator[DiscoveryResult, None]:
-        """Discover listings from all providers.
+        """Discover listings from all providers concurrently.
+
+        Providers run side by side, so a slow search engine does not hold up
+        the others. Each opens the tabs for its own searches, so several
+        providers share ``page`` without navigating it.
 
         Args:
-            page: Playwright page instance.
+            page: Playwright page instance whose context hosts the search tabs.
             queries: List of search queries.
             site_filters: Optional list of site restrictions.
 
         Yields:
-            Deduplicated DiscoveryResult objects from all providers.
+            Deduplicated DiscoveryResult objects from all providers, in arrival order.
         """
-        seen_urls: set[str] = set()
+        shared = len(self.providers) > 1
 
-        for provider in self.providers:
-            try:
-                async for result in provider.discover(page, queries, site_filters):
-                    if result.url not in seen_urls:
-                        seen_urls.add(result.url)
+        def job(provider: SearchDiscovery) -> DiscoveryJob:
+            async def run(provider_page: Page) -> AsyncIterator[DiscoveryResult]:
+                try:
+                    async for result in provider.discover(provider_page, queries, site_filters, shared=shared):
                         yield result
-            except Exception as e:
-                logger.error(f"Error with provider {provider.NAME}: {e}")
+                except Exception as e:
+                    logger.error(f"Error with provider {provider.NAME}: {e}")
+
+            return run
+
+        jobs = [job(provider) for provider in self.providers]
+        bound = _bind_jobs(page, jobs, new_tabs=False)
+        async for result in merge_jobs(bound, len(jobs), key=attrgetter("url"), label="discovery tab"):
+            yield result
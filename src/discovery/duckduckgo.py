@@ -43,8 +43,8 @@ class DuckDuckGoDiscovery(SearchDiscovery):
         logger.info(f"DuckDuckGo search: {full_query}")
 
         try:
-            await page.goto(search_url, wait_until="domcontentloaded")
             await self._rate_limit()
+            await page.goto(search_url, wait_until="domcontentloaded")
 
             # Wait for search results to load
             # DuckDuckGo uses JavaScript rendering
@@ -55,8 +55,8 @@ class GoogleDiscovery(SearchDiscovery):
         logger.info(f"Google search: {full_query}")
 
         try:
-            await page.goto(search_url, wait_until="domcontentloaded")
             await self._rate_limit()
+            await page.goto(search_url, wait_until="domcontentloaded")
 
             # Wait for search results
             await page.wait_for_selector("#search", timeout=10000)
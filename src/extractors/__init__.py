@@ -1,7 +1,7 @@
 """Adaptive extractors for marketplace listings."""
 
 from src.extractors.base import AdaptiveExtractor, ExtractedListing
-from src.extractors.bridge import LegacyAdapterBridge
+from src.extractors.bridge import LegacyAdapterBridge, detect_adapter
 from src.extractors.generic import GenericListingExtractor
 from src.extractors.structured import StructuredDataExtractor
 
@@ -11,4 +11,5 @@ __all__ = [
     "StructuredDataExtractor",
     "GenericListingExtractor",
     "LegacyAdapterBridge",
+    "detect_adapter",
 ]
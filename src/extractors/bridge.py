@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -27,23 +28,54 @@ DOMAIN_ADAPTER_MAP = {
 }
 
 
+def detect_adapter(url: str, domain_map: dict[str, str] = DOMAIN_ADAPTER_MAP) -> str | None:
+    """Name the marketplace adapter that handles a URL.
+
+    Args:
+        url: URL to analyze.
+        domain_map: Domain pattern -> adapter name mapping to match against.
+
+    Returns:
+        Adapter name, or None if no adapter handles the URL's domain.
+    """
+    try:
+        domain = urlparse(url).netloc.lower()
+    except Exception:
+        return None
+
+    for pattern, adapter_name in domain_map.items():
+        if re.search(pattern, domain, re.IGNORECASE):
+            return adapter_name
+
+    return None
+
+
 class LegacyAdapterBridge(ListingExtractor):
     """Bridge to use legacy marketplace adapters for extraction.
 
     When a URL matches a known marketplace domain, uses the corresponding
     legacy adapter's get_listing_details() method for extraction.
+    Results are memoized per URL by the adapter.
     """
 
     NAME = "legacy"
 
-    def __init__(self, adapters: dict[str, "MarketplaceAdapter"] | None = None):
+    def __init__(
+        self,
+        adapters: dict[str, "MarketplaceAdapter"] | None = None,
+        adapter_factory: Callable[[str], "MarketplaceAdapter | None"] | None = None,
+    ):
         """Initialize with adapter instances.
 
         Args:
             adapters: Dictionary mapping adapter names to instances.
                      If None, will lazy-load adapters when needed.
+            adapter_factory: Builds a missing adapter by name, e.g. the
+                orchestrator's, so it shares the run's request budgets and
+                rate settings. Defaults to the adapter class's defaults.
         """
         self._adapters = adapters or {}
+        self._adapter_factory = adapter_factory
         self._adapter_map = DOMAIN_ADAPTER_MAP
 
     def _detect_adapter(self, url: str) -> str | None:
@@ -55,17 +87,7 @@ class LegacyAdapterBridge(ListingExtractor):
         Returns:
             Adapter name or None.
         """
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            for pattern, adapter_name in self._adapter_map.items():
-                if re.search(pattern, domain, re.IGNORECASE):
-                    return adapter_name
-
-            return None
-        except Exception:
-            return None
+        return detect_adapter(url, self._adapter_map)
 
     def _get_adapter(self, name: str) -> "MarketplaceAdapter | None":
         """Get or create an adapter instance.
@@ -79,6 +101,12 @@ class LegacyAdapterBridge(ListingExtractor):
         if name in self._adapters:
             return self._adapters[name]
 
+        if self._adapter_factory is not None:
+            adapter = self._adapter_factory(name)
+            if adapter is not None:
+                self._adapters[name] = adapter
+            return adapter
+
         # Lazy load adapters
         try:
             from src.adapters import ADAPTER_MAP
@@ -127,8 +155,8 @@ class LegacyAdapterBridge(ListingExtractor):
             return None
 
         try:
-            # Use the adapter's get_listing_details method
-            listing = await adapter.get_listing_details(page, url)
+            # Use the adapter's get_listing_details method (memoized per URL)
+            listing = await adapter.fetch_listing_details(page, url)
 
             if listing:
                 return ExtractedListing(
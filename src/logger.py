@@ -185,7 +185,7 @@ class SearchLogger:
         # Sources breakdown
         sources: dict[str, int] = {}
         for entry in self.daily_results:
-            source = entry.source.split("_")[0]  # Group craigslist regions
+            source = entry.source.partition("_")[0]  # Group craigslist regions
             sources[source] = sources.get(source, 0) + 1
 
         lines.extend(
@@ -0,0 +1,85 @@
+"""Fan-in of concurrent async jobs into a single stream."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable, Hashable, Sequence
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Job: starts an async stream of items when called
+Job = Callable[[], AsyncIterator[T]]
+
+
+async def merge_jobs(
+    jobs: Sequence[Job[T]],
+    max_concurrency: int,
+    *,
+    key: Callable[[T], Hashable] | None = None,
+    label: str = "job",
+) -> AsyncIterator[T]:
+    """Run jobs concurrently and yield their items as they arrive.
+
+    A single job runs inline, without a task or queue. An error in a job is
+    logged and ends only that job. Closing the generator early cancels the
+    jobs still running.
+
+    Args:
+        jobs: Jobs to run.
+        max_concurrency: Maximum number of jobs running at once.
+        key: Identity of an item; an item whose key was already yielded is
+            skipped. None yields every item.
+        label: What a job is, for error logs.
+
+    Yields:
+        Items from all jobs, in arrival order.
+    """
+    seen: set[Hashable] = set()
+
+    def is_new(item: T) -> bool:
+        if key is None:
+            return True
+        item_key = key(item)
+        if item_key in seen:
+            return False
+        seen.add(item_key)
+        return True
+
+    if len(jobs) == 1:
+        try:
+            async for item in jobs[0]():
+                if is_new(item):
+                    yield item
+        except Exception as e:
+            logger.error("Error in %s: %s", label, e)
+        return
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    queue: asyncio.Queue[T | None] = asyncio.Queue()
+
+    async def run(job: Job[T]) -> None:
+        try:
+            async with semaphore:
+                async for item in job():
+                    await queue.put(item)
+        except Exception as e:
+            logger.error("Error in %s: %s", label, e)
+        finally:
+            # Sentinel: this job is done
+            await queue.put(None)
+
+    tasks = [asyncio.create_task(run(job)) for job in jobs]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            queued = await queue.get()
+            if queued is None:
+                remaining -= 1
+            elif is_new(queued):
+                yield queued
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -4,9 +4,12 @@ from dataclasses import dataclass, field
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class Listing:
-    """Raw listing from marketplace."""
+    """Raw listing from marketplace.
+
+    Slotted: adapters build one per search result card.
+    """
 
     url: str
     source: str  # 'shopgoodwill', 'ebay', 'etsy', 'craigslist', etc.
@@ -16,9 +19,12 @@ class Listing:
     image_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredListing:
-    """Listing with relevance score."""
+    """Listing with relevance score.
+
+    Slotted: scorers build one per listing scored.
+    """
 
     url: str
     source: str
@@ -31,9 +37,12 @@ class ScoredListing:
     image_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
-    """Entry in search_log.json."""
+    """Entry in search_log.json.
+
+    Slotted: one is built for every logged result.
+    """
 
     timestamp: str  # ISO format
     url: str
@@ -47,7 +56,7 @@ class LogEntry:
     status: str = "new"  # 'new', 'reviewed', 'dismissed'
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringWeights:
     """Configurable scoring weights for ring matching criteria."""
 
@@ -64,7 +73,7 @@ class ScoringWeights:
     size_close: int = 5  # Size 6-8
 
 
-@dataclass
+@dataclass(slots=True)
 class BikeScoringWeights:
     """Configurable scoring weights for Trek Allant+ 7S matching criteria.
 
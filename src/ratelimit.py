@@ -0,0 +1,93 @@
+"""Async token-bucket rate limiting shared across concurrent tasks."""
+
+import asyncio
+from types import TracebackType
+
+
+class TokenBucket:
+    """Token bucket limiting how often an action may happen.
+
+    The bucket holds up to ``burst`` tokens (``max_rate`` by default) and
+    refills at ``max_rate / time_period`` tokens per second. All tasks
+    acquiring from the same bucket share its budget, so the average rate
+    converges to the configured rate however many pages run concurrently,
+    while up to ``burst`` acquisitions after an idle spell go through at once.
+
+    Usable as ``async with bucket:`` or via ``await bucket.acquire()``.
+    """
+
+    def __init__(self, max_rate: float = 1.0, time_period: float = 1.0, burst: float | None = None):
+        """Initialize the bucket full.
+
+        Args:
+            max_rate: Acquisitions allowed per period.
+            time_period: Length of the period in seconds. Zero or less disables limiting.
+            burst: Bucket capacity, i.e. acquisitions allowed back to back.
+                Defaults to ``max_rate``.
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self.burst = max_rate if burst is None else burst
+        self._tokens = self.burst
+        self._last_refill: float | None = None
+        self._lock = asyncio.Lock()
+
+    def set_period(self, time_period: float) -> None:
+        """Change the refill period, e.g. to back off after throttling.
+
+        Args:
+            time_period: New period length in seconds.
+        """
+        self.time_period = time_period
+
+    def pause(self, seconds: float) -> None:
+        """Hold off further acquisitions for at least ``seconds``.
+
+        Args:
+            seconds: Minimum time before the next token is granted.
+        """
+        if self.time_period <= 0 or seconds <= 0:
+            return
+        self._tokens = min(self._tokens, 0.0) - seconds * self.rate_per_sec
+
+    @property
+    def rate_per_sec(self) -> float:
+        """Tokens added to the bucket per second."""
+        return self.max_rate / self.time_period
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        if self._last_refill is not None:
+            elapsed = now - self._last_refill
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_sec)
+        self._last_refill = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` tokens are available, then take them.
+
+        Waiters are served in arrival order.
+
+        Args:
+            amount: Number of tokens to take.
+        """
+        if self.time_period <= 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            self._refill(loop.time())
+            while self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self.rate_per_sec)
+                self._refill(loop.time())
+            self._tokens -= amount
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
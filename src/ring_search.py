@@ -1,23 +1,16 @@
 """Main search orchestrator coordinating all components."""
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 import yaml
-from playwright.async_api import Page, async_playwright
-
-from src.adapters import (
-    CraigslistAdapter,
-    EbayAdapter,
-    EtsyAdapter,
-    MarketplaceAdapter,
-    MercariAdapter,
-    PoshmarkAdapter,
-    RubyLaneAdapter,
-    ShopGoodwillAdapter,
-)
-from src.capture import ScreenshotCapture
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+
+from src.adapters import AdapterLimits, AdapterMap, MarketplaceAdapter, select_adapters
+from src.capture import VIEWPORT, ScreenshotCapture
 from src.dedup import DedupManager
 from src.discovery import DuckDuckGoDiscovery, GoogleDiscovery, MarketplaceFilter
 from src.discovery.base import AggregatedDiscovery, SearchDiscovery
@@ -26,35 +19,60 @@ from src.extractors import (
     GenericListingExtractor,
     LegacyAdapterBridge,
     StructuredDataExtractor,
+    detect_adapter,
 )
 from src.logger import SearchLogger
-from src.models import Listing
+from src.models import Listing, ScoredListing
 from src.scoring import RelevanceScorer
 
 logger = logging.getLogger(__name__)
 
+# HTTP disk cache size for a persistent browser profile (site bundles, CSS, sprites)
+BROWSER_DISK_CACHE_BYTES = 200 * 1024 * 1024
+
+
+def load_config(config_path: Path) -> dict[str, Any]:
+    """Load configuration from YAML file.
+
+    Args:
+        config_path: Path to the config file.
+
+    Returns:
+        Configuration dictionary.
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist.
+    """
+    if not config_path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    with open(config_path) as f:
+        config: dict[str, Any] = yaml.safe_load(f)
+        return config
+
 
 class SearchOrchestrator:
     """Coordinates search across multiple marketplaces."""
 
-    ADAPTER_MAP: dict[str, type[MarketplaceAdapter]] = {
-        "shopgoodwill": ShopGoodwillAdapter,
-        "ebay": EbayAdapter,
-        "etsy": EtsyAdapter,
-        "craigslist": CraigslistAdapter,
-        "rubylane": RubyLaneAdapter,
-        "mercari": MercariAdapter,
-        "poshmark": PoshmarkAdapter,
-    }
-
-    def __init__(self, config_path: Path, adaptive: bool = False):
+    ADAPTER_MAP: AdapterMap = select_adapters(
+        "shopgoodwill",
+        "ebay",
+        "etsy",
+        "craigslist",
+        "rubylane",
+        "mercari",
+        "poshmark",
+    )
+
+    def __init__(self, config_path: Path, adaptive: bool = False, config: dict[str, Any] | None = None):
         """Initialize orchestrator with configuration.
 
         Args:
             config_path: Path to config.yaml file.
             adaptive: Enable adaptive search discovery mode.
+            config: Configuration already parsed from ``config_path``, to skip reading it again.
         """
-        self.config = self._load_config(config_path)
+        self.config = config if config is not None else self._load_config(config_path)
         self.config_path = config_path
         self.adaptive = adaptive
 
@@ -72,6 +90,10 @@ class SearchOrchestrator:
         rate_config = self.config.get("rate_limiting", {})
         self.min_delay = rate_config.get("min_delay_seconds", 2.0)
         self.max_delay = rate_config.get("max_delay_seconds", 5.0)
+        self.max_concurrency = rate_config.get("max_concurrent_pages", 4)
+
+        # Open-page slots and per-host request budgets shared by this run's adapters
+        self.limits = AdapterLimits()
 
         # Initialize adaptive components if enabled
         discovery_config = self.config.get("discovery", {})
@@ -83,6 +105,18 @@ class SearchOrchestrator:
         if adaptive or discovery_config.get("enabled", False):
             self._init_adaptive_components(discovery_config)
 
+        # Optional CDP endpoint of an already-running Chromium to share instead of launching one
+        browser_config = self.config.get("browser", {})
+        self.cdp_url: str | None = browser_config.get("cdp_url")
+
+        # Optional profile directory whose HTTP cache and cookies persist across runs
+        self.user_data_dir: str | None = browser_config.get("user_data_dir")
+
+        # Long-lived browser context shared by runs between start() and close()
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._context: BrowserContext | None = None
+
     def _init_adaptive_components(self, discovery_config: dict) -> None:
         """Initialize discovery and extraction components.
 
@@ -93,6 +127,7 @@ class SearchOrchestrator:
         providers: list[SearchDiscovery] = []
         rate_limit = discovery_config.get("rate_limit_delay", 3.0)
         max_results = discovery_config.get("max_results_per_query", 20)
+        max_concurrency = discovery_config.get("max_concurrent_searches", 3)
 
         for provider_name in discovery_config.get("providers", ["duckduckgo"]):
             if provider_name == "duckduckgo":
@@ -100,6 +135,7 @@ class SearchOrchestrator:
                     DuckDuckGoDiscovery(
                         rate_limit_delay=rate_limit,
                         max_results=max_results,
+                        max_concurrency=max_concurrency,
                     )
                 )
             elif provider_name == "google":
@@ -107,6 +143,7 @@ class SearchOrchestrator:
                     GoogleDiscovery(
                         rate_limit_delay=rate_limit,
                         max_results=max_results,
+                        max_concurrency=max_concurrency,
                     )
                 )
 
@@ -121,7 +158,7 @@ class SearchOrchestrator:
         self.extractor = AdaptiveExtractor(
             [
                 StructuredDataExtractor(),
-                LegacyAdapterBridge(),
+                LegacyAdapterBridge(adapter_factory=self._create_named_adapter),
                 GenericListingExtractor(),
             ]
         )
@@ -140,12 +177,7 @@ class SearchOrchestrator:
         Raises:
             FileNotFoundError: If config file doesn't exist.
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-
-        with open(config_path) as f:
-            config: dict[str, Any] = yaml.safe_load(f)
-            return config
+        return load_config(config_path)
 
     def _create_adapter(self, marketplace: dict[str, Any]) -> MarketplaceAdapter | None:
         """Create adapter for a marketplace configuration.
@@ -163,21 +195,111 @@ class SearchOrchestrator:
             return None
 
         adapter_class = self.ADAPTER_MAP[name]
-
-        # Special handling for Craigslist (needs regions)
-        if name == "craigslist":
-            regions = marketplace.get("regions", CraigslistAdapter.DEFAULT_REGIONS)
-            return CraigslistAdapter(
-                regions=regions,
-                min_delay=self.min_delay,
-                max_delay=self.max_delay,
-            )
-
+        # Options the adapter takes (e.g. Craigslist regions, use_api) come straight from the entry
+        options = {key: marketplace[key] for key in adapter_class.CONFIG_OPTIONS if key in marketplace}
         return adapter_class(
             min_delay=self.min_delay,
             max_delay=self.max_delay,
+            # A marketplace entry may override the global parallel tab limit
+            max_concurrency=marketplace.get("max_concurrent_pages", self.max_concurrency),
+            limits=self.limits,
+            **options,
         )
 
+    def _create_named_adapter(self, name: str) -> MarketplaceAdapter | None:
+        """Create an adapter by name, configured like its marketplace entry if there is one.
+
+        Args:
+            name: Adapter name.
+
+        Returns:
+            Configured adapter instance, or None if unknown marketplace.
+        """
+        for marketplace in self.config.get("marketplaces", []):
+            if marketplace.get("name", "").lower() == name:
+                return self._create_adapter(marketplace)
+        return self._create_adapter({"name": name})
+
+    async def start(self, headless: bool = True) -> BrowserContext:
+        """Launch the shared browser and context if they are not already running.
+
+        Runs made between ``start()`` and ``close()`` reuse this context, so
+        they share its connection pool and cookies and skip a Chromium launch.
+        With ``browser.cdp_url`` configured, the context is opened in that
+        running browser over CDP instead, so several processes can share one
+        Chromium. With ``browser.user_data_dir`` configured, Chromium runs on
+        that persistent profile, so its HTTP disk cache and cookies carry over
+        to later runs; Chromium locks the profile directory, so concurrent runs
+        need separate directories. Service workers are blocked so every request reaches the
+        adapters' resource blocking instead of being answered by a worker.
+
+        Args:
+            headless: Whether to run browser in headless mode.
+
+        Returns:
+            The shared browser context.
+        """
+        if self._context is None:
+            # A new context may be on a new event loop; the old slots and budgets could be bound to another
+            self.limits.reset()
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            if self._browser is None and self.cdp_url:
+                self._browser = await self._playwright.chromium.connect_over_cdp(self.cdp_url)
+            elif self._browser is None and self.user_data_dir:
+                # The persistent context owns its browser; closing it shuts Chromium down
+                self._context = await self._playwright.chromium.launch_persistent_context(
+                    self.user_data_dir,
+                    headless=headless,
+                    args=[f"--disk-cache-size={BROWSER_DISK_CACHE_BYTES}"],
+                    service_workers="block",
+                    viewport=VIEWPORT,
+                )
+                return self._context
+            elif self._browser is None:
+                self._browser = await self._playwright.chromium.launch(headless=headless)
+            self._context = await self._browser.new_context(service_workers="block", viewport=VIEWPORT)
+        return self._context
+
+    async def close(self) -> None:
+        """Close the shared context and browser and stop Playwright.
+
+        A browser reached over CDP is only disconnected from, not shut down.
+        """
+        if self._context is not None:
+            await self._context.close()
+            self._context = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @asynccontextmanager
+    async def _browser_page(self, headless: bool) -> AsyncIterator[Page]:
+        """Open a page in the shared browser context.
+
+        Launches the browser for just this run if ``start()`` was not called.
+        URLs marked checked during the run are flushed to disk when it ends.
+
+        Args:
+            headless: Whether to run browser in headless mode.
+
+        Yields:
+            Page in the shared context, closed when the run ends.
+        """
+        owns_browser = self._context is None
+        context = await self.start(headless)
+        page = await context.new_page()
+        try:
+            yield page
+        finally:
+            await page.close()
+            self.dedup.flush()
+            if owns_browser:
+                await self.close()
+
     async def run_daily_search(self, headless: bool = True) -> dict[str, Any]:
         """Execute search across all configured marketplaces.
 
@@ -189,30 +311,24 @@ class SearchOrchestrator:
         """
         logger.info("Starting daily ring search")
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            page = await browser.new_page()
+        async with self._browser_page(headless) as page:
+            # Check known leads first
+            await self._check_known_leads(page)
 
-            try:
-                # Check known leads first
-                await self._check_known_leads(page)
+            # Search each marketplace
+            marketplaces = self.config.get("marketplaces", [])
+            await self._warmup_marketplaces(page.context, marketplaces)
 
-                # Search each marketplace
-                marketplaces = self.config.get("marketplaces", [])
+            for marketplace in sorted(marketplaces, key=lambda m: m.get("priority", 99)):
+                if not marketplace.get("enabled", True):
+                    logger.info(f"Skipping disabled marketplace: {marketplace['name']}")
+                    continue
 
-                for marketplace in sorted(marketplaces, key=lambda m: m.get("priority", 99)):
-                    if not marketplace.get("enabled", True):
-                        logger.info(f"Skipping disabled marketplace: {marketplace['name']}")
-                        continue
+                await self._search_marketplace(page, marketplace)
 
-                    await self._search_marketplace(page, marketplace)
-
-                # Run adaptive discovery if enabled
-                if self.discovery and self.adaptive:
-                    await self._run_adaptive_discovery(page)
-
-            finally:
-                await browser.close()
+            # Run adaptive discovery if enabled
+            if self.discovery and self.adaptive:
+                await self._run_adaptive_discovery(page)
 
         # Write daily summary
         self.logger.write_daily_summary()
@@ -260,30 +376,33 @@ class SearchOrchestrator:
         # Extract and process each discovered listing
         for result in discovered_urls:
             try:
+                # Listing built from the search-result snippet alone
+                snippet_listing = Listing(
+                    url=result.url,
+                    source=result.marketplace or "discovery",
+                    title=result.title,
+                    price=None,
+                    description=result.snippet,
+                    image_url=None,
+                )
+
+                # Skip the detail page when the snippet alone is conclusive for its marketplace
+                snippet_scored = self.scorer.score(snippet_listing)
+                if not self._adapter_class_for(result.url).needs_detail(snippet_scored):
+                    await self._process_listing(page, snippet_listing, snippet_scored)
+                    self.dedup.mark_checked(result.url)
+                    continue
+
                 await page.goto(result.url, wait_until="domcontentloaded")
                 await page.wait_for_timeout(1000)  # Give JS time to render
 
-                # Use adaptive extractor
+                # Use adaptive extractor, falling back to the snippet
                 extracted = await self.extractor.extract(page, result.url)
+                listing = extracted.to_listing() if extracted else snippet_listing
 
-                if extracted:
-                    listing = extracted.to_listing()
-                    await self._process_listing(page, listing)
-                    # Only mark as checked after successful processing
-                    self.dedup.mark_checked(result.url)
-                else:
-                    # Fallback to basic extraction
-                    listing = Listing(
-                        url=result.url,
-                        source=result.marketplace or "discovery",
-                        title=result.title,
-                        price=None,
-                        description=result.snippet,
-                        image_url=None,
-                    )
-                    await self._process_listing(page, listing)
-                    # Only mark as checked after successful processing
-                    self.dedup.mark_checked(result.url)
+                await self._process_listing(page, listing)
+                # Only mark as checked after successful processing
+                self.dedup.mark_checked(result.url)
 
             except Exception as e:
                 # Don't mark failed URLs as checked - they can be retried next run
@@ -292,6 +411,20 @@ class SearchOrchestrator:
                     f"{type(e).__name__}: {e}"
                 )
 
+    def _adapter_class_for(self, url: str) -> type[MarketplaceAdapter]:
+        """Find the adapter class that handles a URL.
+
+        Args:
+            url: Listing URL.
+
+        Returns:
+            The marketplace's adapter class, or MarketplaceAdapter for other sites.
+        """
+        name = detect_adapter(url)
+        if name is not None and name in self.ADAPTER_MAP:
+            return self.ADAPTER_MAP[name]
+        return MarketplaceAdapter
+
     async def _check_known_leads(self, page: Page) -> None:
         """Check known lead URLs first.
 
@@ -340,6 +473,20 @@ class SearchOrchestrator:
             except Exception as e:
                 logger.error(f"Error checking known lead {url}: {e}")
 
+    async def _warmup_marketplaces(self, context: BrowserContext, marketplaces: list[dict[str, Any]]) -> None:
+        """Prime connections to every enabled marketplace concurrently.
+
+        Args:
+            context: Browser context the searches will run in.
+            marketplaces: Marketplace configuration dictionaries.
+        """
+        adapters = [
+            self._create_adapter(marketplace)
+            for marketplace in marketplaces
+            if marketplace.get("enabled", True) and marketplace.get("name", "").lower() in self.ADAPTER_MAP
+        ]
+        await asyncio.gather(*(adapter.warmup(context) for adapter in adapters if adapter is not None))
+
     async def _search_marketplace(self, page: Page, marketplace: dict[str, Any]) -> None:
         """Search a single marketplace.
 
@@ -359,24 +506,68 @@ class SearchOrchestrator:
             logger.warning(f"No search queries configured for {name}")
             return
 
+        new_listings: list[Listing] = []
+        # Queries of one search often return the same item under different URLs
+        seen: set[str] = set()
         try:
-            async for listing in adapter.search(page, searches):
-                if self.dedup.is_new(listing.url):
-                    await self._process_listing(page, listing)
-                    self.dedup.mark_checked(listing.url)
+            # Search in a tab of its own with heavy resources blocked; screenshots,
+            # which need images, are taken in fresh tabs once the search is done
+            async with adapter.open_page(page.context) as search_page:
+                await adapter.attach(search_page)
+                async for listing in adapter.search(search_page, searches):
+                    if not self.dedup.is_new(listing.url):
+                        continue
+                    key = self.dedup.key(listing.url)
+                    if key not in seen:
+                        seen.add(key)
+                        new_listings.append(listing)
 
         except Exception as e:
             logger.error(f"Error searching {name}: {e}")
 
-    async def _process_listing(self, page: Page, listing: Listing) -> None:
+        # Listings found before an error are still processed
+        try:
+            await self._process_listings(page.context, new_listings)
+        except Exception as e:
+            logger.error(f"Error processing {name} listings: {e}")
+
+    async def _process_listings(self, context: BrowserContext, listings: list[Listing]) -> None:
+        """Process a batch of listings, capturing screenshots concurrently.
+
+        Args:
+            context: Browser context to open capture tabs in.
+            listings: The listings to process.
+        """
+        scored_listings = [self.scorer.score(listing) for listing in listings]
+        for scored in scored_listings:
+            logger.info(f"[{scored.confidence.upper()}] {scored.score}/100 - {scored.title[:50]}...")
+
+        # Capture screenshots for high/medium confidence
+        to_capture = [scored for scored in scored_listings if scored.confidence in ("high", "medium")]
+        screenshots = await self.capture.capture_batch(context, to_capture, self.max_concurrency)
+        screenshot_by_url = {scored.url: path for scored, path in zip(to_capture, screenshots)}
+
+        for scored in scored_listings:
+            screenshot = screenshot_by_url.get(scored.url)
+            # Copy high confidence to special folder
+            if scored.confidence == "high" and screenshot:
+                self.capture.copy_to_high_confidence(screenshot)
+
+            # Log result and mark as checked
+            self.logger.log_result(scored, screenshot=screenshot)
+            self.dedup.mark_checked(scored.url)
+
+    async def _process_listing(self, page: Page, listing: Listing, scored: ScoredListing | None = None) -> None:
         """Process a single listing: score, screenshot, log.
 
         Args:
             page: Playwright page instance.
             listing: The listing to process.
+            scored: The listing's score, if already computed.
         """
         # Score the listing
-        scored = self.scorer.score(listing)
+        if scored is None:
+            scored = self.scorer.score(listing)
 
         logger.info(f"[{scored.confidence.upper()}] {scored.score}/100 - {scored.title[:50]}...")
 
@@ -404,50 +595,43 @@ class SearchOrchestrator:
         """
         logger.info(f"Checking {len(urls)} specific URLs")
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            page = await browser.new_page()
+        async with self._browser_page(headless) as page:
+            for url in urls:
+                if not self.dedup.is_new(url):
+                    logger.info(f"URL already checked: {url}")
+                    continue
+
+                try:
+                    await page.goto(url, wait_until="domcontentloaded")
+
+                    # Extract basic info
+                    title_element = await page.query_selector("h1, title")
+                    title = ""
+                    if title_element:
+                        title = await title_element.text_content() or ""
+                        title = title.strip()
+
+                    # Determine source from URL
+                    source = "unknown"
+                    for name in self.ADAPTER_MAP:
+                        if name in url.lower():
+                            source = name
+                            break
 
-            try:
-                for url in urls:
-                    if not self.dedup.is_new(url):
-                        logger.info(f"URL already checked: {url}")
-                        continue
+                    listing = Listing(
+                        url=url,
+                        source=source,
+                        title=title or url,
+                        price=None,
+                        description=None,
+                        image_url=None,
+                    )
+
+                    await self._process_listing(page, listing)
+                    self.dedup.mark_checked(url)
 
-                    try:
-                        await page.goto(url, wait_until="domcontentloaded")
-
-                        # Extract basic info
-                        title_element = await page.query_selector("h1, title")
-                        title = ""
-                        if title_element:
-                            title = await title_element.text_content() or ""
-                            title = title.strip()
-
-                        # Determine source from URL
-                        source = "unknown"
-                        for name in self.ADAPTER_MAP:
-                            if name in url.lower():
-                                source = name
-                                break
-
-                        listing = Listing(
-                            url=url,
-                            source=source,
-                            title=title or url,
-                            price=None,
-                            description=None,
-                            image_url=None,
-                        )
-
-                        await self._process_listing(page, listing)
-                        self.dedup.mark_checked(url)
-
-                    except Exception as e:
-                        logger.error(f"Error checking URL {url}: {e}")
-
-            finally:
-                await browser.close()
+                except Exception as e:
+                    logger.error(f"Error checking URL {url}: {e}")
 
         self.logger.write_daily_summary()
         return self.logger.get_stats()
@@ -117,8 +117,9 @@ class TestFullSearchWorkflow:
             with patch("src.ring_search.async_playwright") as mock_pw:
                 mock_browser = AsyncMock()
                 mock_page = AsyncMock()
-                mock_browser.new_page = AsyncMock(return_value=mock_page)
-                mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
+                mock_browser.new_context = AsyncMock(return_value=AsyncMock(new_page=AsyncMock(return_value=mock_page)))
+                mock_pw.return_value.start = AsyncMock()
+                mock_pw.return_value.start.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
 
                 stats = await orchestrator.run_daily_search(headless=True)
 
@@ -161,8 +162,9 @@ class TestFullSearchWorkflow:
             with patch("src.ring_search.async_playwright") as mock_pw:
                 mock_browser = AsyncMock()
                 mock_page = AsyncMock()
-                mock_browser.new_page = AsyncMock(return_value=mock_page)
-                mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
+                mock_browser.new_context = AsyncMock(return_value=AsyncMock(new_page=AsyncMock(return_value=mock_page)))
+                mock_pw.return_value.start = AsyncMock()
+                mock_pw.return_value.start.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
 
                 await orchestrator.run_daily_search()
 
@@ -194,8 +196,9 @@ class TestFullSearchWorkflow:
             with patch("src.ring_search.async_playwright") as mock_pw:
                 mock_browser = AsyncMock()
                 mock_page = AsyncMock()
-                mock_browser.new_page = AsyncMock(return_value=mock_page)
-                mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
+                mock_browser.new_context = AsyncMock(return_value=AsyncMock(new_page=AsyncMock(return_value=mock_page)))
+                mock_pw.return_value.start = AsyncMock()
+                mock_pw.return_value.start.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
 
                 await orchestrator.run_daily_search()
 
@@ -339,8 +342,9 @@ class TestDeduplicationFlow:
             with patch("src.ring_search.async_playwright") as mock_pw:
                 mock_browser = AsyncMock()
                 mock_page = AsyncMock()
-                mock_browser.new_page = AsyncMock(return_value=mock_page)
-                mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
+                mock_browser.new_context = AsyncMock(return_value=AsyncMock(new_page=AsyncMock(return_value=mock_page)))
+                mock_pw.return_value.start = AsyncMock()
+                mock_pw.return_value.start.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
 
                 # Process listing should not be called for duplicates
                 orchestrator._process_listing = AsyncMock()
@@ -374,8 +378,9 @@ class TestDeduplicationFlow:
                 mock_page = AsyncMock()
                 mock_page.goto = AsyncMock()
                 mock_page.query_selector = AsyncMock(return_value=None)
-                mock_browser.new_page = AsyncMock(return_value=mock_page)
-                mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
+                mock_browser.new_context = AsyncMock(return_value=AsyncMock(new_page=AsyncMock(return_value=mock_page)))
+                mock_pw.return_value.start = AsyncMock()
+                mock_pw.return_value.start.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
 
                 orchestrator._process_listing = AsyncMock()
 
@@ -412,8 +417,9 @@ class TestOutputGeneration:
             with patch("src.ring_search.async_playwright") as mock_pw:
                 mock_browser = AsyncMock()
                 mock_page = AsyncMock()
-                mock_browser.new_page = AsyncMock(return_value=mock_page)
-                mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
+                mock_browser.new_context = AsyncMock(return_value=AsyncMock(new_page=AsyncMock(return_value=mock_page)))
+                mock_pw.return_value.start = AsyncMock()
+                mock_pw.return_value.start.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
 
                 await orchestrator.run_daily_search()
 
@@ -1,10 +1,35 @@
 """Tests for marketplace adapters."""
 
-from unittest.mock import AsyncMock
+import ast
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
 
+from src.adapters.base import (
+    MAX_OPEN_PAGES,
+    AdapterLimits,
+    MarketplaceAdapter,
+    normalize_price,
+    normalize_selector,
+    quote_query,
+)
+from src.adapters.craigslist import CraigslistAdapter
+from src.adapters.ebay import EbayAdapter
+from src.adapters.etsy import EtsyAdapter
+from src.adapters.mercari import MercariAdapter
+from src.adapters.pinkbike import PinkbikeAdapter
+from src.adapters.poshmark import PoshmarkAdapter
+from src.adapters.rubylane import RubyLaneAdapter
 from src.adapters.shopgoodwill import ShopGoodwillAdapter
+from src.adapters.trek_redbarn import TrekRedBarnAdapter
+from src.merge import merge_jobs
+from src.models import Listing
 
 
 class TestMarketplaceAdapter:
@@ -16,6 +41,37 @@ class TestMarketplaceAdapter:
         assert adapter.min_delay == 1.0
         assert adapter.max_delay == 2.0
 
+    @pytest.mark.asyncio
+    async def test_budget_taken_before_each_request(self) -> None:
+        """Test that navigations, HTTP fetches and API calls wait for the host budget before sending."""
+        adapter = ShopGoodwillAdapter(min_delay=0, max_delay=0)
+        events: list[str] = []
+
+        async def rate_limit(key: str = "") -> None:
+            events.append("budget")
+
+        def request(name: str, response: MagicMock) -> AsyncMock:
+            async def send(*args: object, **kwargs: object) -> MagicMock:
+                events.append(name)
+                return response
+
+            return AsyncMock(side_effect=send)
+
+        response = MagicMock(status=200, ok=True, headers={})
+        response.text = AsyncMock(return_value="<html></html>")
+        response.json = AsyncMock(return_value={"searchResults": {"items": []}})
+        mock_page = AsyncMock()
+        mock_page.goto = request("goto", response)
+        mock_page.context.request.get = request("get", response)
+        mock_page.context.request.post = request("post", response)
+        adapter._rate_limit = rate_limit  # type: ignore[method-assign]
+
+        await adapter._navigate(mock_page, "https://shopgoodwill.com/search")
+        await adapter._fetch_html(mock_page, "https://shopgoodwill.com/search")
+        await adapter._api_items(mock_page, "ring", 1)
+
+        assert events == ["budget", "goto", "budget", "get", "budget", "post"]
+
     def test_extract_text_with_value(self) -> None:
         """Test _extract_text with valid text."""
         adapter = ShopGoodwillAdapter()
@@ -28,6 +84,28 @@ class TestMarketplaceAdapter:
         result = adapter._extract_text(None, "default")
         assert result == "default"
 
+    @pytest.mark.asyncio
+    async def test_warmup_heads_base_url(self) -> None:
+        """Test that warmup sends a HEAD request to the marketplace origin."""
+        adapter = EbayAdapter()
+        mock_context = AsyncMock()
+
+        await adapter.warmup(mock_context)
+
+        mock_context.request.head.assert_awaited_once_with("https://www.ebay.com", timeout=5000)
+
+    @pytest.mark.asyncio
+    async def test_warmup_covers_regions_and_ignores_errors(self) -> None:
+        """Test that Craigslist warms every region and failures don't raise."""
+        adapter = CraigslistAdapter(regions=["indianapolis", "chicago"])
+        mock_context = AsyncMock()
+        mock_context.request.head.side_effect = Exception("DNS failure")
+
+        await adapter.warmup(mock_context)
+
+        urls = [call.args[0] for call in mock_context.request.head.await_args_list]
+        assert urls == ["https://indianapolis.craigslist.org", "https://chicago.craigslist.org"]
+
 
 class TestShopGoodwillAdapter:
     """Tests for ShopGoodwillAdapter class."""
@@ -56,46 +134,24 @@ class TestShopGoodwillAdapter:
 
         # Create mock page
         mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
 
         # Mock wait_for_selector to succeed
         mock_page.wait_for_selector = AsyncMock()
 
-        # Create mock listing element
-        mock_element = AsyncMock()
-        mock_link = AsyncMock()
-        mock_link.get_attribute = AsyncMock(return_value="/item/12345")
-        mock_link.text_content = AsyncMock(return_value="Test Ring")
-
-        mock_title = AsyncMock()
-        mock_title.text_content = AsyncMock(return_value="Gold Amethyst Ring")
-
-        mock_price = AsyncMock()
-        mock_price.text_content = AsyncMock(return_value="$50.00")
-
-        mock_image = AsyncMock()
-        mock_image.get_attribute = AsyncMock(return_value="https://example.com/img.jpg")
-
-        # Setup element query selectors
-        async def element_query_selector(selector):
-            if "link" in selector or "href" in selector:
-                return mock_link
-            elif "title" in selector:
-                return mock_title
-            elif "price" in selector or "bid" in selector:
-                return mock_price
-            elif "image" in selector or "img" in selector:
-                return mock_image
-            return None
-
-        mock_element.query_selector = element_query_selector
-
-        # Return one listing element
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_element])
-
         # Page-level query_selector needs to return None for no-results check
-        # and then return None for has_next_page check
         mock_page.query_selector = AsyncMock(return_value=None)
 
+        # One batched read of every card, then no next page
+        card = {
+            "url": "https://shopgoodwill.com/item/12345",
+            "title": None,
+            "linkText": "Gold Amethyst Ring",
+            "price": "$50.00",
+            "imageUrl": "https://example.com/img.jpg",
+        }
+        mock_page.evaluate = AsyncMock(side_effect=[[card], None])
+
         # Collect results
         listings = []
         async for listing in adapter.search(mock_page, ["test query"]):
@@ -107,6 +163,7 @@ class TestShopGoodwillAdapter:
         assert "12345" in listings[0].url
         assert listings[0].title == "Gold Amethyst Ring"
         assert listings[0].price == "$50.00"
+        mock_page.query_selector_all.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_search_handles_no_results(self) -> None:
@@ -126,37 +183,105 @@ class TestShopGoodwillAdapter:
         assert len(listings) == 0
 
     @pytest.mark.asyncio
-    async def test_get_listing_details(self) -> None:
-        """Test fetching detailed listing information."""
-        adapter = ShopGoodwillAdapter(min_delay=0.01, max_delay=0.02)
+    async def test_api_results_skip_rendering(self) -> None:
+        """Test that JSON API results are paged through without loading the search page."""
+        adapter = ShopGoodwillAdapter(min_delay=0, max_delay=0, use_api=True)
+        adapter.API_PAGE_SIZE = 2
+
+        def api_response(items: list[dict]) -> MagicMock:
+            response = MagicMock(status=200, ok=True, headers={})
+            response.json = AsyncMock(return_value={"searchResults": {"items": items}})
+            return response
 
         mock_page = AsyncMock()
+        mock_page.context.request.post = AsyncMock(
+            side_effect=[
+                api_response(
+                    [
+                        {"itemId": 1, "title": "Amethyst Ring", "currentPrice": 12.5, "imageURL": "https://img/1.jpg"},
+                        {"itemId": 2, "title": "Gold Ring", "currentPrice": 1200},
+                    ]
+                ),
+                api_response([{"itemId": 3, "title": "Silver Ring", "currentPrice": 8}, {"title": "No id"}]),
+                api_response([]),
+            ]
+        )
+
+        listings = [listing async for listing in adapter.search(mock_page, ["amethyst ring"])]
 
-        # Setup mocks for detail page elements
-        mock_title = AsyncMock()
-        mock_title.text_content = AsyncMock(return_value="Detailed Title")
+        assert [listing.url for listing in listings] == [
+            "https://shopgoodwill.com/item/1",
+            "https://shopgoodwill.com/item/2",
+            "https://shopgoodwill.com/item/3",
+        ]
+        assert listings[0].price == "$12.50"
+        assert listings[0].image_url == "https://img/1.jpg"
+        assert listings[1].price == "$1,200.00"
+        # The third page is requested because the second came back full
+        assert mock_page.context.request.post.await_count == 3
+        assert mock_page.context.request.post.call_args.kwargs["data"]["page"] == 3
+        mock_page.goto.assert_not_called()
 
-        mock_price = AsyncMock()
-        mock_price.text_content = AsyncMock(return_value="$100.00")
+    @pytest.mark.asyncio
+    async def test_api_request_is_limited_to_jewelry(self) -> None:
+        """Test that the API request carries the Jewelry category the rendered search filters on."""
+        adapter = ShopGoodwillAdapter(min_delay=0, max_delay=0, use_api=True)
+
+        response = MagicMock(status=200, ok=True, headers={})
+        response.json = AsyncMock(return_value={"searchResults": {"items": []}})
+        mock_page = AsyncMock()
+        mock_page.context.request.post = AsyncMock(return_value=response)
 
-        mock_desc = AsyncMock()
-        mock_desc.text_content = AsyncMock(return_value="Full description")
+        assert await adapter._api_items(mock_page, "amethyst ring", 2) == []
 
-        mock_image = AsyncMock()
-        mock_image.get_attribute = AsyncMock(return_value="https://example.com/full.jpg")
+        url = mock_page.context.request.post.call_args.args[0]
+        body = mock_page.context.request.post.call_args.kwargs["data"]
+        assert url == adapter.API_URL
+        assert body == {
+            "searchText": "amethyst ring",
+            "categoryLevelNo": "1",
+            "categoryLevel": 1,
+            "categoryId": 10,
+            "catIds": "10",
+            "page": 2,
+            "pageSize": adapter.API_PAGE_SIZE,
+        }
 
-        async def query_selector(selector):
-            if "h1" in selector:
-                return mock_title
-            elif "bid" in selector or "price" in selector:
-                return mock_price
-            elif "description" in selector:
-                return mock_desc
-            elif "image" in selector:
-                return mock_image
-            return None
+    @pytest.mark.asyncio
+    async def test_api_failure_falls_back_to_page(self) -> None:
+        """Test that a failed first API request falls back to rendering the search page."""
+        adapter = ShopGoodwillAdapter(min_delay=0, max_delay=0, use_api=True)
 
-        mock_page.query_selector = query_selector
+        mock_page = AsyncMock()
+        mock_page.context.request.post = AsyncMock(return_value=MagicMock(status=403, ok=False, headers={}))
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.query_selector = AsyncMock(return_value=None)
+        card = {"url": "https://shopgoodwill.com/item/12345", "title": "Ring", "price": "$5.00"}
+        mock_page.evaluate = AsyncMock(side_effect=[[card], None])
+
+        listings = [listing async for listing in adapter.search(mock_page, ["amethyst ring"])]
+
+        assert [listing.url for listing in listings] == ["https://shopgoodwill.com/item/12345"]
+        mock_page.goto.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_listing_details(self) -> None:
+        """Test fetching detailed listing information."""
+        adapter = ShopGoodwillAdapter(min_delay=0.01, max_delay=0.02)
+
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+
+        # All detail fields come back from one evaluate call
+        mock_page.evaluate = AsyncMock(
+            return_value={
+                "title": "Detailed Title",
+                "price": "$100.00",
+                "description": "Full description",
+                "specs": None,
+                "imageUrl": "https://example.com/full.jpg",
+            }
+        )
 
         result = await adapter.get_listing_details(mock_page, "https://shopgoodwill.com/item/12345")
 
@@ -164,7 +289,15 @@ class TestShopGoodwillAdapter:
         assert result.title == "Detailed Title"
         assert result.price == "$100.00"
         assert result.description == "Full description"
+        assert result.image_url == "https://example.com/full.jpg"
         assert result.source == "shopgoodwill"
+        mock_page.query_selector.assert_not_called()
+
+        # Returns at the navigation response, then waits only for the title
+        assert mock_page.goto.call_args.kwargs["wait_until"] == "commit"
+        mock_page.wait_for_selector.assert_called_once_with(
+            adapter.SELECTORS["detail_title"], state="attached", timeout=10000
+        )
 
     @pytest.mark.asyncio
     async def test_get_listing_details_handles_error(self) -> None:
@@ -179,40 +312,1148 @@ class TestShopGoodwillAdapter:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_has_next_page_true(self) -> None:
-        """Test _has_next_page returns True when next page exists."""
+    async def test_next_page_clicks_enabled_button(self) -> None:
+        """Test _next_page clicks an enabled next button without an href."""
         adapter = ShopGoodwillAdapter()
 
         mock_page = AsyncMock()
-        mock_button = AsyncMock()
-        mock_button.get_attribute = AsyncMock(return_value=None)  # Not disabled
+        mock_page.evaluate.return_value = True
 
-        mock_page.query_selector = AsyncMock(return_value=mock_button)
-
-        result = await adapter._has_next_page(mock_page)
+        result = await adapter._next_page(mock_page)
         assert result is True
+        mock_page.click.assert_called_once_with(adapter.SELECTORS["next_page"])
+        mock_page.query_selector.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_has_next_page_false_when_disabled(self) -> None:
-        """Test _has_next_page returns False when button disabled."""
+    async def test_next_page_false_when_disabled_or_missing(self) -> None:
+        """Test _next_page returns False when the button is disabled or absent."""
         adapter = ShopGoodwillAdapter()
 
         mock_page = AsyncMock()
-        mock_button = AsyncMock()
-        mock_button.get_attribute = AsyncMock(side_effect=lambda attr: "true" if attr == "disabled" else "btn disabled")
-
-        mock_page.query_selector = AsyncMock(return_value=mock_button)
+        mock_page.evaluate.return_value = None
 
-        result = await adapter._has_next_page(mock_page)
+        result = await adapter._next_page(mock_page)
         assert result is False
+        mock_page.click.assert_not_called()
+
+
+class TestCraigslistExtraction:
+    """Tests for Craigslist batch extraction."""
 
     @pytest.mark.asyncio
-    async def test_has_next_page_false_when_no_button(self) -> None:
-        """Test _has_next_page returns False when no next button."""
-        adapter = ShopGoodwillAdapter()
+    async def test_extract_listings_single_evaluate(self) -> None:
+        """Test that listings are extracted with one evaluate call and relative URLs resolved."""
+        adapter = CraigslistAdapter(regions=["indianapolis"])
 
         mock_page = AsyncMock()
-        mock_page.query_selector = AsyncMock(return_value=None)
+        mock_page.evaluate.return_value = [
+            {"href": "/jwl/d/ring/123.html", "title": "Gold ring", "price": "$200", "imageUrl": None},
+            {
+                "href": "https://chicago.craigslist.org/jwl/d/band/456.html",
+                "title": "Band",
+                "price": "",
+                "imageUrl": "https://img/1.jpg",
+            },
+            {"href": "//detroit.craigslist.org/jwl/d/pearl/789.html", "title": "Pearl", "price": None},
+        ]
 
-        result = await adapter._has_next_page(mock_page)
-        assert result is False
+        listings = await adapter._extract_listings(mock_page, "indianapolis")
+
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector_all.assert_not_called()
+        assert listings[0].url == "https://indianapolis.craigslist.org/jwl/d/ring/123.html"
+        assert listings[0].source == "craigslist_indianapolis"
+        assert listings[0].price == "$200"
+        assert listings[1].url == "https://chicago.craigslist.org/jwl/d/band/456.html"
+        assert listings[1].price is None
+        assert listings[1].image_url == "https://img/1.jpg"
+        assert listings[2].url == "https://detroit.craigslist.org/jwl/d/pearl/789.html"
+
+    @pytest.mark.asyncio
+    async def test_get_listing_details_single_evaluate(self) -> None:
+        """Test that listing details are read with one evaluate call."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.evaluate.return_value = {
+            "title": "Gold ring",
+            "price": "$200",
+            "description": "Lost ring",
+            "imageUrl": None,
+        }
+
+        listing = await adapter.get_listing_details(
+            mock_page, "https://indianapolis.craigslist.org/jwl/d/ring/123.html"
+        )
+
+        assert listing is not None
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector.assert_not_called()
+        assert listing.source == "craigslist_indianapolis"
+        assert listing.description == "Lost ring"
+
+    @pytest.mark.asyncio
+    async def test_http_fast_path_skips_navigation(self) -> None:
+        """Test that static HTML results are used without rendering the page."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        response = MagicMock(ok=True, status=200)
+        response.text = AsyncMock(return_value="<html></html>")
+        mock_page.context.request.get = AsyncMock(return_value=response)
+        mock_page.evaluate.return_value = [{"href": "/jwl/d/ring/123.html", "title": "Ring", "price": "$5"}]
+
+        listings = [listing async for listing in adapter._search_region(mock_page, "indianapolis", "ring")]
+
+        assert [listing.url for listing in listings] == ["https://indianapolis.craigslist.org/jwl/d/ring/123.html"]
+        mock_page.goto.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_http_failure_falls_back_to_browser(self) -> None:
+        """Test that a failed HTTP fetch falls back to Playwright navigation."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.context.request.get = AsyncMock(return_value=MagicMock(ok=False, status=403))
+        mock_page.query_selector.return_value = None
+        mock_page.evaluate.return_value = []
+
+        _ = [listing async for listing in adapter._search_region(mock_page, "indianapolis", "ring")]
+
+        mock_page.goto.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_next_page_follows_link(self) -> None:
+        """Test that a next-page link is followed with one lookup."""
+        adapter = CraigslistAdapter(regions=["indianapolis"])
+
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.evaluate.return_value = "https://indianapolis.craigslist.org/search/jwa?s=120"
+
+        assert await adapter._next_page(mock_page)
+        mock_page.goto.assert_called_once_with(
+            "https://indianapolis.craigslist.org/search/jwa?s=120", wait_until="domcontentloaded"
+        )
+        mock_page.query_selector.assert_not_called()
+        # The selector is embedded in the script rather than passed as an argument
+        script = mock_page.evaluate.call_args.args[0]
+        assert mock_page.evaluate.call_args.args == (script,)
+        assert json.dumps(adapter.SELECTORS["next_page"]) in script
+
+    @pytest.mark.asyncio
+    async def test_next_page_clicks_button(self) -> None:
+        """Test that a next-page button without a link is clicked."""
+        adapter = CraigslistAdapter(regions=["indianapolis"])
+
+        mock_page = AsyncMock()
+        mock_page.evaluate.return_value = True
+
+        assert await adapter._next_page(mock_page)
+        mock_page.click.assert_called_once_with(adapter.SELECTORS["next_page"])
+
+    @pytest.mark.asyncio
+    async def test_next_page_missing_or_disabled(self) -> None:
+        """Test that a missing or disabled next-page control stops pagination."""
+        adapter = CraigslistAdapter(regions=["indianapolis"])
+
+        mock_page = AsyncMock()
+        mock_page.evaluate.return_value = None
+
+        assert not await adapter._next_page(mock_page)
+        mock_page.goto.assert_not_called()
+        mock_page.click.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rss_feed_used_before_html(self) -> None:
+        """Test that RSS feed items become listings without HTML parsing or navigation."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+        feed = """<?xml version="1.0" encoding="utf-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/"
+         xmlns:enc="http://purl.oclc.org/net/rss_2.0/enc#">
+  <item rdf:about="https://indianapolis.craigslist.org/jwl/d/ring/123.html">
+    <title><![CDATA[Amethyst ring &#x0024;150]]></title>
+    <link>https://indianapolis.craigslist.org/jwl/d/ring/123.html</link>
+    <description><![CDATA[Gold band with pearls]]></description>
+    <enc:enclosure resource="https://images.craigslist.org/abc.jpg" type="image/jpeg"/>
+  </item>
+</rdf:RDF>"""
+
+        mock_page = AsyncMock()
+        response = MagicMock(ok=True, status=200)
+        response.text = AsyncMock(return_value=feed)
+        mock_page.context.request.get = AsyncMock(return_value=response)
+
+        listings = [listing async for listing in adapter._search_region(mock_page, "indianapolis", "ring")]
+
+        assert len(listings) == 1
+        assert listings[0].url == "https://indianapolis.craigslist.org/jwl/d/ring/123.html"
+        assert listings[0].title == "Amethyst ring $150"
+        assert listings[0].price == "$150"
+        assert listings[0].description == "Gold band with pearls"
+        assert listings[0].image_url == "https://images.craigslist.org/abc.jpg"
+        assert "format=rss" in mock_page.context.request.get.call_args.args[0]
+        mock_page.evaluate.assert_not_called()
+        mock_page.goto.assert_not_called()
+
+
+class TestTrekRedBarnExtraction:
+    """Tests for Trek Red Barn batch extraction."""
+
+    @pytest.mark.asyncio
+    async def test_extract_listings_single_evaluate_all(self) -> None:
+        """Test that all product tiles are read with one locator.evaluate_all call."""
+        adapter = TrekRedBarnAdapter()
+
+        locator = MagicMock()
+        locator.evaluate_all = AsyncMock(
+            return_value=[
+                {
+                    "url": "https://www.trekbikes.com/us/en_US/bikes/allant-7s/p/123",
+                    "title": "Allant+ 7S",
+                    "price": "$2,999",
+                    "imageUrl": "https://img/1.jpg",
+                    "category": "E-Bike",
+                },
+                {"url": None, "title": "No link", "price": None, "imageUrl": None, "category": None},
+                {
+                    "url": "https://www.trekbikes.com/us/en_US/bikes/x/p/456",
+                    "title": "",
+                    "price": None,
+                    "imageUrl": None,
+                    "category": None,
+                },
+            ]
+        )
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock(return_value=locator)
+
+        listings = await adapter._extract_listings(mock_page)
+
+        locator.evaluate_all.assert_called_once()
+        mock_page.query_selector_all.assert_not_called()
+        assert len(listings) == 1
+        assert listings[0].url == "https://www.trekbikes.com/us/en_US/bikes/allant-7s/p/123"
+        assert listings[0].description == "Category: E-Bike"
+        assert listings[0].image_url == "https://img/1.jpg"
+
+    @pytest.mark.asyncio
+    async def test_get_listing_details_single_evaluate(self) -> None:
+        """Test that detail fields and spec rows are read with one evaluate call."""
+        adapter = TrekRedBarnAdapter(min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.evaluate.return_value = {
+            "title": "Allant+ 7S",
+            "price": "$2,999",
+            "description": "Certified pre-owned",
+            "specs": ["  Battery: 625Wh ", "Color: Blue"],
+            "imageUrl": "https://img/1.jpg",
+        }
+
+        listing = await adapter.get_listing_details(mock_page, "https://www.trekbikes.com/p/123")
+
+        assert listing is not None
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector.assert_not_called()
+        assert listing.title == "Allant+ 7S"
+        assert listing.description == "Certified pre-owned\n\nSpecifications:\nbattery: 625wh"
+        # The hero image goes through the same lazy-load (data-src) resolution as cards
+        assert "data-src" in mock_page.evaluate.call_args.args[0]
+
+    def test_filter_specifications_keeps_key_rows(self) -> None:
+        """Test that only rows mentioning key bike specs are kept."""
+        assert TrekRedBarnAdapter._filter_specifications(["Motor: Bosch", "Color: Red"]) == "motor: bosch"
+        assert TrekRedBarnAdapter._filter_specifications(["Color: Red"]) is None
+
+
+class TestCardExtraction:
+    """Tests for single-evaluate card and detail extraction."""
+
+    @pytest.mark.asyncio
+    async def test_ebay_cards_read_in_one_evaluate(self) -> None:
+        """Test that eBay cards are read in one call and filtered in Python."""
+        adapter = EbayAdapter()
+
+        mock_page = AsyncMock()
+        mock_page.url = "https://www.ebay.com/sch/i.html?_nkw=ring"
+        mock_page.evaluate.return_value = [
+            {"url": "https://www.ebay.com/itm/1", "title": "Gold ring", "price": "$10", "imageUrl": None},
+            {"url": "https://www.ebay.com/itm/2", "title": "Shop on eBay", "price": None, "imageUrl": None},
+            {"url": "https://www.ebay.com/b/ads", "title": "Ad", "price": None, "imageUrl": None},
+        ]
+
+        listings = await adapter._extract_cards(mock_page)
+
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector_all.assert_not_called()
+        assert [listing.url for listing in listings] == ["https://www.ebay.com/itm/1"]
+        assert listings[0].price == "$10"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "adapter_class",
+        [
+            EbayAdapter,
+            EtsyAdapter,
+            MercariAdapter,
+            RubyLaneAdapter,
+            ShopGoodwillAdapter,
+            PinkbikeAdapter,
+            TrekRedBarnAdapter,
+        ],
+    )
+    async def test_details_read_without_title(self, adapter_class: type[MarketplaceAdapter]) -> None:
+        """Test that a detail page whose title never appears still yields the other details."""
+        adapter = adapter_class(min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.wait_for_selector.side_effect = PlaywrightTimeout("Timeout")
+        mock_page.evaluate.return_value = {
+            "title": None,
+            "price": "$40.00",
+            "description": "Amethyst and seed pearls",
+            "specs": None,
+            "imageUrl": "https://example.com/ring.jpg",
+        }
+
+        result = await adapter.get_listing_details(mock_page, "https://example.com/item/1")
+
+        assert result is not None
+        assert result.price == "$40.00"
+        assert result.description is not None and "Amethyst and seed pearls" in result.description
+        assert result.image_url == "https://example.com/ring.jpg"
+        mock_page.wait_for_load_state.assert_awaited_once_with("domcontentloaded")
+
+    @pytest.mark.asyncio
+    async def test_click_pagination_reads_each_page(self) -> None:
+        """Test that pages reached by clicking, with an unchanged URL, are each read from the DOM."""
+        adapter = EbayAdapter()
+
+        mock_page = AsyncMock()
+        mock_page.url = "https://www.ebay.com/sch/i.html?_nkw=ring"
+        mock_page.evaluate.side_effect = [
+            [{"url": "https://www.ebay.com/itm/1", "title": "Gold ring", "price": None, "imageUrl": None}],
+            [{"url": "https://www.ebay.com/itm/2", "title": "Silver ring", "price": None, "imageUrl": None}],
+        ]
+
+        first = await adapter._extract_cards(mock_page)
+        second = await adapter._extract_cards(mock_page)
+
+        assert [listing.url for listing in first] == ["https://www.ebay.com/itm/1"]
+        assert [listing.url for listing in second] == ["https://www.ebay.com/itm/2"]
+
+    @pytest.mark.asyncio
+    async def test_ebay_search_commits_then_waits_for_results(self) -> None:
+        """Test that search navigation stops at commit and waits for results or the no-results marker."""
+        adapter = EbayAdapter(min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.query_selector.return_value = MagicMock()  # No-results marker present
+
+        listings = [listing async for listing in adapter._search_query(mock_page, "ring")]
+
+        assert listings == []
+        assert mock_page.goto.call_args.kwargs["wait_until"] == "commit"
+        waited = mock_page.wait_for_selector.call_args.args[0]
+        assert adapter.SELECTORS["listing"] in waited
+        assert adapter.SELECTORS["no_results"] in waited
+
+    @pytest.mark.asyncio
+    async def test_etsy_title_falls_back_to_image_alt(self) -> None:
+        """Test that Etsy cards without a title use the image alt text."""
+        adapter = EtsyAdapter()
+
+        mock_page = AsyncMock()
+        mock_page.url = "https://www.etsy.com/search?q=ring"
+        mock_page.evaluate.return_value = [
+            {
+                "url": "https://www.etsy.com/listing/9/ring",
+                "title": None,
+                "price": None,
+                "imageUrl": None,
+                "imageAlt": "Pearl ring",
+            }
+        ]
+
+        listings = await adapter._extract_cards(mock_page)
+
+        # The image is read once per card, in the same call as the other fields
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector_all.assert_not_called()
+        assert listings[0].url == "https://www.etsy.com/listing/9/ring"
+        assert listings[0].title == "Pearl ring"
+
+    @pytest.mark.asyncio
+    async def test_rubylane_cards_read_in_one_call(self) -> None:
+        """Test that Ruby Lane cards are mapped by one locator.evaluate_all call."""
+        adapter = RubyLaneAdapter()
+
+        locator = MagicMock()
+        locator.evaluate_all = AsyncMock(
+            return_value=[
+                {
+                    "url": "https://www.rubylane.com/item/1-ring",
+                    "title": "Amethyst ring",
+                    "price": "$75",
+                    "imageUrl": None,
+                },
+                {"url": None, "title": "No link", "price": None, "imageUrl": None},
+            ]
+        )
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock(return_value=locator)
+
+        listings = await adapter._extract_listings(mock_page)
+
+        locator.evaluate_all.assert_called_once()
+        mock_page.locator.assert_called_once_with(adapter.SELECTORS["listing"])
+        mock_page.query_selector_all.assert_not_called()
+        assert [listing.url for listing in listings] == ["https://www.rubylane.com/item/1-ring"]
+        assert listings[0].price == "$75"
+
+    @pytest.mark.asyncio
+    async def test_pinkbike_cards_read_in_one_call(self) -> None:
+        """Test that Pinkbike cards, with location, are read in one locator.evaluate_all call."""
+        adapter = PinkbikeAdapter()
+
+        locator = MagicMock()
+        locator.evaluate_all = AsyncMock()
+        locator.evaluate_all.return_value = [
+            {
+                "url": "/buysell/123/",
+                "title": "Trek Allant+ 7S",
+                "price": "$3,200",
+                "imageUrl": "//ep1.pinkbike.org/p5pb123/p5pb123.jpg",
+                "location": "Denver, CO",
+            },
+            {"url": "https://www.pinkbike.com/buysell/124/", "title": None, "price": None, "imageUrl": None},
+        ]
+        mock_page = AsyncMock()
+        mock_page.locator = MagicMock(return_value=locator)
+
+        listings = await adapter._extract_listings(mock_page)
+
+        locator.evaluate_all.assert_called_once()
+        mock_page.query_selector_all.assert_not_called()
+        assert [listing.url for listing in listings] == ["https://www.pinkbike.com/buysell/123/"]
+        assert listings[0].price == "$3,200"
+        assert listings[0].description == "Location: Denver, CO"
+        assert listings[0].image_url == "https://ep1.pinkbike.org/p5pb123/p5pb123.jpg"
+
+    @pytest.mark.asyncio
+    async def test_pinkbike_http_fast_path_skips_navigation(self) -> None:
+        """Test that Pinkbike's static HTML is parsed without rendering the page."""
+        adapter = PinkbikeAdapter(min_delay=0, max_delay=0, use_http=True)
+
+        mock_page = AsyncMock()
+        response = MagicMock(ok=True, status=200)
+        response.text = AsyncMock(return_value="<html></html>")
+        mock_page.context.request.get = AsyncMock(return_value=response)
+        mock_page.evaluate.return_value = {
+            "cards": [{"url": "/buysell/123/", "title": "Trek Allant+ 7S", "price": "$3,200"}],
+            "hasNext": False,
+        }
+
+        listings = [listing async for listing in adapter._search_query(mock_page, "allant")]
+
+        assert [listing.url for listing in listings] == ["https://www.pinkbike.com/buysell/123/"]
+        assert "querySelectorAll(selectors.listing)" in mock_page.evaluate.call_args.args[0]
+        mock_page.context.request.get.assert_called_once()
+        mock_page.goto.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pinkbike_http_follows_next_page_links(self) -> None:
+        """Test that static pages are fetched in turn while each links a next page, up to MAX_PAGES."""
+        adapter = PinkbikeAdapter(min_delay=0, max_delay=0, use_http=True)
+
+        mock_page = AsyncMock()
+        response = MagicMock(ok=True, status=200)
+        response.text = AsyncMock(return_value="<html></html>")
+        mock_page.context.request.get = AsyncMock(return_value=response)
+        mock_page.evaluate.side_effect = [
+            {"cards": [{"url": f"/buysell/{n}/", "title": "Trek Allant+ 7S"}], "hasNext": True} for n in range(5)
+        ]
+
+        listings = [listing async for listing in adapter._search_query(mock_page, "allant")]
+
+        assert len(listings) == adapter.MAX_PAGES
+        urls = [call.args[0] for call in mock_page.context.request.get.call_args_list]
+        assert [url.rsplit("&page=", 1)[1] for url in urls] == ["1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_pinkbike_http_failure_falls_back_to_browser(self) -> None:
+        """Test that a blocked Pinkbike fetch falls back to rendering the page."""
+        adapter = PinkbikeAdapter(min_delay=0, max_delay=0, use_http=True)
+
+        mock_page = AsyncMock()
+        mock_page.context.request.get = AsyncMock(return_value=MagicMock(ok=False, status=403))
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.query_selector.return_value = None
+        mock_page.locator = MagicMock(return_value=MagicMock(evaluate_all=AsyncMock(return_value=[])))
+        mock_page.evaluate.return_value = None
+
+        _ = [listing async for listing in adapter._search_query(mock_page, "allant")]
+
+        mock_page.goto.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mercari_search_polls_for_hydration(self) -> None:
+        """Test that a slow Mercari SPA falls through to extraction instead of aborting."""
+        adapter = MercariAdapter(min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.wait_for_function.side_effect = PlaywrightTimeout("still hydrating")
+        mock_page.query_selector.return_value = None
+        mock_page.evaluate.return_value = [
+            {"url": "https://www.mercari.com/us/item/m1/", "title": "Ring", "price": "$40", "imageUrl": None}
+        ]
+
+        listings = [listing async for listing in adapter._search_query(mock_page, "ring")]
+
+        assert mock_page.wait_for_function.call_args.kwargs["timeout"] == 5000
+        mock_page.wait_for_timeout.assert_not_called()
+        assert [listing.url for listing in listings] == ["https://www.mercari.com/us/item/m1/"]
+
+    @pytest.mark.asyncio
+    async def test_mercari_details_single_evaluate(self) -> None:
+        """Test that Mercari detail pages are read with one evaluate call."""
+        adapter = MercariAdapter(min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.evaluate.return_value = {
+            "title": "Amethyst ring",
+            "price": "$ 40",
+            "description": "x" * 600,
+            "specs": None,
+            "imageUrl": "https://static.mercdn.net/1.jpg",
+        }
+
+        listing = await adapter.get_listing_details(mock_page, "https://www.mercari.com/us/item/m1/")
+
+        assert listing is not None
+        mock_page.evaluate.assert_called_once()
+        mock_page.query_selector.assert_not_called()
+        assert listing.price == "$ 40"
+        assert listing.description == "x" * 500
+        assert mock_page.goto.call_args.kwargs["wait_until"] == "commit"
+        mock_page.wait_for_selector.assert_called_once_with(
+            adapter.SELECTORS["detail_title"], state="attached", timeout=10000
+        )
+        mock_page.wait_for_timeout.assert_not_called()
+
+
+class TestMergeSearches:
+    """Tests for concurrent search job merging."""
+
+    @pytest.mark.asyncio
+    async def test_runs_jobs_in_separate_tabs(self) -> None:
+        """Test that multiple jobs each get their own tab and all listings are yielded."""
+        adapter = CraigslistAdapter(regions=["indianapolis", "chicago"], max_concurrency=2)
+
+        mock_page = AsyncMock()
+        tabs = [AsyncMock(), AsyncMock()]
+        mock_page.context.new_page = AsyncMock(side_effect=tabs)
+
+        async def job(page):
+            yield Listing(url=f"https://example.com/{id(page)}", source="test", title="Ring")
+
+        listings = [listing async for listing in adapter._merge_searches(mock_page, [job, job])]
+
+        assert len(listings) == 2
+        assert mock_page.context.new_page.call_count == 2
+        for tab in tabs:
+            tab.route.assert_called_once()
+            tab.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_yielded_once(self) -> None:
+        """Test that a listing found by several jobs is only yielded once."""
+        adapter = CraigslistAdapter(regions=["indianapolis", "chicago"], max_concurrency=2)
+
+        mock_page = AsyncMock()
+        mock_page.context.new_page = AsyncMock(side_effect=[AsyncMock(), AsyncMock()])
+
+        async def job(page):
+            yield Listing(url="https://example.com/shared", source="test", title="Ring")
+            yield Listing(url="https://example.com/shared", source="test", title="Ring")
+
+        listings = [listing async for listing in adapter._merge_searches(mock_page, [job, job])]
+
+        assert [listing.url for listing in listings] == ["https://example.com/shared"]
+
+    @pytest.mark.asyncio
+    async def test_ebay_queries_run_as_separate_jobs(self) -> None:
+        """Test that each eBay query is searched in its own tab."""
+        adapter = EbayAdapter(min_delay=0, max_delay=0, max_concurrency=2)
+        searched: list[tuple[object, str]] = []
+
+        async def search_query(page, query):
+            searched.append((page, query))
+            yield Listing(url=f"https://www.ebay.com/itm/{query}", source="ebay", title=query)
+
+        adapter._search_query = search_query  # type: ignore[method-assign]
+        mock_page = AsyncMock()
+        tabs = [AsyncMock(), AsyncMock()]
+        mock_page.context.new_page = AsyncMock(side_effect=tabs)
+
+        listings = [listing async for listing in adapter.search(mock_page, ["amethyst", "pearl"])]
+
+        assert sorted(listing.title for listing in listings) == ["amethyst", "pearl"]
+        assert {page for page, _ in searched} == set(tabs)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("adapter_cls", [ShopGoodwillAdapter, RubyLaneAdapter, PoshmarkAdapter])
+    async def test_queries_load_concurrently_in_tabs(self, adapter_cls) -> None:
+        """Test that each query opens its own tab and both searches overlap."""
+        adapter = adapter_cls(min_delay=0, max_delay=0, max_concurrency=2)
+        both_started = asyncio.Event()
+        started: list[str] = []
+
+        async def search_query(page, query):
+            started.append(query)
+            if len(started) == 2:
+                both_started.set()
+            # Only completes if the other query is running at the same time
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            yield Listing(url=f"{adapter.BASE_URL}/{query}", source=adapter.NAME, title=query)
+
+        adapter._search_query = search_query  # type: ignore[method-assign]
+        mock_page = AsyncMock()
+        mock_page.context.new_page = AsyncMock(side_effect=[AsyncMock(), AsyncMock()])
+
+        listings = [listing async for listing in adapter.search(mock_page, ["amethyst", "pearl"])]
+
+        assert sorted(listing.title for listing in listings) == ["amethyst", "pearl"]
+        assert mock_page.context.new_page.call_count == 2
+
+    @pytest.mark.parametrize("adapter_cls", [EbayAdapter, PinkbikeAdapter, PoshmarkAdapter, ShopGoodwillAdapter])
+    def test_search_returns_merged_iterator_directly(self, adapter_cls) -> None:
+        """Test that search() hands back the merged iterator without an extra generator per listing."""
+        results = adapter_cls().search(AsyncMock(), ["ring"])
+
+        assert results.ag_code is merge_jobs.__code__  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("adapter_cls", [PinkbikeAdapter, TrekRedBarnAdapter])
+    async def test_single_page_of_results_loads_once(self, adapter_cls) -> None:
+        """Test that no later page is requested when the first links no next page."""
+        adapter = adapter_cls(min_delay=0, max_delay=0, max_concurrency=3)
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.query_selector.return_value = None
+        cards = [{"url": f"{adapter.BASE_URL}/p/1", "title": "Allant+ 7S"}]
+        mock_page.locator = MagicMock(return_value=MagicMock(evaluate_all=AsyncMock(return_value=cards)))
+        mock_page.evaluate.return_value = None
+
+        listings = [listing async for listing in adapter.search(mock_page, ["allant"])]
+
+        assert [listing.url for listing in listings] == [f"{adapter.BASE_URL}/p/1"]
+        mock_page.goto.assert_called_once()
+        mock_page.context.new_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("adapter_cls", [PinkbikeAdapter, TrekRedBarnAdapter])
+    async def test_next_page_followed_up_to_max_pages(self, adapter_cls) -> None:
+        """Test that linked next pages load in a prefetch tab, stopping at MAX_PAGES."""
+        adapter = adapter_cls(min_delay=0, max_delay=0, max_concurrency=3)
+        pages = [AsyncMock() for _ in range(adapter.MAX_PAGES)]
+        for number, tab in enumerate(pages):
+            tab.goto.return_value = MagicMock(status=200)
+            tab.query_selector.return_value = None
+            # A tile repeated on every page, and one of the page's own
+            cards = [
+                {"url": f"{adapter.BASE_URL}/p/featured", "title": "Allant+ 7S"},
+                {"url": f"{adapter.BASE_URL}/p/{number}", "title": "Allant+ 7"},
+            ]
+            tab.locator = MagicMock(return_value=MagicMock(evaluate_all=AsyncMock(return_value=cards)))
+            tab.evaluate.return_value = f"{adapter.BASE_URL}/search?page={number + 2}"
+        mock_page = pages[0]
+        mock_page.context.new_page = AsyncMock(side_effect=pages[1:])
+
+        listings = [listing async for listing in adapter.search(mock_page, ["allant"])]
+
+        expected = ["featured"] + [str(n) for n in range(adapter.MAX_PAGES)]
+        assert sorted(listing.url.rsplit("/", 1)[1] for listing in listings) == sorted(expected)
+        assert [tab.goto.call_args.args[0].rsplit("=", 1)[1] for tab in pages[1:]] == ["2", "3"]
+        assert mock_page.context.new_page.call_count == adapter.MAX_PAGES - 1
+
+    @pytest.mark.asyncio
+    async def test_open_pages_capped_across_jobs(self) -> None:
+        """Test that the shared page slots bound tabs open at once."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], max_concurrency=4, limits=AdapterLimits(max_open_pages=1))
+
+        open_now = 0
+        peak = 0
+
+        async def new_page():
+            nonlocal open_now, peak
+            open_now += 1
+            peak = max(peak, open_now)
+            tab = AsyncMock()
+
+            async def close():
+                nonlocal open_now
+                open_now -= 1
+
+            tab.close = close
+            return tab
+
+        mock_page = AsyncMock()
+        mock_page.context.new_page = new_page
+
+        async def job(page):
+            await asyncio.sleep(0)
+            yield Listing(url=f"https://example.com/{id(page)}", source="test", title="Ring")
+
+        listings = [listing async for listing in adapter._merge_searches(mock_page, [job, job, job])]
+
+        assert len(listings) == 3
+        assert peak == 1
+        assert open_now == 0
+
+    @pytest.mark.asyncio
+    async def test_single_job_reuses_page(self) -> None:
+        """Test that a single job runs on the given page without opening a tab."""
+        adapter = CraigslistAdapter(regions=["indianapolis"])
+
+        mock_page = AsyncMock()
+        seen_pages = []
+
+        async def job(page):
+            seen_pages.append(page)
+            yield Listing(url="https://example.com/1", source="test", title="Ring")
+
+        listings = [listing async for listing in adapter._merge_searches(mock_page, [job])]
+
+        assert len(listings) == 1
+        assert seen_pages == [mock_page]
+        mock_page.context.new_page.assert_not_called()
+        mock_page.route.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_attach_blocks_heavy_resources(self) -> None:
+        """Test that the route handler aborts images but lets documents through."""
+        adapter = CraigslistAdapter(regions=["indianapolis"])
+        mock_page = AsyncMock()
+
+        await adapter.attach(mock_page)
+        handler = mock_page.route.call_args.args[1]
+
+        image_route = AsyncMock()
+        image_route.request = MagicMock(resource_type="image", url="https://example.com/a.jpg")
+        await handler(image_route)
+        image_route.abort.assert_called_once()
+        image_route.continue_.assert_not_called()
+
+        doc_route = AsyncMock()
+        doc_route.request = MagicMock(resource_type="document", url="https://example.com/search")
+        await handler(doc_route)
+        doc_route.continue_.assert_called_once()
+        doc_route.abort.assert_not_called()
+
+        tracker_route = AsyncMock()
+        tracker_route.request = MagicMock(resource_type="script", url="https://www.google-analytics.com/analytics.js")
+        await handler(tracker_route)
+        tracker_route.abort.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_job_does_not_stop_others(self) -> None:
+        """Test that an error in one job doesn't prevent other jobs' listings."""
+        adapter = CraigslistAdapter(regions=["indianapolis", "chicago"])
+
+        mock_page = AsyncMock()
+
+        async def good_job(page):
+            yield Listing(url="https://example.com/good", source="test", title="Ring")
+
+        async def bad_job(page):
+            raise RuntimeError("boom")
+            yield  # pragma: no cover
+
+        listings = [listing async for listing in adapter._merge_searches(mock_page, [bad_job, good_job])]
+
+        assert [listing.url for listing in listings] == ["https://example.com/good"]
+
+
+class TestSearchRetries:
+    """Tests for retrying search jobs after timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_before_results_is_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a query timing out before yielding anything is run again."""
+        monkeypatch.setattr("src.adapters.base.SEARCH_RETRY_DELAY", 0)
+        adapter = EbayAdapter(min_delay=0, max_delay=0)
+        attempts = 0
+
+        async def run_query(page, query):
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise PlaywrightTimeout("navigation timed out")
+            yield Listing(url="https://www.ebay.com/itm/1", source="ebay", title=query)
+
+        adapter._run_query = run_query  # type: ignore[method-assign]
+
+        listings = [listing async for listing in adapter._search_query(AsyncMock(), "ring")]
+
+        assert attempts == 3
+        assert [listing.url for listing in listings] == ["https://www.ebay.com/itm/1"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_after_results_keeps_them(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a timeout after partial results is not retried."""
+        monkeypatch.setattr("src.adapters.base.SEARCH_RETRY_DELAY", 0)
+        adapter = EtsyAdapter(min_delay=0, max_delay=0)
+        attempts = 0
+
+        async def run_query(page, query):
+            nonlocal attempts
+            attempts += 1
+            yield Listing(url="https://www.etsy.com/listing/1", source="etsy", title=query)
+            raise PlaywrightTimeout("next page timed out")
+
+        adapter._run_query = run_query  # type: ignore[method-assign]
+
+        listings = [listing async for listing in adapter._search_query(AsyncMock(), "ring")]
+
+        assert attempts == 1
+        assert len(listings) == 1
+
+
+class TestPagination:
+    """Tests for prefetching pagination."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_loaded_in_tab_before_current_consumed(self) -> None:
+        """Test that a linked next page loads in a second tab while page 1 is yielded."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+
+        tab = AsyncMock()
+        tab.goto.return_value = MagicMock(status=200)
+        tab.evaluate.return_value = None  # No third page
+        mock_page = AsyncMock()
+        mock_page.evaluate.return_value = "https://indianapolis.craigslist.org/search/jwa?s=120"
+        mock_page.context.new_page = AsyncMock(return_value=tab)
+
+        async def read(page):
+            name = "tab" if page is tab else "first"
+            return [Listing(url=f"https://example.com/{name}", source="test", title=name)]
+
+        seen = []
+        async for listing in adapter._paginate(mock_page, read, max_pages=3):
+            await asyncio.sleep(0)
+            seen.append((listing.title, tab.goto.called))
+
+        # Page 2 was already requested while page 1's listing was being consumed
+        assert seen == [("first", True), ("tab", True)]
+        tab.goto.assert_called_once_with(
+            "https://indianapolis.craigslist.org/search/jwa?s=120", wait_until="domcontentloaded"
+        )
+        tab.close.assert_called_once()
+        mock_page.goto.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_does_not_deadlock_at_max_concurrency(self) -> None:
+        """Test that every job can prefetch while all open-page slots are taken."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0, max_concurrency=MAX_OPEN_PAGES)
+
+        def new_tab() -> AsyncMock:
+            tab = AsyncMock()
+            tab.goto.return_value = MagicMock(status=200)
+            tab.evaluate.return_value = "https://indianapolis.craigslist.org/search/jwa?s=120"
+            tab.context = mock_page.context
+            return tab
+
+        mock_page = AsyncMock()
+        mock_page.context.new_page = AsyncMock(side_effect=lambda: new_tab())
+
+        pages_read = 0
+
+        async def read(page):
+            nonlocal pages_read
+            pages_read += 1
+            return [Listing(url=f"https://example.com/{pages_read}", source="test", title="Ring")]
+
+        def job(page):
+            return adapter._paginate(page, read, max_pages=2)
+
+        async def run() -> list[Listing]:
+            # The orchestrator's search tab holds a slot of its own
+            async with adapter.open_page(mock_page.context):
+                return [listing async for listing in adapter._merge_searches(mock_page, [job] * MAX_OPEN_PAGES)]
+
+        listings = await asyncio.wait_for(run(), timeout=5)
+
+        assert len(listings) == 2 * MAX_OPEN_PAGES
+
+    @pytest.mark.asyncio
+    async def test_click_only_next_page_followed_after_consumption(self) -> None:
+        """Test that a next-page button without a link is clicked on the same page."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.evaluate.side_effect = [True, None]
+
+        pages_read = 0
+
+        async def read(page):
+            nonlocal pages_read
+            pages_read += 1
+            return [Listing(url=f"https://example.com/{pages_read}", source="test", title="Ring")]
+
+        listings = [listing async for listing in adapter._paginate(mock_page, read, max_pages=3)]
+
+        assert [listing.url for listing in listings] == ["https://example.com/1", "https://example.com/2"]
+        mock_page.click.assert_called_once()
+        mock_page.context.new_page.assert_not_called()
+
+
+class TestSelectorNormalization:
+    """Tests for selector list normalization."""
+
+    def test_normalize_strips_and_dedupes(self) -> None:
+        """Test whitespace around top-level commas is stripped and duplicates dropped."""
+        assert normalize_selector(" .a ,.b,  .a ") == ".a, .b"
+
+    def test_normalize_preserves_nested_commas(self) -> None:
+        """Test commas inside attribute values and pseudo-classes are kept."""
+        selector = "[aria-label='next, page'] , :is(.x, .y)"
+        assert normalize_selector(selector) == "[aria-label='next, page'], :is(.x, .y)"
+
+    def test_subclass_selectors_compiled(self) -> None:
+        """Test adapter subclasses get normalized selectors at class creation."""
+        assert CraigslistAdapter._COMPILED_SELECTORS is CraigslistAdapter.SELECTORS
+        assert "next_page" in CraigslistAdapter.SELECTORS
+
+    def test_bind_selectors_embeds_json_once(self) -> None:
+        """Test scripts get the adapter's selectors embedded and are built once per class."""
+        script = "(selectors) => selectors.listing"
+        bound = EbayAdapter._bind_selectors(script)
+
+        assert bound.startswith("() => ((selectors) => selectors.listing)({")
+        assert json.loads(bound[bound.index("{") : -1]) == EbayAdapter.SELECTORS
+        assert EbayAdapter._bind_selectors(script) is bound
+        assert EtsyAdapter._bind_selectors(script) != bound
+        assert EbayAdapter._bind_selectors(script, takes_elements=True).startswith("(elements) => (")
+
+
+class TestTextHelpers:
+    """Tests for shared text extraction helpers."""
+
+    def test_normalize_price_collapses_whitespace(self) -> None:
+        """Test price text is single-spaced and empty text becomes None."""
+        assert normalize_price("  US $\n  45.00 ") == "US $ 45.00"
+        assert normalize_price("   ") is None
+        assert normalize_price(None) is None
+
+    def test_search_urls_use_quoted_query(self) -> None:
+        """Test search URL templates are filled with the memoized, quoted query."""
+        assert quote_query("amethyst & pearl") == "amethyst+%26+pearl"
+        assert quote_query("amethyst & pearl") is quote_query("amethyst & pearl")
+        assert (
+            ShopGoodwillAdapter.SEARCH_URL.format(query=quote_query("gold ring"))
+            == "https://shopgoodwill.com/search?q=gold+ring&category=Jewelry"
+        )
+
+    @pytest.mark.asyncio
+    async def test_first_text_strips_and_limits(self) -> None:
+        """Test first-match text is stripped and truncated."""
+        child = AsyncMock()
+        child.text_content.return_value = "  A long description  "
+        parent = AsyncMock()
+        parent.query_selector.return_value = child
+
+        assert await CraigslistAdapter._first_text(parent, ".desc") == "A long description"
+        assert await CraigslistAdapter._first_text(parent, ".desc", limit=6) == "A long"
+
+        parent.query_selector.return_value = None
+        assert await CraigslistAdapter._first_text(parent, ".desc") is None
+
+
+class TestDetailCache:
+    """Tests for memoized listing details."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_listing_details_cached_by_url(self) -> None:
+        """Test repeated fetches for the same URL only scrape once."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.evaluate.return_value = {"title": "Ring", "price": None, "description": None, "imageUrl": None}
+        url = "https://indianapolis.craigslist.org/jwl/d/ring/123.html"
+
+        first = await adapter.fetch_listing_details(mock_page, url)
+        second = await adapter.fetch_listing_details(mock_page, url)
+
+        assert first is second
+        mock_page.goto.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_details_fetched_again(self, monkeypatch) -> None:
+        """Test that cached details older than the TTL are scraped again."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+        fetched: list[str] = []
+
+        async def details(page, url):
+            fetched.append(url)
+            return Listing(url=url, source="test", title=url)
+
+        adapter.get_listing_details = details  # type: ignore[method-assign]
+        url = "https://example.com/1"
+
+        await adapter.fetch_listing_details(AsyncMock(), url)
+        monkeypatch.setattr(adapter, "DETAIL_CACHE_TTL", -1.0)
+        await adapter.fetch_listing_details(AsyncMock(), url)
+
+        assert fetched == [url, url]
+
+    def test_detail_ttl_per_adapter(self) -> None:
+        """Test that auction details expire sooner than fixed-price pages."""
+        assert ShopGoodwillAdapter.DETAIL_CACHE_TTL < EbayAdapter.DETAIL_CACHE_TTL < TrekRedBarnAdapter.DETAIL_CACHE_TTL
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_for_same_url_coalesce(self) -> None:
+        """Test that simultaneous requests for one URL share a single scrape."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+        fetched: list[str] = []
+
+        async def details(page, url):
+            fetched.append(url)
+            await asyncio.sleep(0.01)
+            return Listing(url=url, source="test", title=url)
+
+        adapter.get_listing_details = details  # type: ignore[method-assign]
+        url = "https://example.com/1"
+
+        results = await asyncio.gather(*(adapter.fetch_listing_details(AsyncMock(), url) for _ in range(3)))
+
+        assert fetched == [url]
+        assert results[0] is results[1] is results[2]
+        assert adapter._detail_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_staggered_fetches_for_same_url_never_overlap(self) -> None:
+        """Test that a caller arriving after the first fetch waits behind the one still queued."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+        running = 0
+        overlap = 0
+
+        async def details(page, url):
+            nonlocal running, overlap
+            running += 1
+            overlap = max(overlap, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return None  # Failed fetches aren't cached, so each waiter fetches in turn
+
+        adapter.get_listing_details = details  # type: ignore[method-assign]
+        url = "https://example.com/1"
+
+        async def call(delay: float) -> Listing | None:
+            await asyncio.sleep(delay)
+            return await adapter.fetch_listing_details(AsyncMock(), url)
+
+        # The third caller arrives after the first fetch ends, while the second is fetching
+        await asyncio.gather(call(0), call(0.01), call(0.07))
+
+        assert overlap == 1
+        assert adapter._detail_locks == {}
+        assert adapter._detail_users == {}
+
+    @pytest.mark.asyncio
+    async def test_get_listing_details_batch_preserves_order(self) -> None:
+        """Test that batch fetches use separate pages and return results in URL order."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+
+        async def details(page, url):
+            return None if url.endswith("bad") else Listing(url=url, source="test", title=url)
+
+        adapter.get_listing_details = details  # type: ignore[method-assign]
+        context = AsyncMock()
+        urls = ["https://example.com/1", "https://example.com/bad", "https://example.com/2"]
+
+        results = await adapter.get_listing_details_batch(context, urls, concurrency=2)
+
+        assert [r.url if r else None for r in results] == ["https://example.com/1", None, "https://example.com/2"]
+        assert context.new_page.call_count == 3
+        # Detail pages are only read, so heavy resources are blocked on them
+        assert context.new_page.return_value.route.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_listing_details_batch_fetches_repeats_once(self) -> None:
+        """Test that a URL listed twice in a batch is only loaded once."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0, max_delay=0)
+        fetched: list[str] = []
+
+        async def details(page, url):
+            fetched.append(url)
+            return Listing(url=url, source="test", title=url)
+
+        adapter.get_listing_details = details  # type: ignore[method-assign]
+        urls = ["https://example.com/1", "https://example.com/2", "https://example.com/1"]
+
+        results = await adapter.get_listing_details_batch(AsyncMock(), urls)
+
+        assert sorted(fetched) == ["https://example.com/1", "https://example.com/2"]
+        assert [r.url if r else None for r in results] == urls
+
+
+class TestAdapterRegistry:
+    """Tests for the lazy adapter registry."""
+
+    def test_adapter_map_resolves_self_registered_classes(self) -> None:
+        """Test that ADAPTER_MAP returns the class registered by the adapter module."""
+        from src.adapters import ADAPTER_MAP, EbayAdapter
+        from src.adapters.base import ADAPTER_REGISTRY
+
+        assert ADAPTER_MAP["ebay"] is EbayAdapter
+        assert ADAPTER_REGISTRY["ebay"] is EbayAdapter
+        assert set(ADAPTER_MAP) >= {"craigslist", "pinkbike", "trek_redbarn"}
+
+    def test_select_adapters_restricts_names(self) -> None:
+        """Test that a selected adapter map exposes only the named marketplaces."""
+        from src.adapters import select_adapters
+
+        adapters = select_adapters("ebay", "etsy")
+
+        assert list(adapters) == ["ebay", "etsy"]
+        assert "craigslist" not in adapters
+        with pytest.raises(KeyError):
+            adapters["craigslist"]
+
+    def test_select_adapters_rejects_unknown(self) -> None:
+        """Test that unknown marketplace names are rejected."""
+        from src.adapters import select_adapters
+
+        with pytest.raises(ValueError):
+            select_adapters("nonexistent")
+
+    def test_dir_lists_unloaded_adapters(self) -> None:
+        """Test that dir() includes adapter classes before they are imported."""
+        import src.adapters
+
+        assert {"CraigslistAdapter", "TrekRedBarnAdapter", "select_adapters"} <= set(dir(src.adapters))
+
+    def test_package_import_does_not_load_playwright(self) -> None:
+        """Test that importing the adapter package alone leaves Playwright unloaded."""
+        code = "import sys, src.adapters; sys.exit('playwright' in sys.modules)"
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent)
+
+        assert result.returncode == 0
+
+    def test_adapter_modules_define_each_class_once(self) -> None:
+        """Test that no adapter module redefines a class, silently replacing the first."""
+        adapters_dir = Path(__file__).parent.parent / "src" / "adapters"
+
+        for module in adapters_dir.glob("*.py"):
+            tree = ast.parse(module.read_text())
+            names = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+            assert len(names) == len(set(names)), f"{module.name} redefines a class"
@@ -1,8 +1,12 @@
 """Integration tests for bike search workflow."""
 
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from src.bike_scoring import BikeRelevanceScorer
 from src.bike_search import BikeSearchOrchestrator, create_orchestrator
@@ -96,6 +100,14 @@ class TestOrchestratorFactory:
         assert type(orchestrator) is SearchOrchestrator
         assert isinstance(orchestrator.scorer, RelevanceScorer)
 
+    def test_config_parsed_once(self, bike_config_path: Path):
+        """Test that the factory hands its parsed config to the orchestrator."""
+        with patch("src.ring_search.yaml.safe_load", wraps=yaml.safe_load) as safe_load:
+            orchestrator = create_orchestrator(bike_config_path)
+
+        safe_load.assert_called_once()
+        assert "target_bike" in orchestrator.config
+
 
 class TestBikeSearchOrchestrator:
     """Tests for BikeSearchOrchestrator."""
@@ -129,6 +141,29 @@ class TestBikeSearchOrchestrator:
         assert "ebay" in orchestrator.ADAPTER_MAP
         assert "craigslist" in orchestrator.ADAPTER_MAP
 
+    def test_create_bike_adapters(self, bike_config_path: Path):
+        """Test that bike adapters are built from the registry with their options."""
+        orchestrator = BikeSearchOrchestrator(bike_config_path)
+
+        pinkbike = orchestrator._create_adapter({"name": "pinkbike", "use_http": True, "max_concurrent_pages": 2})
+        redbarn = orchestrator._create_adapter({"name": "trek_redbarn"})
+
+        assert pinkbike is not None and pinkbike.NAME == "pinkbike"
+        assert pinkbike.use_http is True
+        assert pinkbike.max_concurrency == 2
+        assert redbarn is not None and redbarn.NAME == "trek_redbarn"
+
+    def test_import_loads_no_adapter_modules(self):
+        """Test that importing the bike orchestrator leaves adapters to be loaded on first use."""
+        code = (
+            "import sys, src.bike_search; "
+            "sys.exit(any(m.startswith('src.adapters.') and m != 'src.adapters.base' for m in sys.modules))"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent)
+
+        assert result.returncode == 0
+
 
 class TestBikeScoringIntegration:
     """Integration tests for bike scoring with realistic data."""
@@ -243,6 +243,17 @@ class TestConfidenceClassification:
         assert result.confidence == "low"
         assert result.score < 40
 
+    def test_confidence_table_matches_thresholds(self, scorer: BikeRelevanceScorer):
+        """Test that the precomputed confidence levels follow THRESHOLDS at the boundaries."""
+        assert [scorer._classify_confidence(s) for s in (0, 39, 40, 69, 70, 100)] == [
+            "low",
+            "low",
+            "medium",
+            "medium",
+            "high",
+            "high",
+        ]
+
 
 class TestScoreCapping:
     """Tests for score bounds."""
@@ -326,3 +337,70 @@ class TestIntegration:
         # Should be medium confidence - has some but not all criteria
         assert result.confidence in ["medium", "low"]
         assert "battery: 625Wh" in result.matched_factors
+
+
+class TestCategoryScan:
+    """Tests for the single-pass category scan."""
+
+    @pytest.mark.parametrize(
+        ("phrase", "category"),
+        [
+            ("allant+7s", "model_allant_7s"),
+            ("allant plus 7s", "model_allant_7s"),
+            ("allant+ 7", "model_allant_7"),
+            ("allant +", "model_allant_plus"),
+            ("speed pedelec", "class_3"),
+            ("20 mph", "class_1"),
+            ("625 wh", "battery_625wh"),
+            ("500wh", "battery_500wh"),
+            ("two batteries", "range_extender"),
+            ("additional battery", "range_extender"),
+            ("extra battery", "range_extender"),
+            ("frame: l", "frame_large"),
+            ("(l)", "frame_large"),
+            ("56 cm", "frame_large"),
+        ],
+    )
+    def test_every_pattern_passes_start_gate(self, scorer: BikeRelevanceScorer, phrase: str, category: str):
+        """Test that the start-character gate lets every category's patterns match."""
+        assert category in scorer._match_categories(f"bike {phrase} for sale")
+
+    def test_score_many_matches_individual_scores(self, scorer: BikeRelevanceScorer):
+        """Test that batch scoring attributes each match to its own listing."""
+        listings = [
+            Listing(url="https://example.com/1", source="ebay", title="Trek Allant+ 7S", description="625Wh, size L"),
+            Listing(url="https://example.com/2", source="ebay", title="Commuter bike", description=None),
+            Listing(url="https://example.com/3", source="ebay", title="Allant+ 7", description="Class 1, 20 mph"),
+            Listing(url="https://example.com/4", source="ebay", title="Large", description="range extender"),
+        ]
+
+        batch = scorer.score_many(listings)
+
+        assert [(r.url, r.score, r.matched_factors) for r in batch] == [
+            (r.url, r.score, r.matched_factors) for r in map(scorer.score, listings)
+        ]
+        assert scorer.score_many([]) == []
+
+    def test_score_many_matches_individual_scores_with_nul(self, scorer: BikeRelevanceScorer):
+        """Test that NULs in listing text score the same in a batch as alone."""
+        listings = [
+            Listing(url="https://example.com/1", source="ebay", title="allant+\x007s", description=None),
+            Listing(url="https://example.com/2", source="ebay", title="allant 7", description="\x00s size l"),
+            Listing(url="https://example.com/3", source="ebay", title="size l\x00", description="\x00large"),
+        ]
+
+        batch = scorer.score_many(listings)
+
+        assert [(r.url, r.score, r.matched_factors) for r in batch] == [
+            (r.url, r.score, r.matched_factors) for r in map(scorer.score, listings)
+        ]
+
+    def test_outcome_computed_once_per_category_combination(self, scorer: BikeRelevanceScorer):
+        """Test that listings matching the same categories share one computed outcome."""
+        first = scorer.score(Listing(url="https://example.com/1", source="ebay", title="Allant+ 7S, 625Wh"))
+        second = scorer.score(Listing(url="https://example.com/2", source="ebay", title="allant+7s 625 wh bike"))
+        first.matched_factors.append("edited")
+
+        assert len(scorer._outcomes) == 1
+        assert second.score == first.score
+        assert "edited" not in second.matched_factors
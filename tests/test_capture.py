@@ -1,15 +1,31 @@
 """Tests for screenshot capture."""
 
+import asyncio
+import errno
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from src.capture import ScreenshotCapture
+from src.capture import SETTLE_TIMEOUT_MS, ScreenshotCapture
 from src.models import ScoredListing
 
 
+def _scored(url: str) -> ScoredListing:
+    """Build a high-confidence scored listing for a URL."""
+    return ScoredListing(
+        url=url,
+        source="ebay",
+        title="Gold Amethyst Ring",
+        price="$50",
+        score=80,
+        confidence="high",
+        matched_factors=["gold", "amethyst"],
+    )
+
+
 class TestScreenshotCapture:
     """Tests for ScreenshotCapture class."""
 
@@ -27,6 +43,19 @@ class TestScreenshotCapture:
         assert "screenshots" in str(date_folder)
         assert datetime.now().strftime("%Y-%m-%d") in str(date_folder)
 
+    def test_date_folder_created_once_per_date(self, tmp_path: Path) -> None:
+        """Test that the folder is reused within a date and a new one made when it rolls over."""
+        capture = ScreenshotCapture(tmp_path)
+        first = capture._get_date_folder(datetime(2024, 5, 1, 23, 59))
+
+        with patch.object(Path, "mkdir") as mkdir:
+            assert capture._get_date_folder(datetime(2024, 5, 1, 0, 1)) == first
+        mkdir.assert_not_called()
+
+        rolled = capture._get_date_folder(datetime(2024, 5, 2, 0, 0))
+        assert rolled.name == "2024-05-02"
+        assert rolled.exists()
+
     def test_generate_filename_format(self, tmp_path: Path) -> None:
         """Test filename generation format."""
         capture = ScreenshotCapture(tmp_path)
@@ -45,6 +74,11 @@ class TestScreenshotCapture:
         assert filename.startswith("high_ebay_")
         assert filename.endswith(".png")
 
+        now = datetime(2024, 5, 1, 12, 0, 0)
+        assert capture._generate_filename(listing, now) != capture._generate_filename(
+            listing, now.replace(microsecond=1)
+        )
+
     def test_generate_filename_cleans_source(self, tmp_path: Path) -> None:
         """Test that special characters in source are cleaned."""
         capture = ScreenshotCapture(tmp_path)
@@ -85,8 +119,8 @@ class TestScreenshotCapture:
 
         # Verify page interactions
         mock_page.goto.assert_called_once()
-        mock_page.wait_for_load_state.assert_called_once()
-        mock_page.set_viewport_size.assert_called_once_with({"width": 1920, "height": 1080})
+        mock_page.wait_for_load_state.assert_called_once_with("networkidle", timeout=SETTLE_TIMEOUT_MS)
+        mock_page.set_viewport_size.assert_not_called()
         mock_page.screenshot.assert_called_once()
 
         # Verify result path
@@ -95,6 +129,60 @@ class TestScreenshotCapture:
         assert "high_shopgoodwill" in str(result)
         assert result.suffix == ".png"
 
+    @pytest.mark.asyncio
+    async def test_capture_still_loading_page(self, tmp_path: Path) -> None:
+        """Test that a page that never goes network-idle is captured anyway."""
+        capture = ScreenshotCapture(tmp_path)
+
+        mock_page = AsyncMock()
+        mock_page.wait_for_load_state = AsyncMock(side_effect=PlaywrightTimeoutError("Timeout 5000ms exceeded"))
+
+        result = await capture.capture(mock_page, _scored("https://example.com/item/slow"))
+
+        assert result is not None
+        mock_page.screenshot.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_capture_batch_reuses_bounded_tabs_and_keeps_order(self, tmp_path: Path) -> None:
+        """Test that batch capture reuses at most max_concurrency tabs and keeps input order."""
+        capture = ScreenshotCapture(tmp_path)
+        open_tabs = 0
+        peak = 0
+
+        async def goto(url: str, **kwargs: object) -> None:
+            nonlocal open_tabs, peak
+            open_tabs += 1
+            peak = max(peak, open_tabs)
+            await asyncio.sleep(0.01)
+            open_tabs -= 1
+            if url.endswith("/2"):
+                raise RuntimeError("Network error")
+
+        tabs = [AsyncMock(goto=AsyncMock(side_effect=goto)) for _ in range(2)]
+        context = AsyncMock()
+        context.new_page = AsyncMock(side_effect=tabs)
+        listings = [_scored(f"https://example.com/item/{i}") for i in range(5)]
+
+        results = await capture.capture_batch(context, listings, max_concurrency=2)
+
+        assert peak == 2
+        assert context.new_page.await_count == 2
+        assert sum(tab.goto.await_count for tab in tabs) == 5
+        assert [result is None for result in results] == [False, False, True, False, False]
+        assert all(tab.close.await_count == 1 for tab in tabs)
+
+    @pytest.mark.asyncio
+    async def test_capture_batch_survives_failed_tab(self, tmp_path: Path) -> None:
+        """Test that listings are still captured by the remaining tabs when one cannot open."""
+        capture = ScreenshotCapture(tmp_path)
+        context = AsyncMock()
+        context.new_page = AsyncMock(side_effect=[RuntimeError("Target closed"), AsyncMock()])
+        listings = [_scored(f"https://example.com/item/{i}") for i in range(3)]
+
+        results = await capture.capture_batch(context, listings, max_concurrency=2)
+
+        assert all(result is not None for result in results)
+
     @pytest.mark.asyncio
     async def test_capture_handles_error(self, tmp_path: Path) -> None:
         """Test that capture returns None on error."""
@@ -159,6 +247,23 @@ class TestScreenshotCapture:
         assert "high_confidence" in str(result)
         assert result.name == test_screenshot.name
 
+    def test_copy_to_high_confidence_links_or_copies(self, tmp_path: Path) -> None:
+        """Test that the copy is a hard link, with a byte copy when linking fails."""
+        capture = ScreenshotCapture(tmp_path)
+        test_screenshot = tmp_path / "high_ebay_120000.png"
+        test_screenshot.write_bytes(b"fake image data")
+
+        linked = capture.copy_to_high_confidence(test_screenshot)
+        assert linked is not None
+        assert linked.samefile(test_screenshot)
+
+        linked.unlink()
+        with patch("src.capture.os.link", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            copied = capture.copy_to_high_confidence(test_screenshot)
+        assert copied is not None
+        assert not copied.samefile(test_screenshot)
+        assert copied.read_bytes() == b"fake image data"
+
     def test_copy_to_high_confidence_handles_error(self, tmp_path: Path) -> None:
         """Test that copy returns None on error."""
         capture = ScreenshotCapture(tmp_path)
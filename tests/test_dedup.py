@@ -1,6 +1,9 @@
 """Tests for URL deduplication manager."""
 
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from src.dedup import DedupManager
 
@@ -52,6 +55,39 @@ class TestDedupManager:
         dedup.mark_checked("https://example.com/item/")
         assert not dedup.is_new("https://example.com/item")
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("HTTPS://www.ebay.com/itm/1/?hash=x#y", "https://www.ebay.com/itm/1"),
+            ("https://example.com", "https://example.com"),
+            ("https://example.com/?q=1", "https://example.com/"),
+            ("https://example.com/item;jsessionid=abc", "https://example.com/item"),
+            ("http://[::1]:8080/item/", "http://[::1]:8080/item"),
+        ],
+    )
+    def test_normalization_edge_cases(self, tmp_path: Path, url: str, expected: str) -> None:
+        """Test that the fast path and urlparse fallback agree with urlparse semantics."""
+        dedup = DedupManager(tmp_path / "checked_links.txt")
+
+        assert dedup._normalize_url(url) == expected
+
+    def test_normalization_rejects_hosts_like_urlparse(self, tmp_path: Path) -> None:
+        """Test that hosts urlparse rejects are rejected, while other non-ASCII hosts normalize."""
+        dedup = DedupManager(tmp_path / "checked_links.txt")
+
+        with pytest.raises(ValueError):
+            dedup._normalize_url("https://ex\u2100ample.com/item")
+        assert dedup._normalize_url("https://ex\u00e4mple.com/item/") == "https://ex\u00e4mple.com/item"
+
+    def test_canonical_url_skips_normalization(self, tmp_path: Path) -> None:
+        """Test that a cached URL already in canonical form is found without normalizing."""
+        dedup = DedupManager(tmp_path / "checked_links.txt")
+        dedup.mark_checked("https://example.com/item/1?ref=search")
+
+        with patch("src.dedup._normalize_url") as normalize:
+            assert not dedup.is_new("https://example.com/item/1")
+        normalize.assert_not_called()
+
     def test_persistence_across_instances(self, tmp_path: Path) -> None:
         """Test that state persists when creating new instance."""
         log_path = tmp_path / "checked_links.txt"
@@ -59,11 +95,33 @@ class TestDedupManager:
         # First instance marks URL
         dedup1 = DedupManager(log_path)
         dedup1.mark_checked("https://example.com/persisted")
+        dedup1.close()
 
         # Second instance should see it
         dedup2 = DedupManager(log_path)
         assert not dedup2.is_new("https://example.com/persisted")
 
+    def test_load_strips_lines_and_skips_blanks(self, tmp_path: Path) -> None:
+        """Test that CRLF endings, padding and blank lines in the log are tolerated."""
+        log_path = tmp_path / "checked_links.txt"
+        log_path.write_bytes(b"https://example.com/1\r\n\n  https://example.com/2 \nhttps://example.com/3")
+
+        dedup = DedupManager(log_path)
+
+        assert dedup.count() == 3
+        assert not dedup.is_new("https://example.com/2")
+
+    def test_cache_keeps_hashes_not_urls(self, tmp_path: Path) -> None:
+        """Test that loaded and marked URLs are held as hashes while the log keeps full URLs."""
+        log_path = tmp_path / "checked_links.txt"
+        log_path.write_text("https://example.com/1\n")
+
+        with DedupManager(log_path) as dedup:
+            dedup.mark_checked("https://example.com/2?ref=x")
+            assert dedup._cache == {hash("https://example.com/1"), hash("https://example.com/2")}
+
+        assert log_path.read_text().splitlines() == ["https://example.com/1", "https://example.com/2"]
+
     def test_count_returns_correct_number(self, tmp_path: Path) -> None:
         """Test that count returns correct number of checked URLs."""
         log_path = tmp_path / "checked_links.txt"
@@ -116,3 +174,33 @@ class TestDedupManager:
 
         dedup.mark_checked("https://ebay.com/item/123")
         assert dedup.is_new("https://etsy.com/item/123")
+
+    def test_writes_are_buffered_until_batch_or_flush(self, tmp_path: Path) -> None:
+        """Test that new URLs reach the file every _WRITE_BATCH writes or on flush."""
+        log_path = tmp_path / "checked_links.txt"
+
+        with DedupManager(log_path) as dedup:
+            for i in range(DedupManager._WRITE_BATCH):
+                dedup.mark_checked(f"https://example.com/item/{i}")
+            dedup.mark_checked("https://example.com/item/last")
+
+            lines = log_path.read_text().splitlines()
+            assert len(lines) == DedupManager._WRITE_BATCH
+            assert "https://example.com/item/last" not in lines
+
+            dedup.flush()
+            assert log_path.read_text().splitlines()[-1] == "https://example.com/item/last"
+
+        assert DedupManager(log_path).count() == DedupManager._WRITE_BATCH + 1
+
+    def test_clear_then_mark_reopens_log(self, tmp_path: Path) -> None:
+        """Test that marking after clear starts a fresh log file."""
+        log_path = tmp_path / "checked_links.txt"
+        dedup = DedupManager(log_path)
+
+        dedup.mark_checked("https://example.com/old")
+        dedup.clear()
+        dedup.mark_checked("https://example.com/new")
+        dedup.close()
+
+        assert log_path.read_text() == "https://example.com/new\n"
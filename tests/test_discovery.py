@@ -1,5 +1,6 @@
 """Tests for search discovery module."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -183,6 +184,45 @@ class TestMarketplaceFilter:
         assert "site:etsy.com" in filters
 
 
+class TestSearchDiscovery:
+    """Tests for SearchDiscovery.discover."""
+
+    @pytest.mark.asyncio
+    async def test_query_filter_pairs_run_concurrently_within_rate(self) -> None:
+        """Test that pairs run in bounded parallel tabs while requests stay rate limited."""
+        loop = asyncio.get_running_loop()
+        running = 0
+        peak = 0
+        request_times: list[float] = []
+
+        class SlowProvider(SearchDiscovery):
+            NAME = "slow"
+
+            async def search(self, page, query, site_filter=None):
+                nonlocal running, peak
+                await self._rate_limit()
+                request_times.append(loop.time())
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.05)
+                running -= 1
+                yield DiscoveryResult(url=f"https://ebay.com/{query}/{site_filter}", title="Ring")
+
+        mock_page = AsyncMock()
+        tabs = [AsyncMock() for _ in range(4)]
+        mock_page.context.new_page = AsyncMock(side_effect=tabs)
+        provider = SlowProvider(rate_limit_delay=0.01, max_concurrency=3)
+
+        results = [r async for r in provider.discover(mock_page, ["a", "b"], ["site:x.com", "site:y.com"])]
+
+        assert len(results) == 4
+        assert {result.source for result in results} == {"slow"}
+        assert peak == 3
+        assert all(tab.close.await_count == 1 for tab in tabs)
+        gaps = [later - earlier for earlier, later in zip(request_times, request_times[1:])]
+        assert min(gaps) >= 0.008
+
+
 class TestAggregatedDiscovery:
     """Tests for AggregatedDiscovery class."""
 
@@ -246,3 +286,58 @@ class TestAggregatedDiscovery:
 
         # Should deduplicate to single result
         assert len(results) == 1
+
+    @pytest.mark.asyncio
+    async def test_providers_run_concurrently_in_own_tabs(self) -> None:
+        """Test that providers run side by side, each search in a tab of its own and no tab left idle."""
+        running = 0
+        peak = 0
+        searched_on = []
+
+        class SlowProvider(SearchDiscovery):
+            NAME = "slow"
+
+            async def search(self, page, query, site_filter=None):
+                nonlocal running, peak
+                searched_on.append(page)
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.02)
+                running -= 1
+                yield DiscoveryResult(url=f"https://ebay.com/{id(self)}/{query}", title="Ring")
+
+        mock_page = AsyncMock()
+        tabs = [AsyncMock() for _ in range(4)]
+        mock_page.context.new_page = AsyncMock(side_effect=tabs)
+        aggregator = AggregatedDiscovery([SlowProvider(), SlowProvider()])
+
+        results = [result async for result in aggregator.discover_all(mock_page, ["ring", "band"])]
+
+        assert len(results) == 4
+        assert peak == 4
+        # One tab per search; the shared page itself is never navigated
+        assert sorted(map(id, searched_on)) == sorted(map(id, tabs))
+        assert all(tab.close.await_count == 1 for tab in tabs)
+
+    @pytest.mark.asyncio
+    async def test_single_search_providers_do_not_share_page(self) -> None:
+        """Test that providers with one search each still search in separate tabs."""
+        searched_on = []
+
+        class OneShotProvider(SearchDiscovery):
+            NAME = "oneshot"
+
+            async def search(self, page, query, site_filter=None):
+                searched_on.append(page)
+                yield DiscoveryResult(url=f"https://ebay.com/{id(self)}", title="Ring")
+
+        mock_page = AsyncMock()
+        tabs = [AsyncMock(), AsyncMock()]
+        mock_page.context.new_page = AsyncMock(side_effect=tabs)
+        aggregator = AggregatedDiscovery([OneShotProvider(), OneShotProvider()])
+
+        results = [result async for result in aggregator.discover_all(mock_page, ["ring"])]
+
+        assert len(results) == 2
+        assert mock_page not in searched_on
+        assert mock_page.context.new_page.await_count == 2
@@ -0,0 +1,83 @@
+"""Tests for merging concurrent async jobs."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import pytest
+
+from src.merge import merge_jobs
+
+
+def job_of(*items: str) -> Callable[[], AsyncIterator[str]]:
+    """Build a job yielding ``items``."""
+
+    async def run() -> AsyncIterator[str]:
+        for item in items:
+            await asyncio.sleep(0)
+            yield item
+
+    return run
+
+
+class TestMergeJobs:
+    """Tests for merge_jobs."""
+
+    @pytest.mark.asyncio
+    async def test_items_from_every_job_yielded_once_by_key(self) -> None:
+        """Test that jobs' items are merged and repeated keys skipped."""
+        jobs = [job_of("a", "b"), job_of("b", "c")]
+
+        items = [item async for item in merge_jobs(jobs, 2, key=str.lower)]
+
+        assert sorted(items) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self) -> None:
+        """Test that no more than max_concurrency jobs run at once."""
+        running = 0
+        peak = 0
+
+        async def job() -> AsyncIterator[str]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            yield "done"
+
+        items = [item async for item in merge_jobs([job] * 5, 2)]
+
+        assert items == ["done"] * 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("others", [0, 1])
+    async def test_failing_job_is_logged_not_raised(self, others: int) -> None:
+        """Test that an error ends only its own job, whether it runs alone or beside others."""
+
+        async def bad() -> AsyncIterator[str]:
+            yield "before"
+            raise RuntimeError("boom")
+
+        items = [item async for item in merge_jobs([bad] + [job_of("good")] * others, 2)]
+
+        assert sorted(items) == ["before"] + ["good"] * others
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_running_jobs(self) -> None:
+        """Test that jobs still running are cancelled when the consumer stops."""
+        cancelled = asyncio.Event()
+
+        async def slow() -> AsyncIterator[str]:
+            try:
+                await asyncio.sleep(10)
+                yield "late"
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        merged = merge_jobs([job_of("first"), slow], 2)
+        assert await anext(merged) == "first"
+        await merged.aclose()  # type: ignore[attr-defined]
+
+        assert cancelled.is_set()
@@ -3,12 +3,13 @@
 Tests the batch JavaScript extraction and retry logic.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
-from src.adapters.poshmark import MAX_RETRIES, PoshmarkAdapter
+from src.adapters.base import DETAILS_SCRIPT
+from src.adapters.poshmark import MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY, PoshmarkAdapter
 
 
 class TestPoshmarkAdapter:
@@ -47,13 +48,13 @@ class TestPoshmarkAdapter:
         mock_page.evaluate = AsyncMock(
             return_value=[
                 {
-                    "href": "/listing/test-ring-123",
+                    "url": "https://poshmark.com/listing/test-ring-123",
                     "title": "Vintage Amethyst Ring",
                     "price": "$45.00",
                     "imageUrl": "https://poshmark.com/img.jpg",
                 },
                 {
-                    "href": "https://poshmark.com/listing/gold-ring-456",
+                    "url": "https://poshmark.com/listing/gold-ring-456",
                     "title": "Gold Pearl Ring",
                     "price": "$75.00",
                     "imageUrl": None,
@@ -61,13 +62,16 @@ class TestPoshmarkAdapter:
             ]
         )
 
-        listings = []
-        async for listing in adapter._extract_listings(mock_page):
-            listings.append(listing)
+        listings = await adapter._extract_listings(mock_page)
 
         # Verify page.evaluate was called (batch extraction)
         mock_page.evaluate.assert_called_once()
 
+        # Link filtering and URL resolution happen in the browser
+        script = mock_page.evaluate.call_args.args[0]
+        assert "includes('/listing/')" in script
+        assert "linkElement.href" in script
+
         # Verify results
         assert len(listings) == 2
         assert listings[0].source == "poshmark"
@@ -91,8 +95,7 @@ class TestPoshmarkAdapter:
         mock_page.wait_for_selector = AsyncMock()
         mock_page.evaluate = AsyncMock(return_value=[])
 
-        async for _ in adapter._extract_listings(mock_page):
-            pass
+        assert await adapter._extract_listings(mock_page) == []
 
         # Should NOT call query_selector_all for listing elements
         mock_page.query_selector_all.assert_not_called()
@@ -119,7 +122,7 @@ class TestPoshmarkAdapter:
         adapter = PoshmarkAdapter(min_delay=0.01, max_delay=0.02)
 
         mock_page = AsyncMock()
-        mock_page.goto = AsyncMock()
+        mock_page.goto = AsyncMock(return_value=MagicMock(status=200))
         mock_page.wait_for_timeout = AsyncMock()
 
         # Mock the batch JavaScript extraction
@@ -140,8 +143,28 @@ class TestPoshmarkAdapter:
         assert result.description == "Beautiful antique ring with amethyst stone."
         assert result.source == "poshmark"
 
-        # Verify page.evaluate was called
+        # Verify page.evaluate was called once the title rendered, without a fixed sleep
         mock_page.evaluate.assert_called_once()
+        mock_page.wait_for_selector.assert_called_once_with(
+            adapter.SELECTORS["detail_title"], state="attached", timeout=10000
+        )
+        mock_page.wait_for_timeout.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extraction_scripts_built_once(self) -> None:
+        """Test that repeated detail fetches reuse one module-level script string."""
+        adapter = PoshmarkAdapter(min_delay=0, max_delay=0)
+        mock_page = AsyncMock()
+        mock_page.goto.return_value = MagicMock(status=200)
+        mock_page.evaluate = AsyncMock(return_value={"title": "Ring"})
+
+        await adapter.get_listing_details(mock_page, "https://poshmark.com/listing/1")
+        await adapter.get_listing_details(mock_page, "https://poshmark.com/listing/2")
+
+        first, second = (call.args[0] for call in mock_page.evaluate.call_args_list)
+        assert first is second
+        assert "detail_price" in DETAILS_SCRIPT
+        assert '"detail_price"' in first
 
 
 class TestPoshmarkRetryLogic:
@@ -198,9 +221,10 @@ class TestPoshmarkRetryLogic:
         assert mock_page.goto.call_count == MAX_RETRIES
 
     @pytest.mark.asyncio
-    async def test_exponential_backoff_delays(self) -> None:
-        """Test that retry delays follow exponential backoff."""
-        adapter = PoshmarkAdapter(min_delay=0.01, max_delay=0.02)
+    async def test_backoff_delays_use_decorrelated_jitter(self) -> None:
+        """Test that each retry delay is drawn between the base and three times the previous delay."""
+        # No host rate limit, so every sleep recorded is a retry backoff
+        adapter = PoshmarkAdapter(min_delay=0, max_delay=0)
 
         mock_page = AsyncMock()
 
@@ -217,10 +241,28 @@ class TestPoshmarkRetryLogic:
         # Should have MAX_RETRIES - 1 delays (no delay after final attempt)
         assert len(sleep_delays) == MAX_RETRIES - 1
 
-        # Delays should follow exponential backoff: 1, 2, 4, ...
-        for i, delay in enumerate(sleep_delays):
-            expected = 1.0 * (2**i)  # RETRY_BASE_DELAY * 2^attempt
-            assert delay == expected
+        # Decorrelated jitter: each delay lies in [base, min(cap, 3 * previous)]
+        previous = RETRY_BASE_DELAY
+        for delay in sleep_delays:
+            assert RETRY_BASE_DELAY <= delay <= min(RETRY_MAX_DELAY, previous * 3)
+            previous = delay
+
+    @pytest.mark.asyncio
+    async def test_throttled_response_is_retried(self) -> None:
+        """Test that a 429 response is retried instead of waiting for a title that never renders."""
+        adapter = PoshmarkAdapter(min_delay=0, max_delay=0)
+
+        mock_page = AsyncMock()
+        mock_page.goto = AsyncMock(side_effect=[MagicMock(status=429, headers={}), MagicMock(status=200, headers={})])
+        mock_page.evaluate = AsyncMock(return_value={"title": "Success"})
+
+        with patch("src.adapters.poshmark.asyncio.sleep", new_callable=AsyncMock):
+            result = await adapter.get_listing_details(mock_page, "https://poshmark.com/listing/12345")
+
+        assert result is not None
+        assert result.title == "Success"
+        assert mock_page.goto.call_count == 2
+        mock_page.wait_for_selector.assert_called_once()
 
 
 class TestPoshmarkSearchFlow:
@@ -232,7 +274,7 @@ class TestPoshmarkSearchFlow:
         adapter = PoshmarkAdapter(min_delay=0.01, max_delay=0.02)
 
         mock_page = AsyncMock()
-        mock_page.goto = AsyncMock()
+        mock_page.goto = AsyncMock(return_value=MagicMock(status=200))
         mock_page.wait_for_timeout = AsyncMock()
         mock_page.wait_for_selector = AsyncMock()
 
@@ -243,7 +285,7 @@ class TestPoshmarkSearchFlow:
         mock_page.evaluate = AsyncMock(
             return_value=[
                 {
-                    "href": "/listing/ring-123",
+                    "url": "https://poshmark.com/listing/ring-123",
                     "title": "Amethyst Ring",
                     "price": "$35.00",
                     "imageUrl": "https://poshmark.com/img.jpg",
@@ -260,3 +302,50 @@ class TestPoshmarkSearchFlow:
         assert "ring-123" in listings[0].url
         assert listings[0].title == "Amethyst Ring"
         assert listings[0].price == "$35.00"
+        mock_page.wait_for_timeout.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_api_results_skip_rendering(self) -> None:
+        """Test that JSON search results are used without loading the search page."""
+        adapter = PoshmarkAdapter(min_delay=0, max_delay=0, use_api=True)
+
+        response = MagicMock(status=200, ok=True, headers={})
+        response.json = AsyncMock(
+            return_value={
+                "data": [
+                    {
+                        "id": "64abc",
+                        "title": "Amethyst Ring",
+                        "price_amount": {"val": "35", "currency_code": "USD"},
+                        "cover_shot": {"url": "https://cdn.poshmark.com/img.jpg"},
+                    },
+                    {"title": "No id"},
+                ]
+            }
+        )
+        mock_page = AsyncMock()
+        mock_page.context.request.get = AsyncMock(return_value=response)
+
+        listings = [listing async for listing in adapter.search(mock_page, ["amethyst ring"])]
+
+        assert [listing.url for listing in listings] == ["https://poshmark.com/listing/64abc"]
+        assert listings[0].price == "$35"
+        assert listings[0].image_url == "https://cdn.poshmark.com/img.jpg"
+        assert "amethyst%20ring" in mock_page.context.request.get.call_args.args[0]
+        mock_page.goto.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_api_failure_falls_back_to_page(self) -> None:
+        """Test that a failed JSON request falls back to rendering the search page."""
+        adapter = PoshmarkAdapter(min_delay=0, max_delay=0, use_api=True)
+
+        mock_page = AsyncMock()
+        mock_page.context.request.get = AsyncMock(return_value=MagicMock(status=403, ok=False, headers={}))
+        mock_page.goto = AsyncMock(return_value=MagicMock(status=200))
+        mock_page.query_selector = AsyncMock(return_value=None)
+        mock_page.evaluate = AsyncMock(return_value=[{"url": "https://poshmark.com/listing/ring-123", "title": "Ring"}])
+
+        listings = [listing async for listing in adapter.search(mock_page, ["amethyst ring"])]
+
+        assert [listing.url for listing in listings] == ["https://poshmark.com/listing/ring-123"]
+        mock_page.goto.assert_called_once()
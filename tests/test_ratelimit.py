@@ -0,0 +1,172 @@
+"""Tests for token-bucket rate limiting."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.adapters.base import AdapterLimits, _parse_retry_after
+from src.adapters.craigslist import CraigslistAdapter
+from src.adapters.ebay import EbayAdapter
+from src.adapters.etsy import EtsyAdapter
+from src.adapters.shopgoodwill import ShopGoodwillAdapter
+from src.ratelimit import TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_first_acquire_is_immediate(self) -> None:
+        """Test that a full bucket grants the first token without waiting."""
+        bucket = TokenBucket(max_rate=1, time_period=10)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await bucket.acquire()
+
+        assert loop.time() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_share_budget(self) -> None:
+        """Test that concurrent acquirers are spaced by the refill rate."""
+        bucket = TokenBucket(max_rate=1, time_period=0.05)
+        loop = asyncio.get_running_loop()
+        times: list[float] = []
+
+        async def worker() -> None:
+            async with bucket:
+                times.append(loop.time())
+
+        await asyncio.gather(*(worker() for _ in range(3)))
+
+        assert len(times) == 3
+        assert times[2] - times[0] >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_burst_allows_back_to_back_acquires(self) -> None:
+        """Test that burst capacity is spent at once, then the refill rate applies."""
+        bucket = TokenBucket(max_rate=1, time_period=0.05, burst=2)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await bucket.acquire()
+        await bucket.acquire()
+        assert loop.time() - start < 0.03
+
+        await bucket.acquire()
+        assert loop.time() - start >= 0.045
+
+    @pytest.mark.asyncio
+    async def test_zero_period_disables_limiting(self) -> None:
+        """Test that a zero time period never waits."""
+        bucket = TokenBucket(max_rate=1, time_period=0)
+
+        for _ in range(100):
+            await bucket.acquire()
+
+
+class TestAdapterLimiters:
+    """Tests for adapter rate limit buckets."""
+
+    def test_craigslist_region_buckets_are_separate(self) -> None:
+        """Test that each Craigslist region gets its own bucket."""
+        adapter = CraigslistAdapter(regions=["indianapolis", "chicago"], min_delay=1.0, max_delay=3.0)
+
+        indy = adapter._get_limiter("indianapolis")
+
+        assert adapter._get_limiter("indianapolis") is indy
+        assert adapter._get_limiter("chicago") is not indy
+        assert indy.time_period == 1.0
+
+    def test_instances_share_host_buckets(self) -> None:
+        """Test that adapter instances sharing limits draw from one bucket per host."""
+        limits = AdapterLimits()
+        first = CraigslistAdapter(regions=["indianapolis"], min_delay=1.0, max_delay=3.0, limits=limits)
+        second = CraigslistAdapter(regions=["indianapolis"], min_delay=1.0, max_delay=3.0, limits=limits)
+        separate = CraigslistAdapter(regions=["indianapolis"], min_delay=1.0, max_delay=3.0)
+
+        assert second._get_limiter("indianapolis") is first._get_limiter("indianapolis")
+        assert separate._get_limiter("indianapolis") is not first._get_limiter("indianapolis")
+        assert EbayAdapter(limits=limits)._get_limiter() is not EtsyAdapter(limits=limits)._get_limiter()
+
+    def test_limits_reset_for_a_new_event_loop(self) -> None:
+        """Test that reset limits work in a new event loop after being contended in another."""
+        limits = AdapterLimits(max_open_pages=1)
+        limits.limiters[("ebay", "")] = TokenBucket()
+
+        async def contend() -> None:
+            async with limits.page_slots:
+                waiter = asyncio.create_task(limits.page_slots.acquire())
+                await asyncio.sleep(0)
+            await waiter
+            limits.page_slots.release()
+
+        asyncio.run(contend())
+        limits.reset()
+        asyncio.run(contend())
+
+        assert limits.limiters == {}
+
+    def test_adapter_burst_sets_bucket_capacity(self) -> None:
+        """Test that RATE_LIMIT_BURST sizes the host bucket without raising its rate."""
+        shopgoodwill = ShopGoodwillAdapter(min_delay=2.0)._get_limiter()
+        ebay = EbayAdapter(min_delay=2.0)._get_limiter()
+
+        assert (shopgoodwill.burst, ebay.burst) == (2, 1)
+        assert shopgoodwill.rate_per_sec == ebay.rate_per_sec == 0.5
+
+    def test_throttled_response_backs_off(self) -> None:
+        """Test that 429 responses double the delay up to twice max_delay."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=1.0, max_delay=3.0)
+        limiter = adapter._get_limiter("indianapolis")
+
+        adapter._record_response(MagicMock(status=429, headers={}), "indianapolis")
+        assert 2.0 <= limiter.time_period <= 2.2
+
+        for _ in range(5):
+            adapter._record_response(MagicMock(status=503, headers={}), "indianapolis")
+        assert 6.0 <= limiter.time_period <= 6.6
+
+    def test_success_resets_delay(self) -> None:
+        """Test that a successful response restores min_delay."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=1.0, max_delay=3.0)
+        limiter = adapter._get_limiter("indianapolis")
+
+        adapter._record_response(MagicMock(status=429, headers={}), "indianapolis")
+        adapter._record_response(MagicMock(status=200, headers={}), "indianapolis")
+
+        assert limiter.time_period == 1.0
+
+    def test_other_errors_leave_delay(self) -> None:
+        """Test that non-throttling errors do not change the delay."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=1.0, max_delay=3.0)
+        limiter = adapter._get_limiter("indianapolis")
+
+        adapter._record_response(MagicMock(status=404, headers={}), "indianapolis")
+
+        assert limiter.time_period == 1.0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_bucket(self) -> None:
+        """Test that a Retry-After header delays the next acquisition."""
+        adapter = CraigslistAdapter(regions=["indianapolis"], min_delay=0.01, max_delay=0.02)
+        limiter = adapter._get_limiter("indianapolis")
+        loop = asyncio.get_running_loop()
+
+        adapter._record_response(MagicMock(status=429, headers={"retry-after": "0.1"}), "indianapolis")
+        start = loop.time()
+        await limiter.acquire()
+
+        assert loop.time() - start >= 0.09
+
+
+class TestRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_seconds_and_dates(self) -> None:
+        """Test delta-seconds, HTTP dates and junk values."""
+        assert _parse_retry_after("120") == 120.0
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert _parse_retry_after("soon") is None
+        assert _parse_retry_after(None) is None
@@ -1,10 +1,17 @@
 """Tests for search orchestrator."""
 
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.capture import VIEWPORT
+from src.dedup import DedupManager
+from src.discovery.base import DiscoveryResult
+from src.extractors.bridge import LegacyAdapterBridge
+from src.models import Listing
 from src.ring_search import SearchOrchestrator
 
 
@@ -111,6 +118,84 @@ output:
         assert adapter.NAME == "craigslist"
         assert adapter.regions == ["indianapolis", "chicago"]
 
+    def test_create_adapter_concurrency_override(self, config_file: Path) -> None:
+        """Test that a marketplace entry can override the parallel tab limit."""
+        orchestrator = SearchOrchestrator(config_file)
+
+        default = orchestrator._create_adapter({"name": "ebay", "searches": ["test"]})
+        override = orchestrator._create_adapter({"name": "shopgoodwill", "max_concurrent_pages": 2, "searches": ["x"]})
+
+        assert default is not None and default.max_concurrency == orchestrator.max_concurrency
+        assert override is not None and override.max_concurrency == 2
+
+    def test_create_adapter_passes_adapter_options(self, config_file: Path) -> None:
+        """Test that options an adapter declares are passed through and others are ignored."""
+        orchestrator = SearchOrchestrator(config_file)
+
+        posh = orchestrator._create_adapter({"name": "poshmark", "use_api": True, "searches": ["x"]})
+        craigslist = orchestrator._create_adapter({"name": "craigslist", "use_http": False, "searches": ["x"]})
+        ebay = orchestrator._create_adapter({"name": "ebay", "use_api": True, "searches": ["x"]})
+
+        assert posh is not None and posh.use_api is True
+        assert craigslist is not None and craigslist.use_http is False
+        assert craigslist.regions == craigslist.DEFAULT_REGIONS
+        assert ebay is not None and not hasattr(ebay, "use_api")
+
+    def test_adapters_share_the_runs_limits(self, config_file: Path) -> None:
+        """Test that every adapter of an orchestrator shares its page slots and request budgets."""
+        orchestrator = SearchOrchestrator(config_file)
+        other = SearchOrchestrator(config_file)
+
+        ebay = orchestrator._create_adapter({"name": "ebay", "searches": ["x"]})
+        etsy = orchestrator._create_adapter({"name": "etsy", "searches": ["x"]})
+        elsewhere = other._create_adapter({"name": "ebay", "searches": ["x"]})
+
+        assert ebay is not None and etsy is not None and elsewhere is not None
+        assert ebay.limits is orchestrator.limits and etsy.limits is orchestrator.limits
+        assert elsewhere.limits is not orchestrator.limits
+
+    def test_bridge_adapters_match_the_runs(self, config_file: Path) -> None:
+        """Test that the extractor bridge builds adapters with the run's limits and rate settings."""
+        orchestrator = SearchOrchestrator(config_file, adaptive=True)
+        assert orchestrator.extractor is not None
+        bridge = next(e for e in orchestrator.extractor.extractors if isinstance(e, LegacyAdapterBridge))
+
+        adapter = bridge._get_adapter("ebay")
+        own = orchestrator._create_adapter({"name": "ebay", "searches": ["x"]})
+
+        assert adapter is not None and own is not None
+        assert adapter.limits is orchestrator.limits
+        assert adapter.min_delay == orchestrator.min_delay == 0.01
+        assert adapter._get_limiter() is own._get_limiter()
+        assert bridge._get_adapter("ebay") is adapter
+
+    @pytest.mark.asyncio
+    async def test_start_resets_limits(self, config_file: Path) -> None:
+        """Test that starting a browser replaces the page slots and drops request budgets."""
+        orchestrator = SearchOrchestrator(config_file)
+        page_slots = orchestrator.limits.page_slots
+        orchestrator.limits.limiters[("ebay", "")] = MagicMock()
+
+        with patch("src.ring_search.async_playwright") as mock_pw:
+            playwright = AsyncMock()
+            mock_pw.return_value.start = AsyncMock(return_value=playwright)
+            await orchestrator.start()
+            await orchestrator.close()
+
+        assert orchestrator.limits.page_slots is not page_slots
+        assert orchestrator.limits.limiters == {}
+
+    def test_import_loads_no_adapter_modules(self) -> None:
+        """Test that importing the orchestrator leaves adapters to be loaded on first use."""
+        code = (
+            "import sys, src.ring_search; "
+            "sys.exit(any(m.startswith('src.adapters.') and m != 'src.adapters.base' for m in sys.modules))"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent)
+
+        assert result.returncode == 0
+
     def test_create_adapter_unknown(self, config_file: Path) -> None:
         """Test that unknown marketplace returns None."""
         orchestrator = SearchOrchestrator(config_file)
@@ -144,8 +229,9 @@ output:
         with patch("src.ring_search.async_playwright") as mock_pw:
             mock_browser = AsyncMock()
             mock_page = AsyncMock()
-            mock_browser.new_page = AsyncMock(return_value=mock_page)
-            mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
+            mock_browser.new_context = AsyncMock(return_value=AsyncMock(new_page=AsyncMock(return_value=mock_page)))
+            mock_pw.return_value.start = AsyncMock()
+            mock_pw.return_value.start.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
 
             await orchestrator.run_daily_search()
 
@@ -165,8 +251,9 @@ output:
             mock_browser = AsyncMock()
             mock_page = AsyncMock()
             mock_page.query_selector = AsyncMock(return_value=None)
-            mock_browser.new_page = AsyncMock(return_value=mock_page)
-            mock_pw.return_value.__aenter__.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
+            mock_browser.new_context = AsyncMock(return_value=AsyncMock(new_page=AsyncMock(return_value=mock_page)))
+            mock_pw.return_value.start = AsyncMock()
+            mock_pw.return_value.start.return_value.chromium.launch = AsyncMock(return_value=mock_browser)
 
             orchestrator._process_listing = AsyncMock()
 
@@ -174,6 +261,180 @@ output:
 
         assert "total" in result
 
+    @pytest.mark.asyncio
+    async def test_started_context_reused_across_runs(self, config_file: Path) -> None:
+        """Test that runs after start() share one browser context and get a page each."""
+        orchestrator = SearchOrchestrator(config_file)
+        orchestrator._process_listing = AsyncMock()
+
+        with patch("src.ring_search.async_playwright") as mock_pw:
+            context = AsyncMock()
+            mock_browser = AsyncMock()
+            mock_browser.new_context = AsyncMock(return_value=context)
+            playwright = AsyncMock()
+            playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+            mock_pw.return_value.start = AsyncMock(return_value=playwright)
+
+            await orchestrator.start()
+            await orchestrator.check_specific_urls([])
+            await orchestrator.check_specific_urls([])
+            context.close.assert_not_called()
+            await orchestrator.close()
+
+        playwright.chromium.launch.assert_called_once()
+        mock_browser.new_context.assert_called_once_with(service_workers="block", viewport=VIEWPORT)
+        assert context.new_page.call_count == 2
+        context.close.assert_called_once()
+        mock_browser.close.assert_called_once()
+        playwright.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_connects_over_cdp_when_configured(self, config_file: Path) -> None:
+        """Test that a configured CDP endpoint is connected to instead of launching Chromium."""
+        orchestrator = SearchOrchestrator(config_file)
+        orchestrator.cdp_url = "http://localhost:9222"
+
+        with patch("src.ring_search.async_playwright") as mock_pw:
+            mock_browser = AsyncMock()
+            playwright = AsyncMock()
+            playwright.chromium.connect_over_cdp = AsyncMock(return_value=mock_browser)
+            mock_pw.return_value.start = AsyncMock(return_value=playwright)
+
+            context = await orchestrator.start()
+            await orchestrator.close()
+
+        playwright.chromium.connect_over_cdp.assert_called_once_with("http://localhost:9222")
+        playwright.chromium.launch.assert_not_called()
+        assert context is mock_browser.new_context.return_value
+        mock_browser.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_uses_persistent_profile_when_configured(self, config_file: Path, tmp_path: Path) -> None:
+        """Test that a configured profile directory launches a persistent, disk-cached context."""
+        orchestrator = SearchOrchestrator(config_file)
+        orchestrator.user_data_dir = str(tmp_path / "profile")
+
+        with patch("src.ring_search.async_playwright") as mock_pw:
+            persistent = AsyncMock()
+            playwright = AsyncMock()
+            playwright.chromium.launch_persistent_context = AsyncMock(return_value=persistent)
+            mock_pw.return_value.start = AsyncMock(return_value=playwright)
+
+            context = await orchestrator.start()
+            assert await orchestrator.start() is context
+            await orchestrator.close()
+
+        assert context is persistent
+        call = playwright.chromium.launch_persistent_context.call_args
+        assert call.args == (str(tmp_path / "profile"),)
+        assert any(arg.startswith("--disk-cache-size=") for arg in call.kwargs["args"])
+        assert call.kwargs["service_workers"] == "block"
+        playwright.chromium.launch.assert_not_called()
+        persistent.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_search_runs_in_blocked_tab(self, config_file: Path) -> None:
+        """Test that adapters search in their own resource-blocked tab, not the capture page."""
+        orchestrator = SearchOrchestrator(config_file)
+
+        from src.models import Listing
+
+        mock_page = AsyncMock()
+        search_tab = AsyncMock()
+        mock_page.context.new_page = AsyncMock(return_value=search_tab)
+        searched_on = []
+
+        async def search(page, queries):
+            searched_on.append(page)
+            yield Listing(url="https://www.ebay.com/itm/1", source="ebay", title="Ring")
+
+        orchestrator._process_listings = AsyncMock()  # type: ignore[method-assign]
+        orchestrator.dedup = MagicMock()
+        orchestrator.dedup.is_new.return_value = True
+        with patch("src.adapters.ebay.EbayAdapter.search", side_effect=search):
+            await orchestrator._search_marketplace(mock_page, {"name": "ebay", "searches": ["ring"]})
+
+        assert searched_on == [search_tab]
+        search_tab.route.assert_called_once()
+        search_tab.close.assert_called_once()
+        context, listings = orchestrator._process_listings.call_args.args
+        assert context is mock_page.context
+        assert [listing.url for listing in listings] == ["https://www.ebay.com/itm/1"]
+
+    @pytest.mark.asyncio
+    async def test_processing_error_does_not_end_the_run(self, config_file: Path) -> None:
+        """Test that an error while processing one marketplace's listings is logged, not raised."""
+        orchestrator = SearchOrchestrator(config_file)
+
+        mock_page = AsyncMock()
+        mock_page.context.new_page = AsyncMock(return_value=AsyncMock())
+
+        async def search(page, queries):
+            yield Listing(url="https://www.ebay.com/itm/1", source="ebay", title="Ring")
+
+        orchestrator._process_listings = AsyncMock(side_effect=OSError("disk full"))  # type: ignore[method-assign]
+        orchestrator.dedup = MagicMock()
+        orchestrator.dedup.is_new.return_value = True
+        with patch("src.adapters.ebay.EbayAdapter.search", side_effect=search):
+            await orchestrator._search_marketplace(mock_page, {"name": "ebay", "searches": ["ring"]})
+
+        orchestrator._process_listings.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_search_drops_equivalent_urls_within_one_search(self, config_file: Path, tmp_path: Path) -> None:
+        """Test that two results normalizing to the same URL are processed once."""
+        orchestrator = SearchOrchestrator(config_file)
+        orchestrator.dedup = DedupManager(tmp_path / "checked_links.txt")
+
+        from src.models import Listing
+
+        mock_page = AsyncMock()
+        mock_page.context.new_page = AsyncMock(return_value=AsyncMock())
+
+        async def search(page, queries):
+            yield Listing(url="https://www.ebay.com/itm/1", source="ebay", title="Ring")
+            yield Listing(url="https://www.ebay.com/itm/1/?ref=ring", source="ebay", title="Ring")
+            yield Listing(url="https://www.ebay.com/itm/2", source="ebay", title="Band")
+
+        orchestrator._process_listings = AsyncMock()  # type: ignore[method-assign]
+        with patch("src.adapters.ebay.EbayAdapter.search", side_effect=search):
+            await orchestrator._search_marketplace(mock_page, {"name": "ebay", "searches": ["ring", "band"]})
+
+        _, listings = orchestrator._process_listings.call_args.args
+        assert [listing.url for listing in listings] == ["https://www.ebay.com/itm/1", "https://www.ebay.com/itm/2"]
+
+    @pytest.mark.asyncio
+    async def test_process_listings_captures_promising_in_batch(self, config_file: Path, tmp_path: Path) -> None:
+        """Test that only high/medium listings are captured, in one batch, and all are logged."""
+        orchestrator = SearchOrchestrator(config_file)
+        high = Listing(
+            url="https://example.com/high",
+            source="ebay",
+            title="10K Yellow Gold Amethyst Seed Pearl Victorian Swirl Ring Size 7",
+            price="$500",
+            description="Beautiful antique ring",
+        )
+        low = Listing(url="https://example.com/low", source="ebay", title="Silver necklace")
+        screenshot = tmp_path / "high.png"
+        orchestrator.capture.capture_batch = AsyncMock(return_value=[screenshot])  # type: ignore[method-assign]
+        orchestrator.capture.copy_to_high_confidence = MagicMock()  # type: ignore[method-assign]
+        orchestrator.logger.log_result = MagicMock()  # type: ignore[method-assign]
+        orchestrator.dedup = MagicMock()
+        context = MagicMock()
+
+        await orchestrator._process_listings(context, [high, low])
+
+        batch_context, batch, max_concurrency = orchestrator.capture.capture_batch.call_args.args
+        assert batch_context is context
+        assert [scored.url for scored in batch] == [high.url]
+        assert max_concurrency == orchestrator.max_concurrency
+        orchestrator.capture.copy_to_high_confidence.assert_called_once_with(screenshot)
+        logged = [
+            (call.args[0].url, call.kwargs["screenshot"]) for call in orchestrator.logger.log_result.call_args_list
+        ]
+        assert logged == [(high.url, screenshot), (low.url, None)]
+        assert orchestrator.dedup.mark_checked.call_count == 2
+
     @pytest.mark.asyncio
     async def test_process_listing_scores_and_logs(self, config_file: Path) -> None:
         """Test that process_listing scores and logs."""
@@ -246,3 +507,73 @@ output:
         expected = ["shopgoodwill", "ebay", "etsy", "craigslist"]
         for name in expected:
             assert name in orchestrator.ADAPTER_MAP
+
+    @pytest.mark.asyncio
+    async def test_discovery_skips_detail_for_high_snippet(self, config_file: Path) -> None:
+        """Test that discovery only opens detail pages when the snippet is not conclusive."""
+        orchestrator = SearchOrchestrator(config_file)
+        high = DiscoveryResult(
+            url="https://example.com/high",
+            title="10K Yellow Gold Amethyst Seed Pearl Victorian Swirl Ring Size 7",
+            snippet="Beautiful antique ring",
+        )
+        low = DiscoveryResult(url="https://example.com/low", title="Silver necklace", snippet=None)
+
+        async def discover_all(*args: object) -> object:
+            for result in (high, low):
+                yield result
+
+        orchestrator.discovery = MagicMock(discover_all=discover_all)
+        orchestrator.marketplace_filter = None
+        orchestrator.extractor = MagicMock(extract=AsyncMock(return_value=None))
+        orchestrator._process_listing = AsyncMock()  # type: ignore[method-assign]
+        mock_page = AsyncMock()
+
+        with (
+            patch.object(orchestrator.dedup, "is_new", return_value=True),
+            patch.object(orchestrator.dedup, "mark_checked"),
+        ):
+            await orchestrator._run_adaptive_discovery(mock_page)
+
+        mock_page.goto.assert_awaited_once_with(low.url, wait_until="domcontentloaded")
+        orchestrator.extractor.extract.assert_awaited_once_with(mock_page, low.url)
+        processed = [call.args[1].url for call in orchestrator._process_listing.await_args_list]
+        assert processed == [high.url, low.url]
+
+    @pytest.mark.asyncio
+    async def test_discovery_asks_the_urls_adapter_about_detail(self, config_file: Path) -> None:
+        """Test that the detail decision comes from the URL's adapter and each snippet is scored once."""
+        from src.adapters.ebay import EbayAdapter
+
+        orchestrator = SearchOrchestrator(config_file)
+        title = "10K Yellow Gold Amethyst Seed Pearl Victorian Swirl Ring Size 7"
+        ebay = DiscoveryResult(url="https://www.ebay.com/itm/1", title=title, snippet="Beautiful antique ring")
+        other = DiscoveryResult(url="https://example.com/item", title=title, snippet="Beautiful antique ring")
+
+        async def discover_all(*args: object) -> object:
+            for result in (ebay, other):
+                yield result
+
+        orchestrator.discovery = MagicMock(discover_all=discover_all)
+        orchestrator.marketplace_filter = None
+        orchestrator.extractor = MagicMock(extract=AsyncMock(return_value=None))
+        orchestrator._process_listing = AsyncMock()  # type: ignore[method-assign]
+        mock_page = AsyncMock()
+
+        with (
+            patch.object(orchestrator.dedup, "is_new", return_value=True),
+            patch.object(orchestrator.dedup, "mark_checked"),
+            patch.object(EbayAdapter, "needs_detail", return_value=True) as needs_detail,
+            patch.object(orchestrator.scorer, "score", wraps=orchestrator.scorer.score) as score,
+        ):
+            await orchestrator._run_adaptive_discovery(mock_page)
+
+        # eBay's override asks for the detail page the base hook would skip
+        needs_detail.assert_called_once()
+        mock_page.goto.assert_awaited_once_with(ebay.url, wait_until="domcontentloaded")
+        # The other site's high snippet is processed with the score already computed
+        assert score.call_count == 2
+        _, listing, scored = orchestrator._process_listing.await_args_list[1].args
+        assert listing.url == other.url
+        assert scored.url == other.url
+        assert scored.confidence == "high"